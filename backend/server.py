@@ -1,27 +1,50 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, BackgroundTasks, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, FileResponse, ORJSONResponse
+from fastapi.routing import APIRoute
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Callable
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone, timedelta, date
 import jwt
 from passlib.context import CryptContext
 import io
 import csv
+import codecs
+import itertools
+import json
 import re
 import unicodedata
-from zeep import Client
+import hashlib
+import functools
+import orjson
+import base64
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+import threading
+import time
+import random
+import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from zeep import Client, AsyncClient, Transport
+from zeep.transports import AsyncTransport
+from zeep.exceptions import Fault, TransportError
+from lxml import etree
+from xml.sax.saxutils import escape as xml_escape
 from zeep.helpers import serialize_object
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import xlsxwriter
+import openpyxl
+import tempfile
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -44,6 +67,122 @@ security = HTTPBearer()
 
 # SOAP Client for just.ro
 SOAP_WSDL = "http://portalquery.just.ro/query.asmx?WSDL"
+SOAP_ENDPOINT = "http://portalquery.just.ro/query.asmx"
+# Vendored copy of the WSDL, so clients are built without downloading it
+SOAP_WSDL_LOCAL = ROOT_DIR.parent / "portal_api_specs" / "PortalWSClient" / "Web References" / "PortalWS" / "Query.wsdl"
+SOAP_WSDL_SOURCE = os.environ.get('SOAP_WSDL_SOURCE') or (
+    str(SOAP_WSDL_LOCAL) if SOAP_WSDL_LOCAL.exists() else SOAP_WSDL
+)
+SOAP_HTTP_POOL_SIZE = int(os.environ.get('SOAP_HTTP_POOL_SIZE', '10'))
+SOAP_OPERATION_TIMEOUT = int(os.environ.get('SOAP_OPERATION_TIMEOUT', '60'))
+SOAP_CLIENT_MAX_ERRORS = int(os.environ.get('SOAP_CLIENT_MAX_ERRORS', '3'))
+SOAP_CLIENT_MAX_AGE = int(os.environ.get('SOAP_CLIENT_MAX_AGE', '3600'))
+# "async" runs upstream calls on the event loop; "thread" uses the executor below
+SOAP_TRANSPORT = os.environ.get('SOAP_TRANSPORT', 'async')
+# Build envelopes and stream-parse responses with lxml instead of zeep (async transport only)
+SOAP_FAST_PATH = os.environ.get('SOAP_FAST_PATH', '0') == '1'
+SOAP_MAX_CONCURRENCY = int(os.environ.get('SOAP_MAX_CONCURRENCY', '200'))
+SOAP_CALL_TIMEOUT = float(os.environ.get('SOAP_CALL_TIMEOUT', '60'))
+# Adaptive concurrency (AIMD between min and SOAP_MAX_CONCURRENCY) and circuit breaker
+SOAP_INITIAL_CONCURRENCY = int(os.environ.get('SOAP_INITIAL_CONCURRENCY', '20'))
+SOAP_MIN_CONCURRENCY = int(os.environ.get('SOAP_MIN_CONCURRENCY', '2'))
+SOAP_LATENCY_TARGET = float(os.environ.get('SOAP_LATENCY_TARGET', '8'))
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', '5'))
+BREAKER_RESET_TIMEOUT = float(os.environ.get('BREAKER_RESET_TIMEOUT', '30'))
+DISCONNECT_POLL_INTERVAL = 0.5
+# Per-endpoint fan-out of multi-term searches (requests may lower or raise it up to the max)
+BULK_SEARCH_CONCURRENCY = int(os.environ.get('BULK_SEARCH_CONCURRENCY', '10'))
+CSV_SEARCH_CONCURRENCY = int(os.environ.get('CSV_SEARCH_CONCURRENCY', '10'))
+UNIVERSAL_SEARCH_CONCURRENCY = int(os.environ.get('UNIVERSAL_SEARCH_CONCURRENCY', '10'))
+MAX_SEARCH_CONCURRENCY = int(os.environ.get('MAX_SEARCH_CONCURRENCY', '25'))
+
+# CautareDosare result cache: per-endpoint max age in seconds (0 = always query upstream)
+SEARCH_CACHE_MAX_ENTRIES = int(os.environ.get('SEARCH_CACHE_MAX_ENTRIES', '2000'))
+SEARCH_CACHE_TTL_SEARCH = int(os.environ.get('SEARCH_CACHE_TTL_SEARCH', '120'))
+SEARCH_CACHE_TTL_EXPORT = int(os.environ.get('SEARCH_CACHE_TTL_EXPORT', '900'))
+SEARCH_CACHE_MAX_AGE = max(SEARCH_CACHE_TTL_SEARCH, SEARCH_CACHE_TTL_EXPORT)
+
+# Search sessions: processed result sets kept for paging / sorting / filtering
+SEARCH_SESSION_TTL = int(os.environ.get('SEARCH_SESSION_TTL', '1800'))  # seconds since last use
+SEARCH_SESSION_MAX_SESSIONS = int(os.environ.get('SEARCH_SESSION_MAX_SESSIONS', '500'))
+SEARCH_SESSION_MAX_ROWS = int(os.environ.get('SEARCH_SESSION_MAX_ROWS', '200000'))  # across all sessions
+SEARCH_SESSION_CHUNK_ROWS = int(os.environ.get('SEARCH_SESSION_CHUNK_ROWS', '500'))  # rows per shared document
+
+# Memoized normalization: DosarRecords per raw dosar, diacritic-free forms per distinct string
+DOSAR_RECORD_CACHE_SIZE = int(os.environ.get('DOSAR_RECORD_CACHE_SIZE', '5000'))
+DIACRITICS_CACHE_SIZE = int(os.environ.get('DIACRITICS_CACHE_SIZE', '50000'))
+
+# Streamed exports are sent in chunks of about this many characters
+EXPORT_STREAM_CHUNK_SIZE = int(os.environ.get('EXPORT_STREAM_CHUNK_SIZE', '65536'))
+
+# XLSX exports: written row by row (constant_memory) to a temp file kept in RAM up to
+# EXPORT_XLSX_SPOOL_SIZE bytes; exports requested with fundal=true run as background
+# jobs whose files live EXPORT_JOB_TTL seconds. With several workers EXPORT_JOB_DIR
+# must be a directory they all share (e.g. a common volume), or downloads fail
+EXPORT_XLSX_SPOOL_SIZE = int(os.environ.get('EXPORT_XLSX_SPOOL_SIZE', str(8 * 1024 * 1024)))
+EXPORT_JOB_TTL = int(os.environ.get('EXPORT_JOB_TTL', '3600'))
+EXPORT_JOB_DIR = Path(os.environ.get('EXPORT_JOB_DIR', os.path.join(tempfile.gettempdir(), 'portal_dosare_exports')))
+
+# Date-window sharding of broad obiect/parte searches
+PORTAL_MAX_RESULTS = int(os.environ.get('PORTAL_MAX_RESULTS', '1000'))  # Portal truncates at this size
+DATE_SHARD_MIN_DAYS = int(os.environ.get('DATE_SHARD_MIN_DAYS', '60'))
+DATE_SHARD_WINDOW_DAYS = int(os.environ.get('DATE_SHARD_WINDOW_DAYS', '30'))
+DATE_SHARD_CONCURRENCY = int(os.environ.get('DATE_SHARD_CONCURRENCY', '8'))
+DATE_SHARD_MAX_WINDOWS = int(os.environ.get('DATE_SHARD_MAX_WINDOWS', '128'))
+DATE_SHARD_MAX_CALLS = int(os.environ.get('DATE_SHARD_MAX_CALLS', '256'))  # upstream calls per search, splits included
+
+# Per-court fan-out: global budget shared by every fan-out search in the process
+INSTITUTION_FANOUT_CONCURRENCY = int(os.environ.get('INSTITUTION_FANOUT_CONCURRENCY', '16'))
+
+# Interactive searches handle at most this many terms; longer lists go to search jobs
+INTERACTIVE_MAX_TERMS = 50
+
+# Uploaded term lists (CSV / TXT / XLSX) are parsed incrementally in chunks of this size
+UPLOAD_READ_CHUNK_SIZE = int(os.environ.get('UPLOAD_READ_CHUNK_SIZE', '65536'))
+UPLOAD_FALLBACK_ENCODING = os.environ.get('UPLOAD_FALLBACK_ENCODING', 'cp1250')  # Excel on Romanian Windows
+
+# Search jobs: background term lists checkpointed in MongoDB
+SEARCH_JOB_MAX_TERMS = int(os.environ.get('SEARCH_JOB_MAX_TERMS', '20000'))
+SEARCH_JOB_CONCURRENCY = int(os.environ.get('SEARCH_JOB_CONCURRENCY', '4'))  # per process, all jobs
+SEARCH_JOB_UPSTREAM_SHARE = float(os.environ.get('SEARCH_JOB_UPSTREAM_SHARE', '0.5'))  # of the adaptive limit
+SEARCH_JOB_MAX_ACTIVE = int(os.environ.get('SEARCH_JOB_MAX_ACTIVE', '2'))
+SEARCH_JOB_BATCH = int(os.environ.get('SEARCH_JOB_BATCH', '50'))
+SEARCH_JOB_LEASE = int(os.environ.get('SEARCH_JOB_LEASE', '60'))  # seconds
+SEARCH_JOB_POLL_INTERVAL = float(os.environ.get('SEARCH_JOB_POLL_INTERVAL', '5'))
+SEARCH_JOB_MAX_ATTEMPTS = int(os.environ.get('SEARCH_JOB_MAX_ATTEMPTS', '3'))
+SEARCH_JOB_RETRY_DELAY = float(os.environ.get('SEARCH_JOB_RETRY_DELAY', '10'))
+SEARCH_JOB_RETENTION_DAYS = int(os.environ.get('SEARCH_JOB_RETENTION_DAYS', '7'))
+
+# Background polling of monitored cases (`monitored_cases.next_check_at`)
+MONITOR_POLLING = os.environ.get('MONITOR_POLLING', '1') == '1'
+MONITOR_INTERVAL = int(os.environ.get('MONITOR_INTERVAL', '21600'))  # seconds between checks of a case
+MONITOR_JITTER = float(os.environ.get('MONITOR_JITTER', '0.1'))  # +- fraction of every delay
+MONITOR_CONCURRENCY = int(os.environ.get('MONITOR_CONCURRENCY', '2'))  # per process
+MONITOR_UPSTREAM_SHARE = float(os.environ.get('MONITOR_UPSTREAM_SHARE', '0.3'))  # of the adaptive limit
+MONITOR_LEASE = int(os.environ.get('MONITOR_LEASE', '120'))  # seconds
+MONITOR_POLL_INTERVAL = float(os.environ.get('MONITOR_POLL_INTERVAL', '30'))
+MONITOR_BACKOFF_BASE = int(os.environ.get('MONITOR_BACKOFF_BASE', '300'))  # first retry after an error
+MONITOR_BACKOFF_MAX = int(os.environ.get('MONITOR_BACKOFF_MAX', '86400'))
+
+# Case-number searches are sent to the court coded in the number's middle segment
+COURT_ROUTING = os.environ.get('COURT_ROUTING', '1') == '1'
+
+# Local index of the parties of every case fetched from just.ro (`parti_index` collection)
+PARTY_INDEX = os.environ.get('PARTY_INDEX', '1') == '1'
+PARTY_INDEX_FRESH = int(os.environ.get('PARTY_INDEX_FRESH', '3600'))  # seconds before local hits get refreshed
+PARTY_INDEX_REINDEX = int(os.environ.get('PARTY_INDEX_REINDEX', '600'))  # min seconds between writes of a case
+PARTY_INDEX_RETENTION_DAYS = int(os.environ.get('PARTY_INDEX_RETENTION_DAYS', '180'))
+PARTY_INDEX_MAX_HITS = int(os.environ.get('PARTY_INDEX_MAX_HITS', '2000'))
+PARTY_INDEX_TRACKED_CASES = int(os.environ.get('PARTY_INDEX_TRACKED_CASES', '50000'))  # last write times kept
+
+# Local mirror of every case fetched from just.ro (`dosare` collection), read by /dosare/detalii
+DOSAR_MIRROR = os.environ.get('DOSAR_MIRROR', '1') == '1'
+DOSAR_MIRROR_FRESH = int(os.environ.get('DOSAR_MIRROR_FRESH', '300'))  # seconds served without revalidating
+DOSAR_MIRROR_MAX_STALE = int(os.environ.get('DOSAR_MIRROR_MAX_STALE', '604800'))  # older copies wait for upstream
+DOSAR_MIRROR_REWRITE = 60  # min seconds between writes of a case by one process
+DOSAR_MIRROR_TRACKED_CASES = int(os.environ.get('DOSAR_MIRROR_TRACKED_CASES', '50000'))  # last write times kept
+DOSAR_MIRROR_RETENTION_DAYS = int(os.environ.get('DOSAR_MIRROR_RETENTION_DAYS', '90'))
+MIRROR_WRITE_BATCH = 1000  # upserts per bulk_write into the local mirrors
 executor = ThreadPoolExecutor(max_workers=5)
 
 # Create the main app
@@ -52,6 +191,34 @@ app = FastAPI(title="Portal Dosare just.ro")
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+def dumps_json(content: Any) -> bytes:
+    """orjson encoding shared by responses and streams; values orjson can't encode natively fall back to str()"""
+    return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson rendering through dumps_json"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+class DosareRoute(APIRoute):
+    """
+    /api/dosare routes hand their dict results straight to FastJSONResponse,
+    skipping jsonable_encoder and response_model re-validation; response_model
+    still documents the shape in OpenAPI, and tests/test_response_models.py
+    keeps real responses in line with it.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        @functools.wraps(endpoint)
+        async def fast_endpoint(*args, **kwargs):
+            result = await endpoint(*args, **kwargs)
+            return result if isinstance(result, Response) else FastJSONResponse(result)
+        super().__init__(path, fast_endpoint, **kwargs)
+
+# Search, details, jobs and exports under /api/dosare
+dosare_router = APIRouter(prefix="/api/dosare", route_class=DosareRoute, default_response_class=FastJSONResponse)
+
 # ============== MODELS ==============
 
 class UserCreate(BaseModel):
@@ -77,7 +244,15 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
     user: UserResponse
 
-class CautareDosarRequest(BaseModel):
+class SearchSessionParams(BaseModel):
+    """Paging over a stored search: pass search_id (+ page) or the cursor from a previous page"""
+    search_id: Optional[str] = None
+    cursor: Optional[str] = None
+    sort_by: Optional[str] = None  # Any result field; default is the original order
+    sort_desc: bool = False
+    filtru: Optional[str] = None  # Diacritic-insensitive text filter over the result fields
+
+class CautareDosarRequest(SearchSessionParams):
     numar_dosar: Optional[str] = None
     obiect_dosar: Optional[str] = None
     nume_parte: Optional[str] = None
@@ -86,32 +261,118 @@ class CautareDosarRequest(BaseModel):
     data_stop: Optional[str] = None
     page: int = 1
     page_size: int = 20
+    shard_by_date: bool = True  # Split long date ranges into concurrent sub-windows
+    # Without institutie: query each court separately ("toate", "curti_apel", "tribunale",
+    # "judecatorii") or only the given institutii keys
+    fan_out_institutii: Optional[str] = None
+    institutii: Optional[List[str]] = None
 
-class BulkSearchRequest(BaseModel):
+class BulkSearchRequest(SearchSessionParams):
     numere_dosare: List[str]
     institutie: Optional[str] = None
     page: int = 1
     page_size: int = 20
+    concurrency: Optional[int] = None  # Parallel upstream queries (default BULK_SEARCH_CONCURRENCY)
 
-class UniversalSearchRequest(BaseModel):
+class UniversalSearchRequest(SearchSessionParams):
     """Universal search - auto-detects type and searches across all instances"""
-    termeni: List[str]  # List of search terms (case numbers or party names)
+    termeni: List[str] = []  # List of search terms (case numbers or party names); optional with search_id
     page: int = 1
     page_size: int = 20
+    concurrency: Optional[int] = None  # Parallel upstream queries (default UNIVERSAL_SEARCH_CONCURRENCY)
+
+class SearchJobCreate(BaseModel):
+    termeni: List[str]  # Up to SEARCH_JOB_MAX_TERMS case numbers or party names
+    tip: str = "universal"  # "universal" (rows like /search/universal) or "numere" (like /search/bulk)
+    institutie: Optional[str] = None  # tip="numere" only
+
+class ExportRequest(UniversalSearchRequest):
+    detaliat: bool = False  # XLSX only: add "Părți" and "Ședințe" sheets
+    fundal: bool = False  # XLSX only: run as a background job, answered with its status / download link
 
 class SearchResultRow(BaseModel):
     """Single row in search results table"""
     termen_cautare: str
     tip_detectat: str
-    numar_dosar: str
+    numar_dosar: Optional[str] = ""
     instanta: str
-    obiect: str
+    obiect: Optional[str] = ""
     stadiu_procesual: str
     data: str
     ultima_modificare: str
     categorie_caz: str
-    nume_parte: str
-    calitate_parte: str
+    nume_parte: Optional[str] = ""
+    calitate_parte: Optional[str] = ""
+    observatii: str = ""
+    potrivire: str = ""  # exact / token_subset / substring, for "Nume parte" rows
+    parti_potrivite: List[Dict[str, Any]] = []
+
+class DosarParteResult(BaseModel):
+    nume: Optional[str] = None
+    calitateParte: Optional[str] = None
+
+class DosarSedintaResult(BaseModel):
+    complet: Optional[str] = None
+    data: str = ""
+    ora: Optional[str] = None
+    solutie: Optional[str] = None
+    solutieSumar: Optional[str] = None
+
+class DosarCaleAtacResult(BaseModel):
+    dataDeclarare: str = ""
+    parteDeclaratoare: Optional[str] = None
+    tipCaleAtac: Optional[str] = None
+
+class DosarResult(BaseModel):
+    """A case as returned by /dosare/search, /bulk and /csv (process_dosar)"""
+    model_config = ConfigDict(extra="allow")
+    numar: Optional[str] = None
+    numarVechi: Optional[str] = None
+    data: str = ""
+    institutie: str = ""
+    departament: Optional[str] = None
+    categorieCaz: str = ""
+    stadiuProcesual: str = ""
+    obiect: Optional[str] = None
+    parti: List[DosarParteResult] = []
+    sedinte: List[DosarSedintaResult] = []
+    caiAtac: List[DosarCaleAtacResult] = []
+    searched_number: Optional[str] = None
+
+class SearchPageResponse(BaseModel):
+    """Pagination and status fields shared by the search responses; error is set instead on failure"""
+    model_config = ConfigDict(extra="allow")
+    total_count: int = 0
+    page: int = 1
+    page_size: int = 20
+    total_pages: int = 1
+    search_id: Optional[str] = None
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    timings: List[Dict[str, Any]] = []
+    degraded: bool = False
+    error: Optional[str] = None
+
+class DosareSearchResponse(SearchPageResponse):
+    results: List[DosarResult] = []
+    errors: List[Dict[str, str]] = []
+
+class UniversalSearchResponse(SearchPageResponse):
+    rows: List[SearchResultRow] = []
+    headers: List[str] = []
+
+class CaseDetailsResponse(BaseModel):
+    found: bool
+    detalii: Optional[Dict[str, str]] = None
+    parti: List[Dict[str, str]] = []
+    sedinte: List[Dict[str, str]] = []
+    cai_atac: List[Dict[str, str]] = []
+    error: Optional[str] = None
+    degraded: bool = False
+    sursa: Optional[str] = None  # "local" (case mirror) or "upstream"
+    actualizat_la: Optional[datetime] = None
+    vechime_secunde: Optional[int] = None
+    reimprospatare: bool = False
 
 class MonitoredCaseCreate(BaseModel):
     numar_dosar: str
@@ -174,15 +435,56 @@ async def get_admin_user(user: dict = Depends(get_current_user)):
 
 # ============== DIACRITIC NORMALIZATION ==============
 
+def _strip_marks(text: str) -> str:
+    """Reference algorithm: NFD-decompose, drop combining marks (Mn)"""
+    normalized = unicodedata.normalize('NFD', text)
+    return ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+
+# Every code point of Basic Latin .. Latin Extended-B, the combining marks and Latin Extended
+# Additional (which covers both ș/ț comma-below and ş/ţ cedilla spellings) mapped to its
+# mark-free form once at import. Unchanged characters map to themselves: str.translate is
+# much slower on table misses than on hits.
+DIACRITICS_TABLE = {
+    code: _strip_marks(chr(code)) or None
+    for code in itertools.chain(range(0x0000, 0x0250), range(0x0300, 0x0370), range(0x1E00, 0x1F00))
+}
+
+def _translate_diacritics(text: str) -> str:
+    stripped = text.translate(DIACRITICS_TABLE)
+    if not stripped.isascii():
+        # Letters outside the table (Greek, Cyrillic, ...) take the full Unicode path
+        stripped = _strip_marks(stripped)
+    return stripped.upper()
+
+_normalize_non_ascii = functools.lru_cache(maxsize=DIACRITICS_CACHE_SIZE)(_translate_diacritics)
+
 def normalize_diacritics(text: str) -> str:
     """Remove diacritics for case-insensitive search (Iasi = IAȘI)"""
     if not text:
         return ""
-    # Normalize to NFD form (decompose characters)
-    normalized = unicodedata.normalize('NFD', text)
-    # Remove combining characters (diacritics)
-    without_diacritics = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-    return without_diacritics.upper()
+    if text.isascii():
+        return text.upper()
+    return _normalize_non_ascii(text)
+
+def normalize_diacritics_batch(texts: List[Optional[str]]) -> List[str]:
+    """
+    normalize_diacritics for a list of strings (party names, institution names, row
+    haystacks). Repeats within the list are translated once; the shared memo is
+    bypassed, so one-off strings don't evict the repeated ones.
+    """
+    seen = {}
+    normalized = []
+    for text in texts:
+        if not text:
+            normalized.append("")
+        elif text.isascii():
+            normalized.append(text.upper())
+        else:
+            value = seen.get(text)
+            if value is None:
+                value = seen[text] = _translate_diacritics(text)
+            normalized.append(value)
+    return normalized
 
 def detect_search_type(term: str) -> str:
     """Detect if search term is a case number or party name"""
@@ -192,58 +494,413 @@ def detect_search_type(term: str) -> str:
         return "Număr dosar"
     return "Nume parte"
 
-def find_matching_institutie(search_term: str) -> Optional[str]:
-    """Find institution key by name with diacritic-insensitive matching"""
-    normalized_search = normalize_diacritics(search_term)
-    for key, name in INSTITUTII_MAP.items():
-        if normalize_diacritics(name) == normalized_search or normalize_diacritics(key) == normalized_search:
-            return key
-    # Partial match
-    for key, name in INSTITUTII_MAP.items():
-        if normalized_search in normalize_diacritics(name):
-            return key
-    return None
+# ============== SEARCH RESULT CACHE ==============
+
+_background_tasks = set()
+
+def spawn_background(coro):
+    """Run coro as a fire-and-forget task, keeping a reference until it finishes"""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+class SearchResultCache:
+    """
+    Two-tier cache for CautareDosare results.
+    Tier 1 is an in-process LRU bounded by entry count and age; tier 2 is the
+    shared `search_cache` MongoDB collection, so every uvicorn worker benefits.
+    Callers pass the maximum age they accept, which gives per-endpoint TTLs.
+    """
+
+    def __init__(self, collection, max_entries: int, max_age: int):
+        self.collection = collection
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (fetched_at, results)
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                 institutie=None, data_start=None, data_stop=None) -> str:
+        """Normalized key: whitespace-collapsed, case-insensitive, empty == None"""
+        parts = [
+            " ".join(str(value).split()).upper() if value else ""
+            for value in (numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop)
+        ]
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    async def get(self, key: str, max_age: int) -> Optional[list]:
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, results = entry
+            if now - fetched_at <= max_age:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(results)
+            if now - fetched_at > self.max_age:
+                del self._entries[key]
+                self.evictions += 1
+        
+        try:
+            doc = await self.collection.find_one({"_id": key})
+        except Exception as e:
+            logging.warning(f"Search cache lookup failed: {e}")
+            doc = None
+        if doc:
+            fetched_at = doc["fetched_at"].replace(tzinfo=timezone.utc).timestamp()
+            if now - fetched_at <= max_age:
+                self._store(key, fetched_at, doc["results"])
+                self.shared_hits += 1
+                return list(doc["results"])
+        
+        self.misses += 1
+        return None
+
+    def _store(self, key: str, fetched_at: float, results: list):
+        self._entries[key] = (fetched_at, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def _store_shared(self, key: str, fetched_at: float, results: list):
+        try:
+            await self.collection.replace_one(
+                {"_id": key},
+                {"_id": key, "results": results,
+                 "fetched_at": datetime.fromtimestamp(fetched_at, timezone.utc)},
+                upsert=True
+            )
+        except Exception as e:
+            # Oversized or unencodable result sets stay in the local tier only
+            logging.warning(f"Search cache write failed: {e}")
+
+    def set(self, key: str, results: list):
+        fetched_at = time.time()
+        self._store(key, fetched_at, results)
+        spawn_background(self._store_shared(key, fetched_at, results))
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("fetched_at", expireAfterSeconds=self.max_age)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.shared_hits) / lookups, 3) if lookups else 0.0
+        }
+
+search_cache = SearchResultCache(db.search_cache, SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_MAX_AGE)
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key onto one shared task.
+    Every waiter receives the shared result or exception; a cancelled waiter
+    only stops waiting, the shared call keeps running for the others.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {"in_flight": len(self._inflight), "leaders": self.leaders, "coalesced": self.coalesced}
+
+upstream_flights = SingleFlight()
+
+# ============== UPSTREAM PROTECTION ==============
+
+class UpstreamUnavailableError(Exception):
+    """portalquery.just.ro failed, timed out, is overloaded or the circuit is open"""
+
+def is_upstream_failure(error: Exception) -> bool:
+    """SOAP faults and bad parameters are answers, not signs of an unhealthy upstream"""
+    return not isinstance(error, (Fault, ValueError, TypeError))
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on concurrent upstream calls. The limit grows by about one per
+    window of calls answered under the latency target and is halved (at most
+    once per target interval) on errors, timeouts or slow answers. Callers that
+    can't get a slot within `queue_timeout` are shed instead of piling up.
+    """
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int,
+                 latency_target: float, queue_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.shed = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+        self._clock = clock
+
+    async def acquire(self):
+        async with self._condition:
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self.in_flight < int(self.limit)),
+                    timeout=self.queue_timeout
+                )
+            except asyncio.TimeoutError:
+                self.shed += 1
+                raise UpstreamUnavailableError("Portalul just.ro este supraîncărcat, încercați din nou")
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+
+    async def release(self, latency: float, healthy: Optional[bool]):
+        """healthy=None (e.g. a cancelled call) frees the slot without adjusting the limit"""
+        async with self._condition:
+            self.in_flight -= 1
+            if healthy is False or (healthy and latency > self.latency_target):
+                now = self._clock()
+                if now - self._last_decrease >= self.latency_target:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._last_decrease = now
+            elif healthy:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    async def wait_for_headroom(self, share: float):
+        """Background work: wait until nobody is queued and less than `share` of the limit is in use"""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.waiting == 0 and self.in_flight < max(1, int(self.limit * share))
+            )
+
+    def stats(self) -> dict:
+        return {"limit": int(self.limit), "in_flight": self.in_flight,
+                "waiting": self.waiting, "shed": self.shed}
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive upstream failures.
+    After `reset_timeout` seconds one half-open probe is let through; its
+    success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.rejected = 0
+        self._clock = clock
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+        if self.state == "open" and self._clock() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+        if self.state == "half_open" and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets the next probe through (0 unless open)"""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self.reset_timeout - (self._clock() - self.opened_at))
+
+    def record(self, healthy: Optional[bool]):
+        """healthy=None releases a half-open probe without a verdict"""
+        if self.state == "half_open":
+            self.probe_in_flight = False
+        if healthy is None:
+            return
+        if healthy:
+            if self.state != "closed":
+                logging.info("Upstream circuit closed")
+            self.state = "closed"
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logging.warning(f"Upstream circuit opened after {self.failures} failures")
+            self.state = "open"
+            self.opened_at = self._clock()
+
+    def stats(self) -> dict:
+        return {"state": self.state, "consecutive_failures": self.failures, "rejected": self.rejected}
+
+upstream_limiter = AdaptiveConcurrencyLimiter(
+    SOAP_INITIAL_CONCURRENCY, SOAP_MIN_CONCURRENCY, SOAP_MAX_CONCURRENCY,
+    latency_target=SOAP_LATENCY_TARGET, queue_timeout=SOAP_CALL_TIMEOUT
+)
+upstream_breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT)
 
 # ============== SOAP SERVICE ==============
 
+class SoapClientPool:
+    """One zeep Client per executor thread, all sharing a keep-alive HTTP session.
+
+    A client is recycled after too many consecutive failures or once it
+    reaches its maximum age, so a broken connection doesn't stick to a thread.
+    """
+
+    def __init__(self, wsdl: str, pool_size: int, operation_timeout: int,
+                 max_errors: int, max_age: int):
+        self.wsdl = wsdl
+        self.operation_timeout = operation_timeout
+        self.max_errors = max_errors
+        self.max_age = max_age
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+
+    def _build_client(self) -> Client:
+        transport = Transport(session=self.session, operation_timeout=self.operation_timeout)
+        soap_client = Client(self.wsdl, transport=transport)
+        with self._lock:
+            self.created += 1
+        return soap_client
+
+    def get(self) -> Client:
+        """Return the calling thread's client, building or recycling it as needed"""
+        local = self._local
+        soap_client = getattr(local, "client", None)
+        if soap_client is not None and time.monotonic() - local.created_at > self.max_age:
+            self._discard()
+            soap_client = None
+        if soap_client is None:
+            soap_client = self._build_client()
+            local.client = soap_client
+            local.created_at = time.monotonic()
+            local.errors = 0
+        return soap_client
+
+    def report_success(self):
+        self._local.errors = 0
+
+    def report_failure(self):
+        """Count a failed call; drop the thread's client once it looks unhealthy"""
+        local = self._local
+        local.errors = getattr(local, "errors", 0) + 1
+        if local.errors >= self.max_errors:
+            logging.warning(f"Recycling SOAP client after {local.errors} consecutive errors")
+            self._discard()
+
+    def _discard(self):
+        self._local.client = None
+        self._local.errors = 0
+        with self._lock:
+            self.recycled += 1
+
+    def stats(self) -> dict:
+        return {"wsdl": self.wsdl, "clients_created": self.created, "clients_recycled": self.recycled}
+
+soap_client_pool = SoapClientPool(
+    SOAP_WSDL_SOURCE,
+    pool_size=SOAP_HTTP_POOL_SIZE,
+    operation_timeout=SOAP_OPERATION_TIMEOUT,
+    max_errors=SOAP_CLIENT_MAX_ERRORS,
+    max_age=SOAP_CLIENT_MAX_AGE
+)
+
 def get_soap_client():
-    return Client(SOAP_WSDL)
+    return soap_client_pool.get()
+
+def cautare_dosare_params(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                          institutie=None, data_start=None, data_stop=None) -> dict:
+    """Build the CautareDosare keyword arguments"""
+    # Convert date strings to datetime if provided
+    ds = datetime.fromisoformat(data_start) if data_start else None
+    de = datetime.fromisoformat(data_stop) if data_stop else None
+    
+    return {
+        "numarDosar": numar_dosar or "",
+        "obiectDosar": obiect_dosar or "",
+        "numeParte": nume_parte or "",
+        "institutie": institutie,
+        "dataStart": ds,
+        "dataStop": de
+    }
+
+def dosare_result_to_list(result) -> list:
+    """Serialize a CautareDosare result to a list of dicts"""
+    if result is None:
+        return []
+    
+    # Serialize zeep objects to dict
+    serialized = serialize_object(result)
+    
+    # Ensure we always return a list
+    if serialized is None:
+        return []
+    if isinstance(serialized, str):
+        return []
+    if isinstance(serialized, dict):
+        return [serialized]
+    if isinstance(serialized, list):
+        return [item for item in serialized if isinstance(item, dict)]
+    return []
+
+def soap_cautare_dosare(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                        institutie=None, data_start=None, data_stop=None):
+    """Call SOAP CautareDosare synchronously, raising on failure"""
+    soap_client = get_soap_client()
+    try:
+        result = soap_client.service.CautareDosare(**cautare_dosare_params(
+            numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+        ))
+    except Exception:
+        soap_client_pool.report_failure()
+        raise
+    soap_client_pool.report_success()
+    return dosare_result_to_list(result)
 
 def call_soap_cautare_dosare(numar_dosar=None, obiect_dosar=None, nume_parte=None, 
                               institutie=None, data_start=None, data_stop=None):
     """Call SOAP CautareDosare method synchronously"""
     try:
-        soap_client = get_soap_client()
-        
-        # Convert date strings to datetime if provided
-        ds = datetime.fromisoformat(data_start) if data_start else None
-        de = datetime.fromisoformat(data_stop) if data_stop else None
-        
-        result = soap_client.service.CautareDosare(
-            numarDosar=numar_dosar or "",
-            obiectDosar=obiect_dosar or "",
-            numeParte=nume_parte or "",
-            institutie=institutie,
-            dataStart=ds,
-            dataStop=de
+        return soap_cautare_dosare(
+            numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
         )
-        
-        if result is None:
-            return []
-        
-        # Serialize zeep objects to dict
-        serialized = serialize_object(result)
-        
-        # Ensure we always return a list
-        if serialized is None:
-            return []
-        if isinstance(serialized, str):
-            return []
-        if isinstance(serialized, dict):
-            return [serialized]
-        if isinstance(serialized, list):
-            return [item for item in serialized if isinstance(item, dict)]
-        return []
     except Exception as e:
         logging.error(f"SOAP CautareDosare error: {e}")
         return []
@@ -257,22 +914,343 @@ def call_soap_cautare_sedinte(data_sedinta, institutie):
             dataSedinta=ds,
             institutie=institutie
         )
+        soap_client_pool.report_success()
         if result is None:
             return []
         return serialize_object(result)
     except Exception as e:
         logging.error(f"SOAP CautareSedinte error: {e}")
+        soap_client_pool.report_failure()
         return []
 
+_soap_http_client: Optional[httpx.AsyncClient] = None
+_async_soap_client: Optional[AsyncClient] = None
+_async_soap_client_lock = asyncio.Lock()
+
+def get_soap_http_client() -> httpx.AsyncClient:
+    """Pooled keep-alive httpx client shared by every async upstream call (created on first use)"""
+    global _soap_http_client
+    if _soap_http_client is None:
+        _soap_http_client = httpx.AsyncClient(
+            timeout=SOAP_OPERATION_TIMEOUT,
+            limits=httpx.Limits(max_connections=SOAP_MAX_CONCURRENCY,
+                                max_keepalive_connections=SOAP_HTTP_POOL_SIZE)
+        )
+    return _soap_http_client
+
+async def get_async_soap_client() -> AsyncClient:
+    """
+    Shared zeep AsyncClient over the pooled httpx client. Built at startup; the
+    WSDL is loaded and parsed in the executor so it never blocks the event loop.
+    """
+    global _async_soap_client
+    if _async_soap_client is None:
+        async with _async_soap_client_lock:
+            if _async_soap_client is None:
+                transport = AsyncTransport(client=get_soap_http_client(), operation_timeout=SOAP_OPERATION_TIMEOUT)
+                _async_soap_client = await asyncio.get_running_loop().run_in_executor(
+                    executor, functools.partial(AsyncClient, SOAP_WSDL_SOURCE, transport=transport)
+                )
+    return _async_soap_client
+
+async def close_async_soap_client():
+    global _async_soap_client, _soap_http_client
+    _async_soap_client = None
+    if _soap_http_client is not None:
+        await _soap_http_client.aclose()
+        _soap_http_client = None
+
+async def fetch_cautare_dosare(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                               institutie=None, data_start=None, data_stop=None):
+    """Call SOAP CautareDosare without blocking a thread, raising on failure.
+    
+    Calls are admitted by the circuit breaker and the adaptive concurrency
+    limiter, and each one is bounded by SOAP_CALL_TIMEOUT. Upstream failures
+    are raised as UpstreamUnavailableError. Cancelling the caller cancels the call.
+    """
+    if not upstream_breaker.allow():
+        raise UpstreamUnavailableError("Portalul just.ro este temporar indisponibil")
+    try:
+        await upstream_limiter.acquire()
+    except BaseException:
+        upstream_breaker.record(None)
+        raise
+    
+    start = time.monotonic()
+    healthy = None
+    try:
+        if SOAP_TRANSPORT == "thread":
+            loop = asyncio.get_event_loop()
+            results = await asyncio.wait_for(loop.run_in_executor(
+                executor, 
+                soap_cautare_dosare,
+                numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+            ), timeout=SOAP_CALL_TIMEOUT)
+        elif SOAP_FAST_PATH:
+            results = await asyncio.wait_for(fast_cautare_dosare(
+                numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+            ), timeout=SOAP_CALL_TIMEOUT)
+        else:
+            params = cautare_dosare_params(
+                numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+            )
+            soap_client = await get_async_soap_client()
+            result = await asyncio.wait_for(
+                soap_client.service.CautareDosare(**params),
+                timeout=SOAP_CALL_TIMEOUT
+            )
+            results = dosare_result_to_list(result)
+        healthy = True
+        return results
+    except asyncio.TimeoutError as e:
+        healthy = False
+        raise UpstreamUnavailableError(f"Portalul just.ro nu a răspuns în {SOAP_CALL_TIMEOUT:.0f}s") from e
+    except Exception as e:
+        healthy = not is_upstream_failure(e)
+        if healthy:
+            raise
+        raise UpstreamUnavailableError(f"Portalul just.ro nu răspunde: {e}") from e
+    finally:
+        await upstream_limiter.release(time.monotonic() - start, healthy)
+        upstream_breaker.record(healthy)
+
 async def async_cautare_dosare(numar_dosar=None, obiect_dosar=None, nume_parte=None,
-                                institutie=None, data_start=None, data_stop=None):
-    """Async wrapper for SOAP call"""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        executor, 
-        call_soap_cautare_dosare,
+                                institutie=None, data_start=None, data_stop=None,
+                                cache_ttl: int = SEARCH_CACHE_TTL_SEARCH):
+    """
+    CautareDosare through the result cache; results older than cache_ttl seconds are refetched.
+    Raises UpstreamUnavailableError when just.ro can't answer, so callers can report
+    a degraded result instead of an empty one.
+    """
+    institutie = resolve_institutie(institutie)
+    key = SearchResultCache.make_key(numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop)
+    if cache_ttl > 0:
+        cached = await search_cache.get(key, cache_ttl)
+        if cached is not None:
+            return cached
+    
+    async def fetch_and_cache():
+        results = await fetch_cautare_dosare(
+            numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+        )
+        search_cache.set(key, results)
+        party_index.add(results)
+        case_mirror.add(results)
+        return results
+    
+    # Identical queries already in flight share one upstream call
+    try:
+        return list(await upstream_flights.do(key, fetch_and_cache))
+    except UpstreamUnavailableError as e:
+        logging.error(f"SOAP CautareDosare unavailable: {e}")
+        raise
+    except Exception as e:
+        logging.error(f"SOAP CautareDosare error: {e}")
+        return []
+
+async def cancel_on_disconnect(http_request: Request, coro):
+    """Await coro, cancelling it (and its upstream calls) if the HTTP client disconnects"""
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        if not task.done():
+            task.cancel()
+
+def resolve_concurrency(requested: Optional[int], default: int) -> int:
+    """Clamp a per-request concurrency override to [1, MAX_SEARCH_CONCURRENCY]"""
+    if not requested:
+        return default
+    return min(max(1, requested), MAX_SEARCH_CONCURRENCY)
+
+async def gather_bounded(items: list, fn, limit: int) -> list:
+    """
+    Await fn(item) for every item with at most `limit` running at once.
+    Returns (result, error, latency_ms) tuples in input order; an exception
+    from one item is returned as its error instead of failing the batch.
+    """
+    return [outcome async for _, *outcome in iter_bounded(items, fn, limit)]
+
+async def iter_bounded(items: list, fn, limit: int, ordered: bool = True) -> AsyncIterator[tuple]:
+    """
+    Like gather_bounded, but yields (item, result, error, latency_ms) in input
+    order as soon as each item and all the ones before it are done (or, with
+    ordered=False, in completion order), while the later items keep running.
+    Closing the iterator cancels what is left.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+    
+    async def run(item):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result, error = await fn(item), None
+            except Exception as e:
+                result, error = None, e
+            return item, result, error, round((time.perf_counter() - start) * 1000, 1)
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for next_done in (tasks if ordered else asyncio.as_completed(tasks)):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+# ============== SOAP FAST PATH ==============
+# Builds CautareDosare / CautareSedinte envelopes by hand and stream-parses the
+# response with lxml, producing the same dicts as zeep + serialize_object
+# without building zeep's object tree. Enabled with SOAP_FAST_PATH=1.
+
+SOAP_NS = "portalquery.just.ro"
+SOAP_ENV_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+XSI_NIL = f"{{{XSI_NS}}}nil"
+SOAP_FAULT_TAG = f"{{{SOAP_ENV_NS}}}Fault"
+
+# Response schema from Query.wsdl: field -> "str" | "datetime" | (item tag, item fields)
+PARTE_FIELDS = {"nume": "str", "calitateParte": "str"}
+DOSAR_SEDINTA_FIELDS = {
+    "complet": "str", "data": "datetime", "ora": "str", "solutie": "str", "solutieSumar": "str",
+    "dataPronuntare": "datetime", "documentSedinta": "str", "numarDocument": "str", "dataDocument": "datetime"
+}
+CALE_ATAC_FIELDS = {"dataDeclarare": "datetime", "parteDeclaratoare": "str", "tipCaleAtac": "str"}
+DOSAR_FIELDS = {
+    "parti": ("DosarParte", PARTE_FIELDS),
+    "sedinte": ("DosarSedinta", DOSAR_SEDINTA_FIELDS),
+    "caiAtac": ("DosarCaleAtac", CALE_ATAC_FIELDS),
+    "numar": "str", "numarVechi": "str", "data": "datetime", "institutie": "str", "departament": "str",
+    "categorieCaz": "str", "stadiuProcesual": "str", "obiect": "str"
+}
+SEDINTA_DOSAR_FIELDS = {
+    "numar": "str", "numar_vechi": "str", "data": "datetime", "ora": "str",
+    "categorieCaz": "str", "stadiuProcesual": "str"
+}
+SEDINTA_FIELDS = {
+    "departament": "str", "complet": "str", "data": "datetime", "ora": "str",
+    "dosare": ("SedintaDosar", SEDINTA_DOSAR_FIELDS)
+}
+
+def _soap_param(name: str, value) -> str:
+    if value is None:
+        return f'<{name} xsi:nil="true"/>'
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return f"<{name}>{xml_escape(str(value))}</{name}>"
+
+def build_soap_envelope(operation: str, params: dict) -> bytes:
+    """SOAP 1.1 envelope for a document/literal operation; params must follow the WSDL order"""
+    body = "".join(_soap_param(name, value) for name, value in params.items())
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<soap:Envelope xmlns:soap="{SOAP_ENV_NS}" xmlns:xsi="{XSI_NS}">'
+        f'<soap:Body><{operation} xmlns="{SOAP_NS}">{body}</{operation}></soap:Body>'
+        '</soap:Envelope>'
+    ).encode("utf-8")
+
+def build_cautare_dosare_envelope(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                                  institutie=None, data_start=None, data_stop=None) -> bytes:
+    return build_soap_envelope("CautareDosare", cautare_dosare_params(
+        numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
+    ))
+
+def build_cautare_sedinte_envelope(data_sedinta, institutie) -> bytes:
+    ds = datetime.fromisoformat(data_sedinta) if isinstance(data_sedinta, str) else data_sedinta
+    return build_soap_envelope("CautareSedinte", {"dataSedinta": ds, "institutie": institutie})
+
+def _parse_soap_record(elem, fields: dict) -> dict:
+    # zeep reports absent elements (and nil records) as None fields, so start from every field
+    record = dict.fromkeys(fields)
+    if elem.get(XSI_NIL) == "true":
+        return record
+    for child in elem:
+        name = child.tag.rpartition("}")[2]
+        kind = fields.get(name)
+        if kind is None or child.get(XSI_NIL) == "true":
+            continue
+        if isinstance(kind, tuple):
+            item_tag, item_fields = kind
+            items = [_parse_soap_record(item, item_fields) for item in child]
+            # zeep reports an empty array element as None
+            record[name] = {item_tag: items} if items else None
+        elif not child.text:
+            continue
+        elif kind == "datetime":
+            record[name] = datetime.fromisoformat(child.text)
+        else:
+            record[name] = child.text
+    return record
+
+class SoapRecordParser:
+    """
+    Incremental SOAP response parser: feed() raw chunks and get back every
+    record element (Dosar / Sedinta) completed so far, as a dict. Parsed
+    elements are cleared as it goes, so memory doesn't grow with the response.
+    """
+
+    def __init__(self, record_tag: str, fields: dict):
+        self.record_tag = f"{{{SOAP_NS}}}{record_tag}"
+        self.fields = fields
+        self.fault: Optional[str] = None
+        self._parser = etree.XMLPullParser(
+            events=("end",), tag=(self.record_tag, SOAP_FAULT_TAG),
+            resolve_entities=False, no_network=True, huge_tree=True
+        )
+
+    def feed(self, chunk: bytes) -> list:
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list:
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list:
+        records = []
+        for _, elem in self._parser.read_events():
+            if elem.tag == SOAP_FAULT_TAG:
+                self.fault = elem.findtext("faultstring") or "SOAP Fault"
+                continue
+            records.append(_parse_soap_record(elem, self.fields))
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return records
+
+async def fast_soap_call(operation: str, envelope: bytes, record_tag: str, fields: dict) -> list:
+    """POST a prebuilt envelope and stream-parse the response into record dicts"""
+    parser = SoapRecordParser(record_tag, fields)
+    records = []
+    headers = {"Content-Type": "text/xml; charset=utf-8", "SOAPAction": f'"{SOAP_NS}/{operation}"'}
+    async with get_soap_http_client().stream("POST", SOAP_ENDPOINT, content=envelope, headers=headers) as response:
+        try:
+            async for chunk in response.aiter_bytes():
+                records.extend(parser.feed(chunk))
+            records.extend(parser.close())
+        except etree.XMLSyntaxError as e:
+            raise TransportError(f"Invalid SOAP response: {e}", status_code=response.status_code) from e
+    if parser.fault is not None:
+        raise Fault(parser.fault)
+    if response.status_code != 200:
+        raise TransportError(status_code=response.status_code)
+    return records
+
+async def fast_cautare_dosare(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                              institutie=None, data_start=None, data_stop=None) -> list:
+    envelope = build_cautare_dosare_envelope(
         numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop
     )
+    return await fast_soap_call("CautareDosare", envelope, "Dosar", DOSAR_FIELDS)
+
+async def fast_cautare_sedinte(data_sedinta, institutie) -> list:
+    envelope = build_cautare_sedinte_envelope(data_sedinta, institutie)
+    return await fast_soap_call("CautareSedinte", envelope, "Sedinta", SEDINTA_FIELDS)
 
 # ============== INSTITUTII LIST - COMPLETE (242 instante) ==============
 
@@ -514,6 +1492,171 @@ INSTITUTII_MAP = {
 # Get sorted list of API keys for backward compatibility
 INSTITUTII = sorted(INSTITUTII_MAP.keys())
 
+# ============== INSTITUTION INDEX ==============
+
+# Abbreviations and spellings users type, mapped to the tokens used in INSTITUTII_MAP names
+INSTITUTION_TOKEN_SYNONYMS = {
+    "SECTOR": "SECTORUL", "SECT": "SECTORUL", "SEC": "SECTORUL", "SECTORULUI": "SECTORUL",
+    "JUD": "JUDECATORIA", "JUDEC": "JUDECATORIA", "JUDECATORIE": "JUDECATORIA",
+    "TRIB": "TRIBUNALUL", "TRIBUNAL": "TRIBUNALUL",
+    "CA": "CURTEA DE APEL", "CURTE": "CURTEA", "BUC": "BUCURESTI", "BUCUREST": "BUCURESTI",
+}
+# Trigram similarity needed to suggest a misspelled name, and to resolve one to a key on its own
+# (only when it beats the next closest name by INSTITUTION_RESOLVE_MIN_MARGIN)
+INSTITUTION_FUZZY_MIN_SIMILARITY = 0.45
+INSTITUTION_RESOLVE_MIN_SIMILARITY = 0.6
+INSTITUTION_RESOLVE_MIN_MARGIN = 0.1
+
+def institution_tokens(text: str) -> List[str]:
+    """Diacritic-free upper-case words, synonyms expanded, "SECTOR3" split into SECTORUL 3"""
+    words = re.sub(r"([A-Z])(\d)", r"\1 \2", re.sub(r"[^A-Z0-9]+", " ", normalize_diacritics(text))).split()
+    tokens = []
+    for word in words:
+        tokens.extend(INSTITUTION_TOKEN_SYNONYMS.get(word, word).split())
+    return tokens
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class InstitutionIndex:
+    """
+    Lookup structures over INSTITUTII_MAP, built once: exact map of normalized names and
+    keys, a prefix trie over every word of every name, and a trigram index for typos.
+    Queries are matched word by word, so "sector 3", "Jud. Sect 3" and "sectorul 3 buc"
+    all find Judecătoria SECTORUL 3 BUCUREȘTI without the "Judecătoria" prefix.
+    """
+
+    def __init__(self, institutii: Dict[str, str]):
+        self.keys = list(institutii)
+        self.names = [institutii[key] for key in self.keys]
+        self.exact: Dict[str, int] = {}
+        self.trie: dict = {}
+        self.trigram_ids: Dict[str, set] = {}
+        self.normalized: List[str] = []
+        self.trigram_sets: List[set] = []
+        for i, (key, name) in enumerate(zip(self.keys, self.names)):
+            tokens = institution_tokens(name)
+            normalized = " ".join(tokens)
+            self.normalized.append(normalized)
+            for form in (normalized, normalized.replace(" ", ""), normalize_diacritics(key)):
+                self.exact.setdefault(form, i)
+            for position, token in enumerate(tokens):
+                node = self.trie
+                for char in token:
+                    node = node.setdefault(char, {})
+                    node.setdefault(None, {}).setdefault(i, position)  # entry id -> first word it starts
+            grams = trigrams(normalized)
+            self.trigram_sets.append(grams)
+            for gram in grams:
+                self.trigram_ids.setdefault(gram, set()).add(i)
+        self._finalize_trie(self.trie)
+        # Trigrams of court-type words ("JUD", "BUN", ...) are in too many names to pick candidates
+        self.rare_trigram_ids = {
+            gram: ids for gram, ids in self.trigram_ids.items() if len(ids) <= max(8, len(self.keys) // 20)
+        }
+
+    def _finalize_trie(self, node: dict):
+        """Store each node's entries in suggestion order: names starting with the word, then shortest"""
+        for char, child in node.items():
+            if char is not None:
+                self._finalize_trie(child)
+        positions = node.get(None)
+        if positions is not None:
+            order = sorted(positions, key=lambda i: (positions[i] > 0, len(self.normalized[i]), i))
+            node[None] = (order, positions)
+
+    def _exact(self, normalized: str) -> Optional[int]:
+        return self.exact.get(normalized, self.exact.get(normalized.replace(" ", "")))
+
+    def _prefix_entries(self, token: str) -> tuple:
+        node = self.trie
+        for char in token:
+            node = node.get(char)
+            if node is None:
+                return (), {}
+        return node.get(None, ((), {}))
+
+    def _prefix_matches(self, tokens: List[str], limit: int) -> List[int]:
+        """Entries having a word starting with each query token, best first"""
+        entries = [self._prefix_entries(token) for token in tokens]
+        if len(entries) == 1:
+            return list(entries[0][0][:limit])
+        # Intersect starting from the rarest word, then rank by the first word's position
+        smallest = min((positions for _, positions in entries), key=len)
+        first = entries[0][1]
+        matches = [i for i in smallest if all(i in positions for _, positions in entries)]
+        matches.sort(key=lambda i: (first[i] > 0, len(self.normalized[i]), i))
+        return matches[:limit]
+
+    def _fuzzy_matches(self, normalized: str) -> List[tuple]:
+        """(similarity, id) of entries sharing enough trigrams with the query (Jaccard)"""
+        grams = trigrams(normalized)
+        candidates = set()
+        for gram in grams:
+            candidates.update(self.rare_trigram_ids.get(gram, ()))
+        scored = []
+        for i in candidates:
+            shared = len(grams & self.trigram_sets[i])
+            similarity = shared / (len(grams) + len(self.trigram_sets[i]) - shared)
+            if similarity >= INSTITUTION_FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, i))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """Best matches for a partial or misspelled institution name"""
+        tokens = institution_tokens(query or "")
+        if not tokens or limit <= 0:
+            return []
+        normalized = " ".join(tokens)
+        exact = self._exact(normalized)
+        ids = [exact] if exact is not None else []
+        ids.extend(i for i in self._prefix_matches(tokens, limit + 1) if i != exact)
+        del ids[limit:]
+        if ids:
+            return [{"key": self.keys[i], "name": self.names[i], "scor": 1.0} for i in ids]
+        # Nothing starts with what was typed: closest spellings
+        return [
+            {"key": self.keys[i], "name": self.names[i], "scor": round(similarity, 2)}
+            for similarity, i in self._fuzzy_matches(normalized)[:limit]
+        ]
+
+    def resolve(self, query: str) -> Optional[str]:
+        """
+        INSTITUTII_MAP key for a key, a display name, words that start only one name
+        or a spelling clearly closest to one; None for queries several institutions
+        fit equally ("Iasi", "Tribunalul", "sector").
+        """
+        tokens = institution_tokens(query or "")
+        if not tokens:
+            return None
+        normalized = " ".join(tokens)
+        exact = self._exact(normalized)
+        if exact is not None:
+            return self.keys[exact]
+        matches = self._prefix_matches(tokens, 2)
+        if matches:
+            return self.keys[matches[0]] if len(matches) == 1 else None
+        scored = self._fuzzy_matches(normalized)
+        if not scored or scored[0][0] < INSTITUTION_RESOLVE_MIN_SIMILARITY:
+            return None
+        if len(scored) > 1 and scored[0][0] - scored[1][0] < INSTITUTION_RESOLVE_MIN_MARGIN:
+            return None
+        return self.keys[scored[0][1]]
+
+institution_index = InstitutionIndex(INSTITUTII_MAP)
+
+def find_matching_institutie(search_term: str) -> Optional[str]:
+    """Find institution key by name with diacritic-insensitive matching"""
+    return institution_index.resolve(search_term)
+
+def resolve_institutie(institutie: Optional[str]) -> Optional[str]:
+    """INSTITUTII_MAP key for user input; unknown or ambiguous values are passed through unchanged"""
+    if not institutie or institutie in INSTITUTII_MAP:
+        return institutie
+    return institution_index.resolve(institutie) or institutie
+
 # ============== AUTH ROUTES ==============
 
 @api_router.post("/auth/register", response_model=TokenResponse)
@@ -619,26 +1762,652 @@ async def update_me(update_data: UserUpdate, user: dict = Depends(get_current_us
         email_notifications=updated_user.get("email_notifications", True)
     )
 
-# ============== DOSARE ROUTES ==============
+# ============== DATE-WINDOW SHARDING ==============
 
-@api_router.get("/institutii")
-async def get_institutii():
-    """Get list of available institutions with display names, sorted alphabetically"""
-    # Return both key and display name, sorted by display name
-    sorted_items = sorted(INSTITUTII_MAP.items(), key=lambda x: x[1])
-    return {
-        "institutii": [
-            {"key": key, "name": name}
-            for key, name in sorted_items
-        ]
-    }
+def should_shard_by_date(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                         institutie=None, data_start=None, data_stop=None) -> bool:
+    """Only broad obiect / parte searches over a long explicit date range are split"""
+    if numar_dosar or not (obiect_dosar or nume_parte) or not (data_start and data_stop):
+        return False
+    span = datetime.fromisoformat(data_stop).date() - datetime.fromisoformat(data_start).date()
+    return span.days >= DATE_SHARD_MIN_DAYS
 
-@api_router.post("/dosare/search")
-async def search_dosare(request: CautareDosarRequest):
-    """Search for cases using just.ro API - PUBLIC (no auth required)"""
+def split_date_range(start: date, stop: date, window_days: int) -> list:
+    """
+    Consecutive (start, stop) windows covering [start, stop]. Neighbouring
+    windows share their boundary day, so nothing is lost whether the portal
+    treats dataStop as inclusive or exclusive; duplicates are merged later.
+    """
+    windows = []
+    window_start = start
+    while True:
+        window_stop = min(window_start + timedelta(days=window_days), stop)
+        windows.append((window_start, window_stop))
+        if window_stop >= stop:
+            return windows
+        window_start = window_stop
+
+async def gather_or_cancel(*aws) -> list:
+    """asyncio.gather that cancels the remaining awaitables as soon as one of them raises"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
     try:
-        # Validate date format if provided
-        if request.data_start:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def search_date_sharded(numar_dosar=None, obiect_dosar=None, nume_parte=None,
+                              institutie=None, data_start=None, data_stop=None):
+    """
+    Run one CautareDosare per date window, concurrently. A window that comes
+    back with PORTAL_MAX_RESULTS cases was probably truncated by the portal,
+    so it is split in half and queried again, down to a single day, as long as
+    the search stays within DATE_SHARD_MAX_CALLS upstream calls; past that the
+    truncated window is kept and the result is marked incomplete (too broad).
+    The first upstream failure cancels the windows still running.
+    Returns the merged cases (de-duplicated by numar + institutie) and shard stats.
+    """
+    start = datetime.fromisoformat(data_start).date()
+    stop = datetime.fromisoformat(data_stop).date()
+    window_days = max(DATE_SHARD_WINDOW_DAYS, -(-(stop - start).days // DATE_SHARD_MAX_WINDOWS))
+    windows = split_date_range(start, stop, window_days)
+    semaphore = asyncio.Semaphore(DATE_SHARD_CONCURRENCY)
+    budget = max(DATE_SHARD_MAX_CALLS, len(windows))
+    calls = len(windows)  # upstream calls started or reserved
+    stats = {"windows": 0, "splits": 0, "truncated_windows": 0, "budget_exhausted": False}
+    
+    async def run_window(window_start: date, window_stop: date) -> list:
+        nonlocal calls
+        async with semaphore:
+            stats["windows"] += 1
+            results = await async_cautare_dosare(
+                numar_dosar, obiect_dosar, nume_parte, institutie,
+                window_start.isoformat(), window_stop.isoformat()
+            )
+        span = (window_stop - window_start).days
+        if len(results) < PORTAL_MAX_RESULTS:
+            return results
+        if span == 0 or calls + 2 > budget:
+            stats["truncated_windows"] += 1
+            stats["budget_exhausted"] = stats["budget_exhausted"] or span > 0
+            return results
+        calls += 2
+        stats["splits"] += 1
+        middle = window_start + timedelta(days=span // 2)
+        halves = await gather_or_cancel(
+            run_window(window_start, middle),
+            run_window(middle if span > 1 else window_stop, window_stop)
+        )
+        return halves[0] + halves[1]
+    
+    parts = await gather_or_cancel(*(
+        run_window(window_start, window_stop) for window_start, window_stop in windows
+    ))
+    
+    merged = []
+    seen = set()
+    for results in parts:
+        for dosar in results:
+            if not isinstance(dosar, dict):
+                continue
+            case_key = (dosar.get("numar"), str(dosar.get("institutie")))
+            if case_key not in seen:
+                seen.add(case_key)
+                merged.append(dosar)
+    stats["complete"] = stats["truncated_windows"] == 0
+    return merged, stats
+
+# ============== INSTITUTION FAN-OUT ==============
+
+INSTITUTII_GROUPS = {
+    "curti_apel": "CurteadeApel",
+    "tribunale": "Tribunalul",
+    "judecatorii": "Judecatoria",
+}
+
+def resolve_fanout_institutii(group: Optional[str], institutii: Optional[List[str]]) -> List[str]:
+    """INSTITUTII_MAP keys to query: an explicit list (keys or names), a group, or every court ("toate")"""
+    if institutii:
+        return [key for key in dict.fromkeys(map(resolve_institutie, institutii)) if key in INSTITUTII_MAP]
+    if group == "toate":
+        return list(INSTITUTII_MAP)
+    prefix = INSTITUTII_GROUPS.get(group or "")
+    if prefix is None:
+        return []
+    return [key for key in INSTITUTII_MAP if key.startswith(prefix)]
+
+class CourtLatencyTracker:
+    """
+    Exponentially weighted upstream latency per court. Fan-out searches start
+    the slowest courts first so they don't end up as the tail of the request;
+    courts never seen before are treated as slow, so they get measured early.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self._latency: Dict[str, float] = {}
+
+    def observe(self, institutie: str, latency_ms: float):
+        previous = self._latency.get(institutie)
+        self._latency[institutie] = latency_ms if previous is None else (
+            self.alpha * latency_ms + (1 - self.alpha) * previous
+        )
+
+    def slowest_first(self, institutii: List[str]) -> List[str]:
+        return sorted(institutii, key=lambda key: self._latency.get(key, float("inf")), reverse=True)
+
+    def stats(self) -> dict:
+        return {key: round(value, 1) for key, value in
+                sorted(self._latency.items(), key=lambda item: item[1], reverse=True)}
+
+court_latency = CourtLatencyTracker()
+institution_fanout_semaphore = asyncio.Semaphore(INSTITUTION_FANOUT_CONCURRENCY)
+
+async def iter_institution_fanout(institutii: List[str], numar_dosar=None, obiect_dosar=None,
+                                  nume_parte=None, data_start=None, data_stop=None) -> AsyncIterator[tuple]:
+    """
+    Query every court in `institutii` (slowest first, within the global budget)
+    and yield (institutie, results, error, latency_ms) as each court answers.
+    Closing the iterator cancels the courts still pending.
+    """
+    async def search_court(key: str):
+        async with institution_fanout_semaphore:
+            start = time.perf_counter()
+            try:
+                results, error = await async_cautare_dosare(
+                    numar_dosar, obiect_dosar, nume_parte, key, data_start, data_stop
+                ), None
+            except Exception as e:
+                results, error = [], e
+            latency_ms = round((time.perf_counter() - start) * 1000, 1)
+            if error is None:
+                court_latency.observe(key, latency_ms)
+            return key, results, error, latency_ms
+    
+    tasks = [asyncio.ensure_future(search_court(key)) for key in court_latency.slowest_first(institutii)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def ndjson_line(payload: dict) -> bytes:
+    return dumps_json(payload) + b"\n"
+
+def sse_event(payload: dict) -> bytes:
+    """Server-Sent Event named after the payload type"""
+    event = str(payload.get("type", "message")).encode("utf-8")
+    return b"event: " + event + b"\ndata: " + dumps_json(payload) + b"\n\n"
+
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+# ============== COURT-CODE ROUTING ==============
+# The middle segment of a case number (123/3/2024) is the numeric code of the
+# court where the case was registered. Number searches without an institutie
+# are sent to that court instead of a national lookup; if it returns nothing
+# (unknown or wrongly learned code) the national search runs as before.
+# A targeted query only returns the registering court's record, so when that
+# record lists appeals (caiAtac) the national lookup runs too, to also return
+# the appeal records at higher courts.
+
+CASE_NUMBER_PATTERN = re.compile(r'^\s*\d+/(\d+)/\d{4}\s*$')
+
+# Codes confirmed against portal.just.ro; everything else is learned from national results
+COURT_CODES_SEED = {
+    "2": "CurteadeApelBUCURESTI",
+    "3": "TribunalulBUCURESTI",
+    "299": "JudecatoriaSECTORUL1BUCURESTI",
+    "300": "JudecatoriaSECTORUL2BUCURESTI",
+    "301": "JudecatoriaSECTORUL3BUCURESTI",
+    "4": "JudecatoriaSECTORUL4BUCURESTI",
+    "302": "JudecatoriaSECTORUL5BUCURESTI",
+    "303": "JudecatoriaSECTORUL6BUCURESTI",
+}
+
+def court_code(numar: Optional[str]) -> Optional[str]:
+    """Court code from a case number, None if it isn't one"""
+    match = CASE_NUMBER_PATTERN.match(numar or "")
+    return str(int(match.group(1))) if match else None
+
+def court_tier(institutie: str) -> int:
+    """0 = judecătorie, 1 = tribunal, 2 = curte de apel"""
+    if institutie.startswith("Judecatoria"):
+        return 0
+    if institutie.startswith("Tribunalul"):
+        return 1
+    return 2
+
+class CourtCodeRouter:
+    """
+    Court code -> INSTITUTII_MAP key table used to target case-number searches.
+    Learned from national lookups (the lowest-tier court listing a number is
+    the one that registered it) and persisted in the `court_codes` collection.
+    """
+
+    def __init__(self, collection, seed: Dict[str, str]):
+        self.collection = collection
+        self._codes: Dict[str, str] = dict(seed)
+        self.learned = 0
+        self.targeted = 0
+        self.targeted_hits = 0
+        self.fallbacks = 0
+        self.appealed = 0
+        self.national = 0
+
+    def route(self, numar: str) -> Optional[str]:
+        code = court_code(numar)
+        return self._codes.get(code) if code else None
+
+    def learn(self, numar: str, results: list):
+        """Record the registering court of `numar` from national lookup results"""
+        code = court_code(numar)
+        if not code:
+            return
+        searched = numar.strip()
+        courts = [
+            dosar.get("institutie") for dosar in results
+            if dosar and (dosar.get("numar") or "").strip() == searched
+            and dosar.get("institutie") in INSTITUTII_MAP
+        ]
+        if not courts:
+            return
+        institutie = min(courts, key=court_tier)
+        if self._codes.get(code) != institutie:
+            self._codes[code] = institutie
+            self.learned += 1
+            spawn_background(self._persist(code, institutie))
+
+    async def _persist(self, code: str, institutie: str):
+        try:
+            await self.collection.replace_one(
+                {"_id": code},
+                {"_id": code, "institutie": institutie, "updated_at": datetime.now(timezone.utc)},
+                upsert=True
+            )
+        except Exception as e:
+            logging.warning(f"Court code write failed: {e}")
+
+    async def load(self):
+        async for doc in self.collection.find({}):
+            if doc.get("institutie") in INSTITUTII_MAP:
+                self._codes[doc["_id"]] = doc["institutie"]
+
+    def stats(self) -> dict:
+        return {
+            "enabled": COURT_ROUTING,
+            "known_codes": len(self._codes),
+            "learned": self.learned,
+            "targeted": self.targeted,
+            "targeted_hits": self.targeted_hits,
+            "fallbacks": self.fallbacks,
+            "appealed": self.appealed,
+            "national": self.national
+        }
+
+court_router = CourtCodeRouter(db.court_codes, COURT_CODES_SEED)
+
+async def search_case_number(numar: str, institutie: Optional[str] = None,
+                             cache_ttl: int = SEARCH_CACHE_TTL_SEARCH) -> list:
+    """
+    CautareDosare for one case number. Without an institutie the query goes to
+    the court coded in the number first and falls back to a national lookup,
+    which also runs when the case was appealed (its records at higher courts).
+    """
+    numar = numar.strip()
+    if institutie:
+        return await async_cautare_dosare(numar_dosar=numar, institutie=institutie, cache_ttl=cache_ttl)
+    
+    routed = court_router.route(numar) if COURT_ROUTING else None
+    if routed:
+        court_router.targeted += 1
+        results = await async_cautare_dosare(numar_dosar=numar, institutie=routed, cache_ttl=cache_ttl)
+        if results:
+            court_router.targeted_hits += 1
+            appealed = any(
+                soap_items(dosar.get("caiAtac"), "DosarCaleAtac") for dosar in results if isinstance(dosar, dict)
+            )
+            if not appealed:
+                return results
+            court_router.appealed += 1
+        else:
+            court_router.fallbacks += 1
+    else:
+        court_router.national += 1
+    
+    results = await async_cautare_dosare(numar_dosar=numar, cache_ttl=cache_ttl)
+    court_router.learn(numar, results)
+    return results
+
+# ============== SEARCH SESSIONS ==============
+# The first request of a search runs the upstream queries and stores the
+# processed, sorted result set under a search_id. Later pages, sorts and
+# filters are served from that set without touching just.ro. Sessions are
+# kept in this process and shared through MongoDB, so any worker can serve the
+# next page or the export; an unknown or expired search_id just runs the search again.
+
+class SearchSession:
+    """Processed result set of one search plus the response fields shared by all its pages"""
+
+    def __init__(self, kind: str, rows_key: str, rows: list, extra: dict, max_page_size: int,
+                 session_id: Optional[str] = None):
+        self.id = session_id or uuid.uuid4().hex
+        self.kind = kind
+        self.rows_key = rows_key
+        self.rows = rows
+        self.extra = extra
+        self.max_page_size = max_page_size
+        self.last_used = time.monotonic()
+        self.shared_at: Optional[float] = None  # when the shared copy's expiry was last pushed back
+        self._haystacks: Optional[List[str]] = None
+        self._views: "OrderedDict[tuple, list]" = OrderedDict()
+
+    def view(self, sort_by: Optional[str], sort_desc: bool, filtru: Optional[str]) -> list:
+        """Rows filtered and sorted as requested; the last few views are memoized"""
+        filtru = normalize_diacritics(filtru.strip()) if filtru else ""
+        if sort_by and (not self.rows or sort_by not in self.rows[0]):
+            sort_by = None
+        if not sort_by and not filtru:
+            return self.rows
+        view_key = (sort_by, sort_desc, filtru)
+        rows = self._views.get(view_key)
+        if rows is None:
+            rows = self.rows
+            if filtru:
+                if self._haystacks is None:
+                    self._haystacks = normalize_diacritics_batch([
+                        " ".join(str(value) for value in row.values() if value and not isinstance(value, list))
+                        for row in self.rows
+                    ])
+                rows = [row for row, haystack in zip(self.rows, self._haystacks) if filtru in haystack]
+            if sort_by:
+                rows = sorted(rows, key=lambda row: str(row.get(sort_by) or ""), reverse=sort_desc)
+            self._views[view_key] = rows
+            while len(self._views) > 4:
+                self._views.popitem(last=False)
+        self._views.move_to_end(view_key)
+        return rows
+
+class SearchSessionStore:
+    """
+    Two-tier store of search sessions.
+    Tier 1 is an in-process LRU bounded by idle time, session count and total
+    rows; tier 2 is the shared `search_sessions` collection (rows JSON-encoded in
+    chunks in `search_session_rows`), so every uvicorn worker can page and export
+    a search started on another one. Both tiers expire SEARCH_SESSION_TTL after last use.
+    """
+
+    def __init__(self, collection, rows_collection, ttl: int, max_sessions: int, max_rows: int):
+        self.collection = collection
+        self.rows_collection = rows_collection
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_rows = max_rows
+        self._sessions: "OrderedDict[str, SearchSession]" = OrderedDict()
+        self._rows = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.expired = 0
+        self.evictions = 0
+        self.rejected = 0
+        self.write_errors = 0
+
+    def create(self, kind: str, rows_key: str, rows: list, extra: dict, max_page_size: int) -> Optional[SearchSession]:
+        """Store a result set; None if it alone exceeds the row budget"""
+        return self.add(SearchSession(kind, rows_key, rows, extra, max_page_size))
+
+    def add(self, session: SearchSession) -> Optional[SearchSession]:
+        if not self._store(session):
+            return None
+        spawn_background(self._store_shared(session))
+        return session
+
+    def _store(self, session: SearchSession) -> bool:
+        if len(session.rows) > self.max_rows:
+            self.rejected += 1
+            return False
+        self._purge_expired()
+        session.last_used = time.monotonic()
+        self._sessions[session.id] = session
+        self._rows += len(session.rows)
+        while len(self._sessions) > self.max_sessions or self._rows > self.max_rows:
+            _, evicted = self._sessions.popitem(last=False)
+            self._rows -= len(evicted.rows)
+            self.evictions += 1
+        return True
+
+    async def get(self, search_id: str, kind: str) -> Optional[SearchSession]:
+        session = self._sessions.get(search_id)
+        if session is not None and time.monotonic() - session.last_used > self.ttl:
+            self._drop(search_id)
+            self.expired += 1
+            session = None
+        if session is not None:
+            if session.kind != kind:
+                return None
+            session.last_used = time.monotonic()
+            self._sessions.move_to_end(search_id)
+            self.hits += 1
+            # Keep the shared copy alive for the other workers, at most every tenth of the TTL
+            if session.shared_at is not None and session.last_used - session.shared_at > self.ttl / 10:
+                session.shared_at = session.last_used
+                spawn_background(self._touch_shared(session.id))
+            return session
+        
+        if not search_id:
+            return None
+        session = await self._load_shared(search_id, kind)
+        if session is None or not self._store(session):
+            return None
+        self.shared_hits += 1
+        return session
+
+    async def _store_shared(self, session: SearchSession):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        try:
+            chunks = [session.rows[start:start + SEARCH_SESSION_CHUNK_ROWS]
+                      for start in range(0, len(session.rows), SEARCH_SESSION_CHUNK_ROWS)]
+            if chunks:
+                await self.rows_collection.insert_many([
+                    {"session_id": session.id, "index": index, "rows": dumps_json(chunk), "expires_at": expires_at}
+                    for index, chunk in enumerate(chunks)
+                ])
+            # Written last: a session is visible only once all its rows are
+            await self.collection.insert_one({
+                "_id": session.id, "kind": session.kind, "rows_key": session.rows_key,
+                "extra": dumps_json(session.extra), "max_page_size": session.max_page_size,
+                "chunks": len(chunks), "expires_at": expires_at
+            })
+            session.shared_at = time.monotonic()
+        except Exception as e:
+            # Oversized or unencodable result sets stay in this worker only
+            self.write_errors += 1
+            logging.warning(f"Search session write failed: {e}")
+
+    async def _touch_shared(self, search_id: str):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        try:
+            await self.collection.update_one({"_id": search_id}, {"$set": {"expires_at": expires_at}})
+            await self.rows_collection.update_many({"session_id": search_id}, {"$set": {"expires_at": expires_at}})
+        except Exception as e:
+            logging.warning(f"Search session touch failed: {e}")
+
+    async def _load_shared(self, search_id: str, kind: str) -> Optional[SearchSession]:
+        try:
+            doc = await self.collection.find_one({"_id": search_id, "kind": kind})
+            # The TTL monitor runs about once a minute; don't serve what it hasn't removed yet
+            if not doc or doc["expires_at"].replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc):
+                return None
+            chunks = await self.rows_collection.find({"session_id": search_id}).sort("index", 1).to_list(None)
+        except Exception as e:
+            logging.warning(f"Search session lookup failed: {e}")
+            return None
+        if len(chunks) != doc["chunks"]:
+            return None
+        rows = [row for chunk in chunks for row in orjson.loads(chunk["rows"])]
+        session = SearchSession(doc["kind"], doc["rows_key"], rows, orjson.loads(doc["extra"]),
+                                doc["max_page_size"], session_id=search_id)
+        session.shared_at = time.monotonic()
+        return session
+
+    def _drop(self, search_id: str):
+        session = self._sessions.pop(search_id, None)
+        if session is not None:
+            self._rows -= len(session.rows)
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        for search_id in [sid for sid, s in self._sessions.items() if now - s.last_used > self.ttl]:
+            self._drop(search_id)
+            self.expired += 1
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        await self.rows_collection.create_index([("session_id", 1), ("index", 1)])
+        await self.rows_collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self._sessions),
+            "rows": self._rows,
+            "max_sessions": self.max_sessions,
+            "max_rows": self.max_rows,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+            "write_errors": self.write_errors
+        }
+
+search_sessions = SearchSessionStore(db.search_sessions, db.search_session_rows, SEARCH_SESSION_TTL,
+                                     SEARCH_SESSION_MAX_SESSIONS, SEARCH_SESSION_MAX_ROWS)
+
+def encode_cursor(search_id: str, offset: int, page_size: int,
+                  sort_by: Optional[str], sort_desc: bool, filtru: Optional[str]) -> str:
+    state = {"s": search_id, "o": offset, "n": page_size, "b": sort_by, "d": sort_desc, "f": filtru}
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> Optional[dict]:
+    """Paging state of a cursor; None for anything encode_cursor couldn't have produced"""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        return None
+    if not isinstance(state, dict):
+        return None
+    
+    def count(value) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+    
+    valid = (
+        isinstance(state.get("s"), str)
+        and count(state.get("o")) and count(state.get("n"))
+        and isinstance(state.get("b"), (str, type(None)))
+        and isinstance(state.get("f"), (str, type(None)))
+        and isinstance(state.get("d"), bool)
+    )
+    return state if valid else None
+
+def search_session_state(request: SearchSessionParams) -> Optional[dict]:
+    """Paging state of a request: from its cursor, else from search_id / page / sort / filter"""
+    if request.cursor:
+        state = decode_cursor(request.cursor)
+        if state is not None:
+            return state
+    if not request.search_id:
+        return None
+    return {"s": request.search_id, "o": None, "b": request.sort_by, "d": request.sort_desc, "f": request.filtru}
+
+def search_session_page(session: SearchSession, request: SearchSessionParams, state: Optional[dict]) -> dict:
+    """One page of a stored search, with cursors for the neighbouring pages"""
+    if state is None:
+        state = {"o": None, "b": request.sort_by, "d": request.sort_desc, "f": request.filtru}
+    rows = session.view(state.get("b"), bool(state.get("d")), state.get("f"))
+    page_size = min(max(1, state.get("n") or request.page_size), session.max_page_size)
+    offset = state["o"] if state.get("o") is not None else (max(1, request.page) - 1) * page_size
+    offset = max(0, offset)
+    total_count = len(rows)
+    
+    def cursor(at: int) -> str:
+        return encode_cursor(session.id, at, page_size, state.get("b"), bool(state.get("d")), state.get("f"))
+    
+    return {
+        **session.extra,
+        session.rows_key: rows[offset:offset + page_size],
+        "total_count": total_count,
+        "page": offset // page_size + 1,
+        "page_size": page_size,
+        "total_pages": max(1, (total_count + page_size - 1) // page_size),
+        "search_id": session.id,
+        "next_cursor": cursor(offset + page_size) if offset + page_size < total_count else None,
+        "prev_cursor": cursor(max(0, offset - page_size)) if offset > 0 else None
+    }
+
+async def resume_search_session(request: SearchSessionParams, kind: str) -> Optional[dict]:
+    """Page of the stored search the request refers to, None if it has to run again"""
+    state = search_session_state(request)
+    if state is None:
+        return None
+    session = await search_sessions.get(state.get("s") or "", kind)
+    if session is None:
+        return None
+    return search_session_page(session, request, state)
+
+def new_search_session_page(request: SearchSessionParams, kind: str, rows_key: str, rows: list,
+                            extra: dict, max_page_size: int) -> dict:
+    """Store a freshly computed result set and return the requested page of it"""
+    session = search_sessions.create(kind, rows_key, rows, extra, max_page_size)
+    if session is None:
+        # Too large to keep: serve this page only, later pages will run the search again
+        session = SearchSession(kind, rows_key, rows, extra, max_page_size)
+        response = search_session_page(session, request, search_session_state(request))
+        response.update(search_id=None, next_cursor=None, prev_cursor=None)
+        return response
+    return search_session_page(session, request, search_session_state(request))
+
+# ============== DOSARE ROUTES ==============
+
+def term_limit_notice(count: int) -> dict:
+    """Response fields telling the client that only the first INTERACTIVE_MAX_TERMS terms were searched"""
+    if count <= INTERACTIVE_MAX_TERMS:
+        return {}
+    return {
+        "truncated": True,
+        "termeni_ignorati": count - INTERACTIVE_MAX_TERMS,
+        "mesaj": f"Au fost căutați doar primii {INTERACTIVE_MAX_TERMS} termeni. "
+                 f"Pentru liste mai lungi folosiți căutarea în fundal (/api/dosare/jobs)"
+    }
+
+@api_router.get("/institutii")
+async def get_institutii():
+    """Get list of available institutions with display names, sorted alphabetically"""
+    # Return both key and display name, sorted by display name
+    sorted_items = sorted(INSTITUTII_MAP.items(), key=lambda x: x[1])
+    return {
+        "institutii": [
+            {"key": key, "name": name}
+            for key, name in sorted_items
+        ]
+    }
+
+@api_router.get("/institutii/suggest")
+async def suggest_institutii(q: str = "", limit: int = 10):
+    """Autocomplete for institutions: prefix, diacritic- and typo-tolerant ("sector 3", "trib iasi", "Bufta")"""
+    return {"institutii": institution_index.suggest(q, max(1, min(limit, 50)))}
+
+@dosare_router.post("/search", response_model=DosareSearchResponse)
+async def search_dosare(request: CautareDosarRequest, http_request: Request):
+    """Search for cases using just.ro API - PUBLIC (no auth required)"""
+    return await cancel_on_disconnect(http_request, run_search_dosare(request))
+
+async def run_search_dosare(request: CautareDosarRequest):
+    stored = await resume_search_session(request, "dosare")
+    if stored is not None:
+        return stored
+    try:
+        # Validate date format if provided
+        if request.data_start:
             try:
                 datetime.fromisoformat(request.data_start)
             except ValueError:
@@ -650,7 +2419,7 @@ async def search_dosare(request: CautareDosarRequest):
             except ValueError:
                 return {"error": "Format invalid pentru data_stop. Folosiți YYYY-MM-DD"}
         
-        results = await async_cautare_dosare(
+        search_params = dict(
             numar_dosar=request.numar_dosar if request.numar_dosar else None,
             obiect_dosar=request.obiect_dosar if request.obiect_dosar else None,
             nume_parte=request.nume_parte if request.nume_parte else None,
@@ -658,6 +2427,24 @@ async def search_dosare(request: CautareDosarRequest):
             data_start=request.data_start if request.data_start else None,
             data_stop=request.data_stop if request.data_stop else None
         )
+        shards = None
+        fan_out = None
+        fanout_institutii = [] if request.institutie else resolve_fanout_institutii(
+            request.fan_out_institutii, request.institutii
+        )
+        if fanout_institutii:
+            search_params.pop("institutie")
+            results = []
+            fan_out = {"courts": len(fanout_institutii), "errors": [], "degraded": False}
+            async for key, court_results, error, _ in iter_institution_fanout(fanout_institutii, **search_params):
+                if error is not None:
+                    fan_out["errors"].append({"institutie": key, "error": str(error)})
+                    fan_out["degraded"] = fan_out["degraded"] or isinstance(error, UpstreamUnavailableError)
+                results.extend(court_results)
+        elif request.shard_by_date and should_shard_by_date(**search_params):
+            results, shards = await search_date_sharded(**search_params)
+        else:
+            results = await async_cautare_dosare(**search_params)
         
         # Process and sort results by date descending
         processed = []
@@ -671,117 +2458,355 @@ async def search_dosare(request: CautareDosarRequest):
         # Sort by data descending (most recent first)
         processed.sort(key=lambda x: x.get("data", "") if isinstance(x, dict) else "", reverse=True)
         
-        # Pagination
-        total_count = len(processed)
-        page = max(1, request.page)
-        page_size = min(max(1, request.page_size), 20)  # Max 20 per page
-        total_pages = max(1, (total_count + page_size - 1) // page_size)
-        
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_results = processed[start_idx:end_idx]
-        
-        return {
-            "results": paginated_results,
-            "total_count": total_count,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages
-        }
+        extra = {}
+        if shards:
+            extra["shards"] = shards
+            if shards["budget_exhausted"]:
+                extra["truncated"] = True
+                extra["mesaj"] = ("Căutarea este prea largă: unele intervale au depășit limita portalului. "
+                                  "Restrângeți intervalul de date sau adăugați criterii.")
+        if fan_out:
+            extra["fan_out"] = fan_out
+            extra["degraded"] = fan_out["degraded"]
+        # Max 20 per page
+        return new_search_session_page(request, "dosare", "results", processed, extra, max_page_size=20)
+    except UpstreamUnavailableError as e:
+        return {"error": str(e), "degraded": True}
     except Exception as e:
         logging.error(f"Search error: {e}")
         return {"error": f"Eroare la căutare: {str(e)}"}
 
-@api_router.post("/dosare/search/bulk")
-async def search_dosare_bulk(request: BulkSearchRequest):
+@dosare_router.post("/search/institutii/stream")
+async def search_dosare_institutii_stream(request: CautareDosarRequest):
+    """
+    Search fanned out across courts - PUBLIC (no auth required).
+    Streams NDJSON: one "court" line per court as soon as it answers
+    (slowest courts are started first), then a "summary" line.
+    """
+    institutii = resolve_fanout_institutii(request.fan_out_institutii or "toate", request.institutii)
+    for field in ("data_start", "data_stop"):
+        value = getattr(request, field)
+        if value:
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                return {"error": f"Format invalid pentru {field}. Folosiți YYYY-MM-DD"}
+    
+    async def stream():
+        total_count = 0
+        errors = 0
+        degraded = False
+        started = time.perf_counter()
+        async for key, results, error, latency_ms in iter_institution_fanout(
+            institutii,
+            numar_dosar=request.numar_dosar or None,
+            obiect_dosar=request.obiect_dosar or None,
+            nume_parte=request.nume_parte or None,
+            data_start=request.data_start or None,
+            data_stop=request.data_stop or None
+        ):
+            processed = [process_dosar(dosar) for dosar in results if dosar]
+            processed.sort(key=lambda x: x.get("data", "") or "", reverse=True)
+            total_count += len(processed)
+            line = {
+                "type": "court",
+                "institutie": key,
+                "instanta": INSTITUTII_MAP.get(key, key),
+                "results": processed,
+                "latency_ms": latency_ms
+            }
+            if error is not None:
+                errors += 1
+                degraded = degraded or isinstance(error, UpstreamUnavailableError)
+                line["error"] = str(error)
+            yield ndjson_line(line)
+        yield ndjson_line({
+            "type": "summary",
+            "courts": len(institutii),
+            "total_count": total_count,
+            "errors": errors,
+            "degraded": degraded,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        })
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@dosare_router.post("/search/bulk", response_model=DosareSearchResponse)
+async def search_dosare_bulk(request: BulkSearchRequest, http_request: Request):
     """Bulk search for cases - PUBLIC (no auth required)"""
+    return await cancel_on_disconnect(http_request, run_search_dosare_bulk(request))
+
+async def run_search_dosare_bulk(request: BulkSearchRequest):
+    stored = await resume_search_session(request, "bulk")
+    if stored is not None:
+        return stored
     if not request.numere_dosare:
         return {"error": "Lista de numere dosare este goală"}
     
     results = []
     errors = []
+    timings = []
     
-    for numar in request.numere_dosare[:50]:  # Limit to 50
-        try:
-            dosar_results = await async_cautare_dosare(
-                numar_dosar=numar.strip(),
-                institutie=request.institutie if request.institutie else None
-            )
-            if dosar_results:
-                for dosar in dosar_results:
-                    if dosar:
-                        processed = process_dosar(dosar)
-                        processed["searched_number"] = numar
-                        results.append(processed)
-            else:
-                errors.append({"numar": numar, "error": "Negăsit"})
-        except Exception as e:
-            errors.append({"numar": numar, "error": str(e)})
+    numere = request.numere_dosare[:INTERACTIVE_MAX_TERMS]
+    outcomes = await gather_bounded(
+        numere,
+        lambda numar: search_case_number(numar, request.institutie or None),
+        resolve_concurrency(request.concurrency, BULK_SEARCH_CONCURRENCY)
+    )
+    
+    for numar, (dosar_results, error, latency_ms) in zip(numere, outcomes):
+        timings.append({"numar": numar, "latency_ms": latency_ms})
+        if error is not None:
+            errors.append({"numar": numar, "error": str(error)})
+        elif dosar_results:
+            for dosar in dosar_results:
+                if dosar:
+                    processed = process_dosar(dosar)
+                    processed["searched_number"] = numar
+                    results.append(processed)
+        else:
+            errors.append({"numar": numar, "error": "Negăsit"})
     
     # Sort by data descending
     results.sort(key=lambda x: x.get("data", "") or "", reverse=True)
     
-    # Pagination
-    total_count = len(results)
-    page = max(1, request.page)
-    page_size = min(max(1, request.page_size), 20)
-    total_pages = max(1, (total_count + page_size - 1) // page_size)
-    
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_results = results[start_idx:end_idx]
-    
-    return {
-        "results": paginated_results,
-        "total_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-        "errors": errors
-    }
+    return new_search_session_page(request, "bulk", "results", results, {
+        "errors": errors,
+        "timings": timings,
+        "degraded": any(isinstance(error, UpstreamUnavailableError) for _, error, _ in outcomes),
+        **term_limit_notice(len(request.numere_dosare))
+    }, max_page_size=20)
 
-@api_router.post("/dosare/search/csv")
-async def search_dosare_csv(file: UploadFile = File(...)):
-    """Search cases from CSV file - PUBLIC (no auth required)"""
-    if not file.filename.endswith('.csv'):
-        return {"error": "Fișierul trebuie să fie CSV"}
-    
+@dosare_router.post("/search/csv", response_model=DosareSearchResponse)
+async def search_dosare_csv(http_request: Request, file: UploadFile = File(...), concurrency: Optional[int] = None):
+    """Search cases from a CSV / TXT / XLSX file (first column) - PUBLIC (no auth required)"""
+    return await cancel_on_disconnect(http_request, run_search_dosare_csv(file, concurrency))
+
+class _LineFeed:
+    """Iterator over lines appended as the upload arrives; csv.reader can resume on it after it runs dry"""
+
+    def __init__(self):
+        self.lines = []
+        self._pos = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if self._pos >= len(self.lines):
+            self.lines.clear()
+            self._pos = 0
+            raise StopIteration
+        self._pos += 1
+        return self.lines[self._pos - 1]
+
+def split_complete_records(text: str) -> tuple:
+    """(complete, rest) of CSV text, cut at its last newline outside a quoted cell"""
+    lines = text.split("\n")
+    inside_quotes = False
+    cut = 0
+    for index, line in enumerate(lines[:-1]):
+        # Escaped quotes come in pairs, so an odd count toggles between inside and outside a cell
+        inside_quotes ^= line.count('"') % 2 == 1
+        if not inside_quotes:
+            cut = index + 1
+    return "\n".join(lines[:cut]), "\n".join(lines[cut:])
+
+def detect_upload_decoder(head: bytes):
+    """Incremental decoder for an upload: BOM, else UTF-8 if the first chunk is valid UTF-8, else cp1250"""
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return codecs.getincrementaldecoder("utf-16")()
+    try:
+        codecs.getincrementaldecoder("utf-8-sig")().decode(head, final=False)
+        return codecs.getincrementaldecoder("utf-8-sig")()
+    except UnicodeDecodeError:
+        return codecs.getincrementaldecoder(UPLOAD_FALLBACK_ENCODING)(errors="replace")
+
+def sniff_delimiter(sample: str) -> str:
     try:
-        content = await file.read()
-        decoded = content.decode('utf-8')
+        return csv.Sniffer().sniff(sample, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+async def iter_csv_first_column(file: UploadFile) -> AsyncIterator[Any]:
+    """First cell of every CSV / TXT row, decoded and parsed chunk by chunk"""
+    decoder = None
+    reader = None
+    feed = _LineFeed()
+    pending = ""
+    while True:
+        chunk = await file.read(UPLOAD_READ_CHUNK_SIZE)
+        if decoder is None:
+            if not chunk:
+                return
+            decoder = detect_upload_decoder(chunk)
+        try:
+            text = decoder.decode(chunk, final=not chunk)
+        except UnicodeDecodeError:
+            # UTF-8 at the start but not here: the file is in the legacy code page after all.
+            # The failed call left the decoder as it was, so its state still holds the bytes
+            # of the previous chunk it kept back as the start of a character
+            held, _ = decoder.getstate()
+            decoder = codecs.getincrementaldecoder(UPLOAD_FALLBACK_ENCODING)(errors="replace")
+            text = decoder.decode(held + chunk, final=not chunk)
+        pending += text
+        
+        if reader is None:
+            if len(pending) < 4096 and chunk:
+                continue
+            reader = csv.reader(feed, delimiter=sniff_delimiter(pending[:4096]))
+        if chunk:
+            # The reader must not run dry inside a quoted cell, or it would end the record there
+            complete, rest = split_complete_records(pending)
+            if len(rest) > UPLOAD_READ_CHUNK_SIZE * 16:
+                # A stray quote rather than a multi-line cell: cut at line ends again
+                complete, _, rest = pending.rpartition("\n")
+            pending = rest
+        else:
+            complete, pending = pending, ""
+        feed.lines.extend(complete.splitlines())
+        for row in reader:
+            if row:
+                yield row[0]
+        if not chunk:
+            return
+
+async def iter_xlsx_first_column(file: UploadFile) -> AsyncIterator[Any]:
+    """First cell of every row of the first sheet, read in openpyxl's streaming read-only mode"""
+    loop = asyncio.get_event_loop()
+    try:
+        workbook = await loop.run_in_executor(
+            executor, lambda: openpyxl.load_workbook(file.file, read_only=True, data_only=True)
+        )
     except Exception:
-        return {"error": "Eroare la citirea fișierului"}
+        raise ValueError("Eroare la citirea fișierului")
+    try:
+        rows = workbook.worksheets[0].iter_rows(max_col=1, values_only=True)
+        
+        def take() -> list:
+            return [row[0] if row else None for row in itertools.islice(rows, 500)]
+        
+        row_number = 0
+        while batch := await loop.run_in_executor(executor, take):
+            for value in batch:
+                row_number += 1
+                if isinstance(value, date):
+                    # Excel turned a number like 1/3/2024 into a date; the text it displayed is not stored
+                    raise ValueError(
+                        f"Rândul {row_number} conține o dată calendaristică în loc de un număr de dosar. "
+                        f"Formatați prima coloană ca Text în Excel și reintroduceți numerele"
+                    )
+                yield value
+    finally:
+        workbook.close()
+
+async def iter_upload_numere(file: UploadFile) -> AsyncIterator[str]:
+    """
+    Case numbers from the first column of an uploaded CSV, TXT or XLSX file,
+    yielded while the file is still being read; a leading header row is skipped.
+    Raises ValueError with the message for the user.
+    """
+    name = (file.filename or "").lower()
+    if name.endswith(".xlsx"):
+        values = iter_xlsx_first_column(file)
+    elif name.endswith((".csv", ".txt")):
+        values = iter_csv_first_column(file)
+    else:
+        raise ValueError("Fișierul trebuie să fie CSV sau XLSX")
+    
+    first = True
+    try:
+        async for value in values:
+            value = " ".join(str(value).split()) if value is not None else ""
+            if not value:
+                continue
+            if first:
+                first = False
+                # Remove header if present
+                if not any(c.isdigit() for c in value):
+                    continue
+            yield value
+    except UnicodeError:
+        raise ValueError("Eroare la citirea fișierului")
+
+async def read_upload_numere(file: UploadFile, limit: int) -> List[str]:
+    """Unique case numbers of an upload, in file order; ValueError if there are none or more than limit"""
+    numere = {}
+    async for numar in iter_upload_numere(file):
+        numere.setdefault(numar, None)
+        if len(numere) > limit:
+            raise ValueError(f"Maximum {limit} de numere pe fișier")
+    if not numere:
+        raise ValueError("Fișierul nu conține numere de dosare valide")
+    return list(numere)
+
+async def run_search_dosare_csv(file: UploadFile, concurrency: Optional[int] = None):
+    # Pipeline: numbers are searched as soon as they are parsed, duplicates dropped on the fly
+    workers = resolve_concurrency(concurrency, CSV_SEARCH_CONCURRENCY)
+    queue: asyncio.Queue = asyncio.Queue()
+    seen = set()
+    searched = []
+    duplicates = 0
+    total = 0
+    found = {}
     
-    reader = csv.reader(io.StringIO(decoded))
+    async def parse():
+        nonlocal duplicates, total
+        try:
+            async for numar in iter_upload_numere(file):
+                if numar in seen:
+                    duplicates += 1
+                    continue
+                seen.add(numar)
+                total += 1
+                if total <= INTERACTIVE_MAX_TERMS:
+                    queue.put_nowait((len(searched), numar))
+                    searched.append(numar)
+        except BaseException:
+            # The answer is the parse error: drop the numbers no worker has taken yet
+            while not queue.empty():
+                queue.get_nowait()
+            raise
+        finally:
+            for _ in range(workers):
+                queue.put_nowait(None)
     
-    numere = []
-    for row in reader:
-        if row:
-            numere.append(row[0].strip())
+    async def search():
+        while (entry := await queue.get()) is not None:
+            index, numar = entry
+            start = time.perf_counter()
+            try:
+                result, error = await search_case_number(numar), None
+            except Exception as e:
+                result, error = None, e
+            found[index] = (result, error, round((time.perf_counter() - start) * 1000, 1))
     
-    # Remove header if present
-    if numere and not any(c.isdigit() for c in numere[0]):
-        numere = numere[1:]
+    try:
+        # A parse error cancels the searches in flight, their results would be thrown away
+        await gather_or_cancel(parse(), *(search() for _ in range(workers)))
+    except ValueError as e:
+        return {"error": str(e)}
     
-    if not numere:
+    if not searched:
         return {"error": "Fișierul nu conține numere de dosare valide"}
     
     results = []
     errors = []
+    timings = []
+    outcomes = [found[index] for index in range(len(searched))]
     
-    for numar in numere[:50]:  # Limit to 50
-        try:
-            dosar_results = await async_cautare_dosare(numar_dosar=numar)
-            if dosar_results:
-                for dosar in dosar_results:
-                    if dosar:
-                        processed = process_dosar(dosar)
-                        processed["searched_number"] = numar
-                        results.append(processed)
-            else:
-                errors.append({"numar": numar, "error": "Negăsit"})
-        except Exception as e:
-            errors.append({"numar": numar, "error": str(e)})
+    for numar, (dosar_results, error, latency_ms) in zip(searched, outcomes):
+        timings.append({"numar": numar, "latency_ms": latency_ms})
+        if error is not None:
+            errors.append({"numar": numar, "error": str(error)})
+        elif dosar_results:
+            for dosar in dosar_results:
+                if dosar:
+                    processed = process_dosar(dosar)
+                    processed["searched_number"] = numar
+                    results.append(processed)
+        else:
+            errors.append({"numar": numar, "error": "Negăsit"})
     
     # Sort by data descending
     results.sort(key=lambda x: x.get("data", "") or "", reverse=True)
@@ -793,194 +2818,1201 @@ async def search_dosare_csv(file: UploadFile = File(...)):
         "page_size": len(results),
         "total_pages": 1,
         "errors": errors,
-        "total_searched": len(numere)
+        "timings": timings,
+        "degraded": any(isinstance(error, UpstreamUnavailableError) for _, error, _ in outcomes),
+        "total_searched": len(searched),
+        "duplicate_ignorate": duplicates,
+        **term_limit_notice(total)
     }
 
+# ============== DOSAR RECORD ==============
+
+def soap_items(value, item_tag: str) -> list:
+    """Items of a SOAP array field, zeep-shaped ({"DosarParte": [...]}) or already a plain list"""
+    if isinstance(value, dict):
+        value = value.get(item_tag)
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if item and isinstance(item, dict)]
+
+def date_part(value) -> str:
+    """YYYY-MM-DD part of a SOAP date (datetime or ISO string), "" if missing"""
+    if not value:
+        return ""
+    d = str(value)
+    if 'T' in d:
+        return d.split('T')[0]
+    return d[:10]
+
+@dataclass(slots=True)
+class ParteRecord:
+    nume: Optional[str]
+    calitate: Optional[str]
+    _cuvinte: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def cuvinte(self) -> str:
+        """Name as diacritic-free upper-case words ("SC STEFANESCU FIII SRL"), computed on first use"""
+        if self._cuvinte is None:
+            self._cuvinte = name_words(self.nume)
+        return self._cuvinte
+
+@dataclass(slots=True)
+class SedintaRecord:
+    complet: Optional[str]
+    data: str
+    data_zi: str
+    ora: Optional[str]
+    solutie: Optional[str]
+    solutie_sumar: Optional[str]
+    data_pronuntare: str
+    document: Optional[str]
+    numar_document: Optional[str]
+
+@dataclass(slots=True)
+class CaleAtacRecord:
+    data_declarare: str
+    data_declarare_zi: str
+    parte_declaratoare: Optional[str]
+    tip_cale_atac: Optional[str]
+    dosar_instanta_superioara: Optional[str]
+
+@dataclass(slots=True)
+class DosarRecord:
+    """
+    A SOAP dosar normalized once: the nested DosarParte / DosarSedinta / DosarCaleAtac
+    lists unwrapped, dates cut to YYYY-MM-DD and ultima_modificare computed; party
+    names are diacritic-normalized at most once per record. Every endpoint view (process_dosar, table rows, the
+    details page, XLSX detail sheets) is rendered from it.
+    Scalar fields keep the raw SOAP value; each view applies its own empty-value convention.
+    """
+    numar: Optional[str]
+    numar_vechi: Optional[str]
+    data: str
+    data_zi: str
+    institutie: Optional[str]
+    departament: Optional[str]
+    categorie_caz: Optional[str]
+    stadiu_procesual: Optional[str]
+    obiect: Optional[str]
+    ultima_modificare: str
+    parti: List[ParteRecord]
+    sedinte: List[SedintaRecord]
+    cai_atac: List[CaleAtacRecord]
+    _party_matches: Optional[tuple] = field(default=None, repr=False)  # (matcher, its matches)
+
+    @classmethod
+    def from_soap(cls, dosar: dict) -> "DosarRecord":
+        get = dosar.get
+        sedinte = []
+        ultima_modificare = ""
+        for s in soap_items(get("sedinte"), "DosarSedinta"):
+            s_get = s.get
+            s_data = s_get("data")
+            data_zi = date_part(s_data)
+            if data_zi > ultima_modificare:
+                ultima_modificare = data_zi
+            sedinte.append(SedintaRecord(
+                s_get("complet", ""), str(s_data) if s_data else "", data_zi, s_get("ora", ""),
+                s_get("solutie", ""), s_get("solutieSumar", ""), date_part(s_get("dataPronuntare")),
+                s_get("documentSedinta"), s_get("numarDocument")
+            ))
+        cai_atac = []
+        for c in soap_items(get("caiAtac"), "DosarCaleAtac"):
+            declarare = c.get("dataDeclarare")
+            cai_atac.append(CaleAtacRecord(
+                str(declarare) if declarare else "", date_part(declarare), c.get("parteDeclaratoare", ""),
+                c.get("tipCaleAtac", ""), c.get("dosarInstantaSuperioara")
+            ))
+        data = get("data")
+        return cls(
+            get("numar", ""), get("numarVechi", ""), str(data) if data else "", date_part(data),
+            get("institutie", ""), get("departament", ""), get("categorieCaz", ""),
+            get("stadiuProcesual", ""), get("obiect", ""), ultima_modificare,
+            [ParteRecord(p.get("nume", ""), p.get("calitateParte", "")) for p in soap_items(get("parti"), "DosarParte")],
+            sedinte, cai_atac
+        )
+
+    @property
+    def instanta(self) -> str:
+        return INSTITUTII_MAP.get(str(self.institutie), str(self.institutie))
+
+    def party_matches(self, matcher: "PartyMatcher") -> Dict[str, List[tuple]]:
+        """
+        PartyMatcher.match over this case's parties; kept for the matcher last used, so
+        every name term of a search that hits this case shares one scan of its parties
+        """
+        cached = self._party_matches
+        if cached is not None and cached[0] is matcher:
+            return cached[1]
+        matches = matcher.match(self.parti)
+        self._party_matches = (matcher, matches)
+        return matches
+
+    def to_result(self) -> dict:
+        """Shape returned by /dosare/search, /bulk, /csv and monitoring snapshots"""
+        return {
+            "numar": self.numar,
+            "numarVechi": self.numar_vechi,
+            "data": self.data,
+            "institutie": str(self.institutie),
+            "departament": self.departament,
+            "categorieCaz": str(self.categorie_caz),
+            "stadiuProcesual": str(self.stadiu_procesual),
+            "obiect": self.obiect,
+            "parti": [{"nume": p.nume, "calitateParte": p.calitate} for p in self.parti],
+            "sedinte": [
+                {
+                    "complet": s.complet,
+                    "data": s.data,
+                    "ora": s.ora,
+                    "solutie": s.solutie,
+                    "solutieSumar": s.solutie_sumar
+                }
+                for s in self.sedinte
+            ],
+            "caiAtac": [
+                {
+                    "dataDeclarare": c.data_declarare,
+                    "parteDeclaratoare": c.parte_declaratoare,
+                    "tipCaleAtac": c.tip_cale_atac
+                }
+                for c in self.cai_atac
+            ],
+        }
+
+    def to_row(self, search_term: str, search_type: str, matcher: Optional["PartyMatcher"] = None) -> dict:
+        """ONE universal-search table row for this case; matcher covers the search's name terms"""
+        row = {
+            "termen_cautare": search_term,
+            "tip_detectat": search_type,
+            "numar_dosar": self.numar,
+            "instanta": self.instanta,
+            "obiect": self.obiect,
+            "stadiu_procesual": str(self.stadiu_procesual),
+            "data": self.data_zi,
+            "ultima_modificare": self.ultima_modificare,
+            "categorie_caz": str(self.categorie_caz),
+            "nume_parte": "",
+            "calitate_parte": "",
+            "observatii": "",
+            "potrivire": "",
+            "parti_potrivite": []
+        }
+        # "Număr dosar" searches leave Nume Parte / Calitate empty; "Nume parte" searches
+        # show the best matching party (all matches listed), else the first one as reference
+        if search_type == "Nume parte" and self.parti:
+            if matcher is None or search_term not in matcher.terms:
+                matcher = party_matcher(search_term)
+            matches = self.party_matches(matcher).get(search_term, [])
+            parte = matches[0][1] if matches else self.parti[0]
+            row["nume_parte"] = parte.nume
+            row["calitate_parte"] = parte.calitate
+            if matches:
+                row["potrivire"] = MATCH_QUALITY_NAMES[matches[0][0]]
+                row["parti_potrivite"] = [
+                    {"nume": p.nume, "calitate": p.calitate, "potrivire": MATCH_QUALITY_NAMES[quality]}
+                    for quality, p in matches
+                ]
+        return row
+
+    def to_details(self) -> dict:
+        """Sections of the case details page: detalii, parti, sedinte (newest first), cai_atac"""
+        sedinte = sorted(self.sedinte, key=lambda s: s.data_zi or "-", reverse=True)
+        return {
+            "found": True,
+            "detalii": {
+                "numar_dosar": safe_str(self.numar),
+                "numar_dosar_vechi": safe_str(self.numar_vechi),
+                "data": self.data_zi or "-",
+                "instanta": INSTITUTII_MAP.get(str(self.institutie), safe_str(self.institutie)),
+                "departament": safe_str(self.departament),
+                "obiect": safe_str(self.obiect),
+                "stadiu_procesual": safe_str(self.stadiu_procesual),
+                "categorie_caz": safe_str(self.categorie_caz),
+                "ultima_modificare": self.ultima_modificare or "-"
+            },
+            "parti": [
+                {"nume": safe_str(p.nume), "calitate": safe_str(p.calitate), "info": "-"}  # API doesn't provide extra info
+                for p in self.parti
+            ],
+            "sedinte": [
+                {
+                    "data_sedinta": s.data_zi or "-",
+                    "ora": safe_str(s.ora),
+                    "solutie": safe_str(s.solutie),
+                    "solutie_sumar": safe_str(s.solutie_sumar),
+                    "data_pronuntare": s.data_pronuntare or "-",
+                    "complet": safe_str(s.complet),
+                    "document": "-"  # API structure
+                }
+                for s in sedinte
+            ],
+            "cai_atac": [
+                {
+                    "data_declaratie": c.data_declarare_zi or "-",
+                    "parte_declaratoare": safe_str(c.parte_declaratoare),
+                    "cale_atac": safe_str(c.tip_cale_atac),
+                    "dosar_instanta_superioara": safe_str(c.dosar_instanta_superioara)
+                }
+                for c in self.cai_atac
+            ],
+        }
+
+_dosar_records: "OrderedDict[int, tuple]" = OrderedDict()  # id(raw dosar) -> (raw dosar, record)
+_dosar_records_lock = threading.Lock()
+
+def normalize_dosar(dosar) -> Optional[DosarRecord]:
+    """
+    DosarRecord for a raw SOAP dosar, None for empty / non-dict entries.
+    Raw dosare handed out by the search cache are shared between requests, so their
+    records are memoized by identity: cache hits and later views of the same case
+    (rows, details, XLSX sheets) skip normalization. The memo holds the raw dict,
+    which keeps its id from being reused while the entry lives.
+    """
+    if not dosar or not isinstance(dosar, dict):
+        return None
+    key = id(dosar)
+    with _dosar_records_lock:
+        entry = _dosar_records.get(key)
+        if entry is not None and entry[0] is dosar:
+            _dosar_records.move_to_end(key)
+            return entry[1]
+    record = DosarRecord.from_soap(dosar)
+    with _dosar_records_lock:
+        _dosar_records[key] = (dosar, record)
+        while len(_dosar_records) > DOSAR_RECORD_CACHE_SIZE:
+            _dosar_records.popitem(last=False)
+    return record
+
+# ============== PARTY MATCHING ==============
+
+NAME_WORD_PATTERN = re.compile(r"[A-Z0-9]+")
+
+# Match quality of a party name against a searched name, best first
+MATCH_EXACT = 3          # same words, in any order
+MATCH_TOKEN_SUBSET = 2   # every searched word is a whole word of the name
+MATCH_SUBSTRING = 1      # the searched words appear inside the name
+MATCH_QUALITY_NAMES = {MATCH_EXACT: "exact", MATCH_TOKEN_SUBSET: "token_subset", MATCH_SUBSTRING: "substring"}
+
+def name_words(text: Optional[str]) -> str:
+    """Diacritic-free upper-case words joined by single spaces; punctuation is dropped"""
+    return " ".join(NAME_WORD_PATTERN.findall(normalize_diacritics(text)))
+
+class PartyMatcher:
+    """
+    Aho-Corasick automaton over the searched names of a request: every distinct word
+    and every whole searched name is a pattern, so one scan of a party name finds
+    every term it matches and how well (see MATCH_*), however many terms there are.
+    """
+
+    def __init__(self, terms: List[str]):
+        self.terms = list(dict.fromkeys(terms))
+        self.term_word_ids: List[frozenset] = []
+        self.term_sorted: List[List[str]] = []
+        self.word_terms: List[List[int]] = []  # word id -> terms containing it
+        word_ids: Dict[str, int] = {}
+        # Automaton: goto transitions, failure links and outputs per state; an output is
+        # (pattern length, word id or None, term ids whose whole name the pattern is)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple]] = [[]]
+        patterns: Dict[str, list] = {}
+        for term_index, term in enumerate(self.terms):
+            words = name_words(term).split()
+            ids = set()
+            for word in words:
+                if word not in word_ids:
+                    word_ids[word] = len(self.word_terms)
+                    self.word_terms.append([])
+                    patterns.setdefault(word, [None, []])[0] = word_ids[word]
+                if not self.word_terms[word_ids[word]] or self.word_terms[word_ids[word]][-1] != term_index:
+                    self.word_terms[word_ids[word]].append(term_index)
+                ids.add(word_ids[word])
+            self.term_word_ids.append(frozenset(ids))
+            self.term_sorted.append(sorted(words))
+            if words:
+                patterns.setdefault(" ".join(words), [None, []])[1].append(term_index)
+        for pattern, (word_id, whole_terms) in patterns.items():
+            self._add(pattern, (len(pattern), word_id, whole_terms))
+        self._link()
+
+    def _add(self, pattern: str, output: tuple):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(output)
+
+    def _link(self):
+        """Failure links, then fold them into the transitions so a scan does one lookup per character"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+        # States in breadth-first order: a state's failure target is complete before it
+        for state in queue:
+            for char, next_state in self._goto[self._fail[state]].items():
+                self._goto[state].setdefault(char, next_state)
+
+    def scan(self, words: str) -> Dict[int, int]:
+        """Match quality per term index for one name (as name_words), terms not matching omitted"""
+        whole_words = set()
+        qualities = {}
+        state = 0
+        goto, out = self._goto, self._out
+        last = len(words) - 1
+        for position, char in enumerate(words):
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            for length, word_id, whole_terms in out[state]:
+                for term_index in whole_terms:
+                    qualities[term_index] = MATCH_SUBSTRING
+                if word_id is not None:
+                    start = position - length + 1
+                    if (start == 0 or words[start - 1] == " ") and (position == last or words[position + 1] == " "):
+                        whole_words.add(word_id)
+        if whole_words:
+            candidates = {term_index for word_id in whole_words for term_index in self.word_terms[word_id]}
+            name_sorted = None
+            for term_index in candidates:
+                if self.term_word_ids[term_index] <= whole_words:
+                    if name_sorted is None:
+                        name_sorted = sorted(words.split())
+                    exact = name_sorted == self.term_sorted[term_index]
+                    qualities[term_index] = MATCH_EXACT if exact else MATCH_TOKEN_SUBSET
+        return qualities
+
+    def match(self, parti: List[ParteRecord]) -> Dict[str, List[tuple]]:
+        """term -> [(quality, parte), ...] for every matching party, best match first"""
+        matches: Dict[str, List[tuple]] = {}
+        for position, parte in enumerate(parti):
+            for term_index, quality in self.scan(parte.cuvinte).items():
+                matches.setdefault(self.terms[term_index], []).append((-quality, position, parte))
+        return {
+            term: [(-quality, parte) for quality, _, parte in sorted(found, key=lambda item: item[:2])]
+            for term, found in matches.items()
+        }
+
+@functools.lru_cache(maxsize=1024)
+def party_matcher(term: str) -> PartyMatcher:
+    """Matcher for a single searched name (rows built outside a multi-term search)"""
+    return PartyMatcher([term])
+
+# ============== PARTY INDEX ==============
+
+class PartyIndex:
+    """
+    Inverted index of the parties of every case seen in a CautareDosare response:
+    one `parti_index` document per (case, party) with the party's normalized words
+    in a multikey `tokens` field. Answers party-name searches locally, refreshing
+    them from just.ro in the background once older than PARTY_INDEX_FRESH, and
+    "who else appears with this party" queries.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._indexed: "OrderedDict[str, float]" = OrderedDict()  # case key -> last write (monotonic)
+        self._refreshing: set = set()
+        self.cases_indexed = 0
+        self.parties_written = 0
+        self.write_errors = 0
+        self.local_searches = 0
+        self.refreshes = 0
+
+    def add(self, results: list):
+        """Index a CautareDosare response in the background"""
+        if PARTY_INDEX and results:
+            spawn_background(self._index(results))
+
+    async def _index(self, results: list):
+        now = time.monotonic()
+        seen_at = datetime.now(timezone.utc)
+        operations = []
+        for dosar in results:
+            record = normalize_dosar(dosar)
+            if record is None or not record.numar or not record.parti:
+                continue
+            case_key = f"{record.numar}|{record.institutie}"
+            last = self._indexed.get(case_key)
+            if last is not None and now - last < PARTY_INDEX_REINDEX:
+                continue
+            self._indexed[case_key] = now
+            self._indexed.move_to_end(case_key)
+            self.cases_indexed += 1
+            for parte in record.parti:
+                cuvinte = parte.cuvinte
+                if not cuvinte:
+                    continue
+                operations.append(UpdateOne(
+                    {"_id": hashlib.sha1(f"{case_key}|{cuvinte}".encode("utf-8")).hexdigest()},
+                    {"$set": {
+                        "dosar": case_key,
+                        "numar": record.numar,
+                        "institutie": record.institutie,
+                        "obiect": record.obiect,
+                        "data": record.data_zi,
+                        "nume": parte.nume,
+                        "calitate": parte.calitate,
+                        "cuvinte": cuvinte,
+                        "tokens": sorted(set(cuvinte.split())),
+                        "seen_at": seen_at,
+                        "expires_at": seen_at + timedelta(days=PARTY_INDEX_RETENTION_DAYS)
+                    }},
+                    upsert=True
+                ))
+        while len(self._indexed) > PARTY_INDEX_TRACKED_CASES:
+            self._indexed.popitem(last=False)
+        for start in range(0, len(operations), MIRROR_WRITE_BATCH):
+            batch = operations[start:start + MIRROR_WRITE_BATCH]
+            try:
+                await self.collection.bulk_write(batch, ordered=False)
+                self.parties_written += len(batch)
+            except Exception as e:
+                self.write_errors += 1
+                logging.warning(f"Party index write failed: {e}")
+
+    async def _hits(self, nume: str) -> List[dict]:
+        tokens = name_words(nume).split()
+        if not tokens:
+            return []
+        return await self.collection.find(
+            {"tokens": {"$all": tokens}}, {"_id": 0, "tokens": 0, "expires_at": 0}
+        ).sort("seen_at", -1).limit(PARTY_INDEX_MAX_HITS).to_list(PARTY_INDEX_MAX_HITS)
+
+    async def search(self, nume: str, limit: int) -> tuple:
+        """(cases where a party has every word of `nume`, best match first; newest seen_at)"""
+        self.local_searches += 1
+        hits = await self._hits(nume)
+        scan = PartyMatcher([nume]).scan
+        cases: Dict[str, dict] = {}
+        for hit in hits:
+            quality = scan(hit["cuvinte"]).get(0, MATCH_SUBSTRING)
+            case = cases.get(hit["dosar"])
+            if case is None:
+                case = cases[hit["dosar"]] = {
+                    "numar_dosar": hit["numar"],
+                    "institutie": hit["institutie"],
+                    "instanta": INSTITUTII_MAP.get(str(hit["institutie"]), str(hit["institutie"])),
+                    "obiect": hit.get("obiect"),
+                    "data": hit.get("data") or "",
+                    "actualizat_la": hit["seen_at"],
+                    "parti_potrivite": [],
+                    "_quality": quality
+                }
+            case["parti_potrivite"].append(
+                {"nume": hit["nume"], "calitate": hit["calitate"], "potrivire": MATCH_QUALITY_NAMES[quality]}
+            )
+            case["_quality"] = max(case["_quality"], quality)
+        ranked = sorted(cases.values(), key=lambda case: case["data"], reverse=True)
+        ranked.sort(key=lambda case: case.pop("_quality"), reverse=True)  # stable: newest first within a quality
+        newest = max((hit["seen_at"] for hit in hits), default=None)
+        return ranked[:limit], newest
+
+    async def co_parties(self, nume: str, limit: int) -> tuple:
+        """(number of cases of `nume`, parties appearing in those cases by number of shared cases)"""
+        hits = await self._hits(nume)
+        case_keys = list(dict.fromkeys(hit["dosar"] for hit in hits))
+        if not case_keys:
+            return 0, []
+        own_tokens = set(name_words(nume).split())
+        pipeline = [
+            {"$match": {"dosar": {"$in": case_keys}}},
+            {"$group": {"_id": "$cuvinte", "nume": {"$first": "$nume"},
+                        "dosare_comune": {"$sum": 1}, "calitati": {"$addToSet": "$calitate"}}},
+            {"$sort": {"dosare_comune": -1, "_id": 1}},
+            {"$limit": limit + len({hit["cuvinte"] for hit in hits})}
+        ]
+        asociati = []
+        async for group in self.collection.aggregate(pipeline):
+            if own_tokens <= set(group["_id"].split()):
+                continue  # the searched party itself
+            asociati.append({"nume": group["nume"], "dosare_comune": group["dosare_comune"],
+                             "calitati": [c for c in group["calitati"] if c]})
+        return len(case_keys), asociati[:limit]
+
+    def refresh(self, nume: str):
+        """Search `nume` upstream in the background (which re-indexes it), once at a time per name"""
+        key = name_words(nume)
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        self.refreshes += 1
+        spawn_background(self._refresh(nume, key))
+
+    async def _refresh(self, nume: str, key: str):
+        try:
+            await upstream_limiter.wait_for_headroom(SEARCH_JOB_UPSTREAM_SHARE)
+            await async_cautare_dosare(nume_parte=nume)
+        except Exception as e:
+            logging.warning(f"Party index refresh failed for '{nume}': {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("tokens", 1), ("seen_at", -1)])
+        await self.collection.create_index("dosar")
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        return {"enabled": PARTY_INDEX, "cases_indexed": self.cases_indexed,
+                "parties_written": self.parties_written, "write_errors": self.write_errors,
+                "local_searches": self.local_searches, "refreshes": self.refreshes,
+                "refreshing": len(self._refreshing)}
+
+party_index = PartyIndex(db.parti_index)
+
+@dosare_router.get("/parti")
+async def search_parti_local(nume: str = "", limit: int = 50):
+    """
+    Party-name search answered from the local index, instantly. Hits last fetched
+    more than PARTY_INDEX_FRESH seconds ago (or no hits) trigger a background
+    refresh from just.ro; repeat the call to see its results.
+    """
+    if not name_words(nume):
+        return {"error": "Numele părții este obligatoriu"}
+    cases, newest = await party_index.search(nume, max(1, min(limit, 500)))
+    age = (datetime.now(timezone.utc) - newest.replace(tzinfo=timezone.utc)).total_seconds() if newest else None
+    stale = age is None or age > PARTY_INDEX_FRESH
+    if stale:
+        party_index.refresh(nume)
+    return {
+        "nume": nume,
+        "results": cases,
+        "total_count": len(cases),
+        "sursa": "local",
+        "actualizat_la": newest,
+        "vechime_secunde": round(age) if age is not None else None,
+        "reimprospatare": stale
+    }
+
+@dosare_router.get("/parti/asociati")
+async def search_parti_asociati(nume: str = "", limit: int = 20):
+    """Who else appears with this party: co-parties of its indexed cases, by number of shared cases"""
+    if not name_words(nume):
+        return {"error": "Numele părții este obligatoriu"}
+    total_dosare, asociati = await party_index.co_parties(nume, max(1, min(limit, 200)))
+    return {"nume": nume, "dosare": total_dosare, "asociati": asociati}
+
 # ============== UNIVERSAL SEARCH (DIACRITIC-INSENSITIVE) ==============
 
-def process_dosar_to_row(dosar: dict, search_term: str, search_type: str) -> dict:
+def process_dosar_to_row(dosar: dict, search_term: str, search_type: str,
+                         matcher: Optional[PartyMatcher] = None) -> dict:
     """Convert a dosar to a SINGLE table row (one row per case, not per party)"""
-    if not dosar or not isinstance(dosar, dict):
-        return {}
+    record = normalize_dosar(dosar)
+    return record.to_row(search_term, search_type, matcher) if record else {}
+
+@dosare_router.post("/search/universal", response_model=UniversalSearchResponse)
+async def universal_search(request: UniversalSearchRequest, http_request: Request):
+    """
+    Universal search with diacritic-insensitive matching.
+    Auto-detects search type (case number vs party name).
+    Returns ONE row per case (not per party).
+    """
+    return await cancel_on_disconnect(http_request, run_universal_search(request))
+
+async def run_universal_search(request: UniversalSearchRequest, cache_ttl: int = SEARCH_CACHE_TTL_SEARCH):
+    stored = await resume_search_session(request, "universal")
+    if stored is not None:
+        return stored
+    all_rows, extra = await compute_universal_rows(request, cache_ttl)
+    return new_search_session_page(request, "universal", "rows", all_rows, extra, max_page_size=100)
+
+async def compute_universal_rows(request: UniversalSearchRequest, cache_ttl: int) -> tuple:
+    """Run every term upstream; returns (all rows, response fields shared by every page)"""
+    all_rows = []
+    extra = {}
+    async for term_rows in iter_universal_rows(request, cache_ttl, extra):
+        all_rows.extend(term_rows)
+    return all_rows, extra
+
+async def search_universal_term(term: str, cache_ttl: int) -> list:
+    if detect_search_type(term) == "Număr dosar":
+        return await search_case_number(term, cache_ttl=cache_ttl)
+    return await async_cautare_dosare(nume_parte=term, cache_ttl=cache_ttl)
+
+def universal_term_rows(term: str, results: Optional[list], error: Optional[Exception], seen_cases: set,
+                        matcher: Optional[PartyMatcher] = None) -> list:
+    """Rows for one searched term: one per case, or a single "no results" / error row"""
+    search_type = detect_search_type(term)
+    term_rows = []
     
-    instanta_key = dosar.get("institutie", "")
-    instanta_name = INSTITUTII_MAP.get(str(instanta_key), str(instanta_key))
+    try:
+        if error is not None:
+            raise error
+        
+        if results:
+            for dosar in results:
+                if dosar and isinstance(dosar, dict):
+                    case_key = f"{term}|{dosar.get('numar', '')}"
+                    if case_key not in seen_cases:
+                        seen_cases.add(case_key)
+                        row = process_dosar_to_row(dosar, term, search_type, matcher)
+                        if row:
+                            term_rows.append(row)
+        else:
+            # No results - add row with Observații message
+            term_rows.append({
+                "termen_cautare": term,
+                "tip_detectat": search_type,
+                "numar_dosar": "",
+                "instanta": "",
+                "obiect": "",
+                "stadiu_procesual": "",
+                "data": "",
+                "ultima_modificare": "",
+                "categorie_caz": "",
+                "nume_parte": "",
+                "calitate_parte": "",
+                "observatii": "Niciun rezultat găsit",
+                "potrivire": "",
+                "parti_potrivite": []
+            })
+    except Exception as e:
+        logging.error(f"Search error for term '{term}': {e}")
+        term_rows.append({
+            "termen_cautare": term,
+            "tip_detectat": search_type,
+            "numar_dosar": "",
+            "instanta": "",
+            "obiect": "",
+            "stadiu_procesual": "",
+            "data": "",
+            "ultima_modificare": "",
+            "categorie_caz": "",
+            "nume_parte": "",
+            "calitate_parte": "",
+            "observatii": f"Eroare: {str(e)[:50]}",
+            "potrivire": "",
+            "parti_potrivite": []
+        })
+    return term_rows
+
+def interactive_terms(request: UniversalSearchRequest) -> List[str]:
+    """The terms an interactive universal search runs: the first INTERACTIVE_MAX_TERMS, stripped, non-empty"""
+    terms = [t.strip() for t in request.termeni[:INTERACTIVE_MAX_TERMS]]
+    return [t for t in terms if t]
+
+async def iter_universal_rows(request: UniversalSearchRequest, cache_ttl: int, extra: dict,
+                              ordered: bool = True) -> AsyncIterator[list]:
+    """
+    Rows of each term in input order (or completion order), as soon as that
+    term is done, while the later terms are still being searched. Fills
+    `extra` with the response fields shared by every page once all terms are done.
+    """
+    seen_cases = set()  # Avoid duplicates
+    timings = []
+    degraded = False
+    
+    terms = interactive_terms(request)
+    # One automaton for every name term: a case found by several names is scanned once
+    matcher = PartyMatcher([t for t in terms if detect_search_type(t) == "Nume parte"])
+    
+    async for term, results, error, latency_ms in iter_bounded(
+        terms, lambda term: search_universal_term(term, cache_ttl),
+        resolve_concurrency(request.concurrency, UNIVERSAL_SEARCH_CONCURRENCY),
+        ordered=ordered
+    ):
+        timings.append({"termen": term, "latency_ms": latency_ms})
+        degraded = degraded or isinstance(error, UpstreamUnavailableError)
+        yield universal_term_rows(term, results, error, seen_cases, matcher)
     
-    # Parse dates
-    data_str = ""
-    if dosar.get("data"):
+    extra.update({
+        "headers": [
+            "Termen Căutare", "Tip Detectat", "Număr Dosar", "Instanță",
+            "Obiect", "Stadiu Procesual", "Data", "Ultima Modificare",
+            "Categorie Caz", "Nume Parte", "Calitate parte", "Observații"
+        ],
+        "timings": timings,
+        "degraded": degraded,
+        **term_limit_notice(len(request.termeni))
+    })
+
+@dosare_router.post("/search/universal/stream")
+async def universal_search_stream(request: UniversalSearchRequest, format: str = "ndjson"):
+    """
+    Universal search streamed as NDJSON (format=ndjson) or Server-Sent Events
+    (format=sse): one "row" event per row as soon as its term resolves, in the
+    order the terms finish, then a "summary" event. The rows are stored as a
+    search session, so the summary's search_id can be paged or exported.
+    """
+    if format not in STREAM_MEDIA_TYPES:
+        return {"error": "Format invalid. Folosiți 'ndjson' sau 'sse'"}
+    encode = sse_event if format == "sse" else ndjson_line
+    session = SearchSession("universal", "rows", [], {}, max_page_size=100)
+    
+    async def stream():
+        started = time.perf_counter()
+        async for term_rows in iter_universal_rows(request, SEARCH_CACHE_TTL_SEARCH, session.extra, ordered=False):
+            session.rows.extend(term_rows)
+            for row in term_rows:
+                yield encode({"type": "row", "termen": row["termen_cautare"], "row": row})
+        # Rows of a repeated term belong to its first occurrence, as in a regular search
+        term_order = {}
+        for index, term in enumerate(interactive_terms(request)):
+            term_order.setdefault(term, index)
+        session.rows.sort(key=lambda row: term_order.get(row["termen_cautare"], 0))
+        stored = search_sessions.add(session)
+        yield encode({
+            "type": "summary",
+            "total_count": len(session.rows),
+            "terms": len(session.extra["timings"]),
+            "timings": session.extra["timings"],
+            "degraded": session.extra["degraded"],
+            "search_id": stored.id if stored else None,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            **term_limit_notice(len(request.termeni))
+        })
+    
+    return StreamingResponse(
+        stream(),
+        media_type=STREAM_MEDIA_TYPES[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ============== SEARCH JOBS ==============
+# Term lists longer than the interactive limit run as jobs. Every term is an
+# item in `search_job_items`; its rows are written as soon as it is searched,
+# so progress and partial results can be read while the job runs and a
+# restarted process picks the job up again from its pending terms.
+
+class SearchJobRunner:
+    """
+    Claims jobs from `search_jobs` under a lease a heartbeat renews every third
+    of SEARCH_JOB_LEASE while the job runs, however long its terms take; a job
+    whose owner stopped renewing is taken over by any process. Job terms share
+    SEARCH_JOB_CONCURRENCY slots and only go upstream while interactive
+    searches leave headroom in the adaptive limiter.
+    """
+
+    def __init__(self, collection, items_collection, concurrency: int, max_active: int, lease: int):
+        self.collection = collection
+        self.items_collection = items_collection
+        self.owner = uuid.uuid4().hex
+        self.concurrency = concurrency
+        self.max_active = max_active
+        self.lease = lease
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._active: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+        self.terms_done = 0
+        self.retries = 0
+        self.requeued = 0
+
+    def start(self):
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._wakeup = asyncio.Event()
+        self._poller = spawn_background(self._poll())
+
+    async def stop(self):
+        self._stopping = True
+        tasks = [task for task in [self._poller, *self._active.values()] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def notify(self):
+        """A job was submitted or finished: look for work now instead of at the next poll"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _poll(self):
+        # wait_for can swallow a cancellation that races with the wakeup, hence the flag
+        while not self._stopping:
+            try:
+                await self._claim_jobs()
+            except Exception as e:
+                logging.error(f"Search job polling failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=SEARCH_JOB_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _lease_until(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(seconds=self.lease)
+
+    async def _claim_jobs(self):
+        while len(self._active) < self.max_active:
+            now = datetime.now(timezone.utc)
+            job = await self.collection.find_one_and_update(
+                {"status": {"$in": ["pending", "running"]}, "lease_until": {"$lt": now},
+                 "_id": {"$nin": list(self._active)}},
+                {"$set": {"status": "running", "owner": self.owner,
+                          "lease_until": self._lease_until(), "updated_at": now}},
+                sort=[("created_at", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if not job:
+                return
+            task = spawn_background(self._run(job))
+            self._active[job["_id"]] = task
+            task.add_done_callback(lambda _, job_id=job["_id"]: self._finished(job_id))
+
+    def _finished(self, job_id: str):
+        self._active.pop(job_id, None)
+        self.notify()
+
+    async def _heartbeat(self, job: dict):
+        while not job.get("released"):
+            await asyncio.sleep(self.lease / 3)
+            try:
+                updated = await self.collection.update_one(
+                    {"_id": job["_id"], "owner": self.owner, "status": "running"},
+                    {"$set": {"lease_until": self._lease_until()}}
+                )
+            except Exception as e:
+                logging.warning(f"Search job {job['_id']} lease renewal failed: {e}")
+                continue
+            if updated.matched_count == 0:
+                job["released"] = True  # Cancelled, or the lease was lost to another process
+
+    async def _run(self, job: dict):
+        job_id = job["_id"]
+        heartbeat = asyncio.ensure_future(self._heartbeat(job))
         try:
-            d = str(dosar.get("data", ""))
-            if 'T' in d:
-                data_str = d.split('T')[0]
-            elif d:
-                data_str = d[:10]
-        except:
-            data_str = ""
-    
-    # Get ultima modificare from sedinte
-    ultima_modificare = ""
-    sedinte_raw = dosar.get("sedinte")
-    if sedinte_raw:
-        if isinstance(sedinte_raw, dict) and "DosarSedinta" in sedinte_raw:
-            sedinte_list = sedinte_raw.get("DosarSedinta", [])
-        elif isinstance(sedinte_raw, list):
-            sedinte_list = sedinte_raw
-        else:
-            sedinte_list = []
+            while not job.get("released"):
+                batch = await self.items_collection.find(
+                    {"job_id": job_id, "status": "pending"}
+                ).sort("index", 1).to_list(SEARCH_JOB_BATCH)
+                if not batch:
+                    now = datetime.now(timezone.utc)
+                    await self.collection.update_one(
+                        {"_id": job_id, "owner": self.owner, "status": "running"},
+                        {"$set": {"status": "done", "finished_at": now, "updated_at": now}}
+                    )
+                    return
+                await asyncio.gather(*(self._run_item(job, item) for item in batch))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The lease runs out and the job is resumed by the next poll
+            logging.error(f"Search job {job_id} interrupted: {e}")
+        finally:
+            heartbeat.cancel()
+
+    async def _search(self, job: dict, term: str) -> list:
+        if job["tip"] == "numere":
+            return await search_case_number(term, job.get("institutie"))
+        return await search_universal_term(term, SEARCH_CACHE_TTL_SEARCH)
+
+    async def _run_item(self, job: dict, item: dict):
+        if job.get("released"):
+            return
+        async with self._semaphore:
+            await upstream_limiter.wait_for_headroom(SEARCH_JOB_UPSTREAM_SHARE)
+            start = time.perf_counter()
+            try:
+                results, error = await self._search(job, item["term"]), None
+            except Exception as e:
+                results, error = None, e
+            latency_ms = round((time.perf_counter() - start) * 1000, 1)
         
-        if sedinte_list:
-            dates = []
-            for s in sedinte_list:
-                if isinstance(s, dict) and s.get("data"):
-                    d = str(s.get("data", ""))
-                    if 'T' in d:
-                        dates.append(d.split('T')[0])
-                    elif d:
-                        dates.append(d[:10])
-            if dates:
-                dates.sort(reverse=True)
-                ultima_modificare = dates[0]
-    
-    # Build row based on search type
-    row = {
-        "termen_cautare": search_term,
-        "tip_detectat": search_type,
-        "numar_dosar": dosar.get("numar", ""),
-        "instanta": instanta_name,
-        "obiect": dosar.get("obiect", ""),
-        "stadiu_procesual": str(dosar.get("stadiuProcesual", "")),
-        "data": data_str,
-        "ultima_modificare": ultima_modificare,
-        "categorie_caz": str(dosar.get("categorieCaz", "")),
-        "nume_parte": "",
-        "calitate_parte": "",
-        "observatii": ""
+        if isinstance(error, UpstreamUnavailableError) and upstream_breaker.state != "closed":
+            # just.ro is down for everyone: requeue the term once the circuit may close again,
+            # without spending one of its attempts
+            self.requeued += 1
+            await asyncio.sleep(max(upstream_breaker.retry_after(), SEARCH_JOB_RETRY_DELAY))
+            return
+        
+        if isinstance(error, UpstreamUnavailableError) and item.get("attempts", 0) + 1 < SEARCH_JOB_MAX_ATTEMPTS:
+            # Leave the term pending and give just.ro a moment before the batch is picked up again
+            self.retries += 1
+            await self.items_collection.update_one({"_id": item["_id"]}, {"$inc": {"attempts": 1}})
+            await asyncio.sleep(SEARCH_JOB_RETRY_DELAY)
+            return
+        
+        rows, error_message = search_job_rows(job, item["term"], results, error)
+        written = await self.items_collection.update_one(
+            {"_id": item["_id"], "status": "pending"},
+            {"$set": {"status": "error" if error_message else "done", "rows": rows,
+                      "error": error_message, "latency_ms": latency_ms}}
+        )
+        if written.modified_count == 0:
+            return  # Already written by a previous owner of the job
+        self.terms_done += 1
+        updated = await self.collection.update_one(
+            {"_id": job["_id"], "owner": self.owner, "status": "running"},
+            {"$inc": {"processed": 1, "rows": len(rows), "errors": 1 if error_message else 0},
+             "$set": {"updated_at": datetime.now(timezone.utc)}}
+        )
+        if updated.matched_count == 0:
+            job["released"] = True  # Cancelled, or the lease was lost to another process
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("status", 1), ("lease_until", 1)])
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        await self.items_collection.create_index([("job_id", 1), ("status", 1), ("index", 1)])
+        await self.items_collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        return {"owner": self.owner, "active_jobs": list(self._active),
+                "terms_done": self.terms_done, "retries": self.retries, "requeued": self.requeued}
+
+search_job_runner = SearchJobRunner(
+    db.search_jobs, db.search_job_items, SEARCH_JOB_CONCURRENCY, SEARCH_JOB_MAX_ACTIVE, SEARCH_JOB_LEASE
+)
+
+def search_job_rows(job: dict, term: str, results: Optional[list], error: Optional[Exception]) -> tuple:
+    """(rows, error message) for one job term, shaped like the interactive endpoint of the job's tip"""
+    if job["tip"] == "numere":
+        if error is not None:
+            return [], str(error)
+        if not results:
+            return [], "Negăsit"
+        rows = []
+        for dosar in results:
+            if dosar:
+                processed = process_dosar(dosar)
+                processed["searched_number"] = term
+                rows.append(processed)
+        return rows, None
+    return universal_term_rows(term, results, error, set()), (str(error) if error is not None else None)
+
+async def create_search_job(termeni: List[str], tip: str, institutie: Optional[str] = None) -> dict:
+    terms = [t.strip() for t in termeni if t and t.strip()]
+    if not terms:
+        return {"error": "Lista de termeni este goală"}
+    if len(terms) > SEARCH_JOB_MAX_TERMS:
+        return {"error": f"Maximum {SEARCH_JOB_MAX_TERMS} de termeni pe căutare"}
+    if tip not in ("universal", "numere"):
+        return {"error": "Tip invalid. Folosiți 'universal' sau 'numere'"}
+    
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(days=SEARCH_JOB_RETENTION_DAYS)
+    job = {
+        "_id": uuid.uuid4().hex,
+        "tip": tip,
+        "institutie": institutie or None,
+        "status": "pending",
+        "total": len(terms),
+        "processed": 0,
+        "rows": 0,
+        "errors": 0,
+        "owner": None,
+        "lease_until": datetime.fromtimestamp(0, timezone.utc),
+        "created_at": now,
+        "updated_at": now,
+        "finished_at": None,
+        "expires_at": expires_at
+    }
+    for start in range(0, len(terms), 1000):
+        await db.search_job_items.insert_many([
+            {"_id": f"{job['_id']}:{index}", "job_id": job["_id"], "index": index, "term": term,
+             "status": "pending", "attempts": 0, "expires_at": expires_at}
+            for index, term in enumerate(terms[start:start + 1000], start=start)
+        ])
+    await db.search_jobs.insert_one(job)
+    search_job_runner.notify()
+    return search_job_response(job)
+
+def search_job_response(job: dict) -> dict:
+    return {
+        "job_id": job["_id"],
+        "tip": job["tip"],
+        "status": job["status"],
+        "total": job["total"],
+        "processed": job["processed"],
+        "progress": round(job["processed"] / job["total"] * 100, 1) if job["total"] else 100.0,
+        "rows": job["rows"],
+        "errors": job["errors"],
+        "created_at": job["created_at"].isoformat(),
+        "finished_at": job["finished_at"].isoformat() if job.get("finished_at") else None,
+        "status_url": f"/api/dosare/jobs/{job['_id']}",
+        "results_url": f"/api/dosare/jobs/{job['_id']}/results"
+    }
+
+async def get_search_job_or_404(job_id: str) -> dict:
+    job = await db.search_jobs.find_one({"_id": job_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Căutarea nu există sau a expirat")
+    return job
+
+@dosare_router.post("/jobs")
+async def submit_search_job(request: SearchJobCreate):
+    """Start a background search over up to SEARCH_JOB_MAX_TERMS terms - PUBLIC (no auth required)"""
+    return await create_search_job(request.termeni, request.tip, request.institutie)
+
+@dosare_router.post("/jobs/csv")
+async def submit_search_job_csv(file: UploadFile = File(...), institutie: Optional[str] = None):
+    """Start a background search over the case numbers of a CSV file - PUBLIC (no auth required)"""
+    try:
+        numere = await read_upload_numere(file, SEARCH_JOB_MAX_TERMS)
+    except ValueError as e:
+        return {"error": str(e)}
+    return await create_search_job(numere, "numere", institutie)
+
+@dosare_router.get("/jobs/{job_id}")
+async def get_search_job(job_id: str):
+    """Progress of a background search"""
+    return search_job_response(await get_search_job_or_404(job_id))
+
+@dosare_router.get("/jobs/{job_id}/results")
+async def get_search_job_results(job_id: str, page: int = 1, page_size: int = 100):
+    """Rows found so far, in term order; available while the job is still running"""
+    job = await get_search_job_or_404(job_id)
+    page = max(1, page)
+    page_size = min(max(1, page_size), 500)
+    rows = await db.search_job_items.aggregate([
+        {"$match": {"job_id": job_id, "status": {"$ne": "pending"}}},
+        {"$sort": {"index": 1}},
+        {"$unwind": "$rows"},
+        {"$skip": (page - 1) * page_size},
+        {"$limit": page_size},
+        {"$replaceRoot": {"newRoot": "$rows"}}
+    ]).to_list(page_size)
+    return {
+        **search_job_response(job),
+        "results": rows,
+        "total_count": job["rows"],
+        "page": page,
+        "page_size": page_size,
+        "total_pages": max(1, (job["rows"] + page_size - 1) // page_size)
     }
-    
-    # If search by "Număr dosar" -> leave Nume Parte and Calitate empty
-    # If search by "Nume parte" -> find and show the matching party
-    if search_type == "Nume parte":
-        # Find the party that matches the search term
-        parti_raw = dosar.get("parti")
-        parti_list = []
-        if parti_raw:
-            if isinstance(parti_raw, dict) and "DosarParte" in parti_raw:
-                parti_list = parti_raw.get("DosarParte", [])
-            elif isinstance(parti_raw, list):
-                parti_list = parti_raw
-        
-        # Search for matching party (diacritic-insensitive)
-        search_normalized = normalize_diacritics(search_term)
-        found_party = None
-        for parte in parti_list:
-            if isinstance(parte, dict):
-                party_name = parte.get("nume", "")
-                if search_normalized in normalize_diacritics(party_name):
-                    found_party = parte
-                    break
-        
-        if found_party:
-            row["nume_parte"] = found_party.get("nume", "")
-            row["calitate_parte"] = found_party.get("calitateParte", "")
-        elif parti_list:
-            # If no exact match, show first party as reference
-            first_party = parti_list[0] if parti_list else {}
-            if isinstance(first_party, dict):
-                row["nume_parte"] = first_party.get("nume", "")
-                row["calitate_parte"] = first_party.get("calitateParte", "")
-    
-    # For "Număr dosar" search, Nume Parte and Calitate stay empty (as per requirement)
-    
-    return row
 
-@api_router.post("/dosare/search/universal")
-async def universal_search(request: UniversalSearchRequest):
+@dosare_router.get("/jobs/{job_id}/errors")
+async def get_search_job_errors(job_id: str, page: int = 1, page_size: int = 100):
+    """Terms that failed or were not found"""
+    await get_search_job_or_404(job_id)
+    page = max(1, page)
+    page_size = min(max(1, page_size), 500)
+    items = await db.search_job_items.find(
+        {"job_id": job_id, "status": "error"}, {"_id": 0, "term": 1, "error": 1}
+    ).sort("index", 1).skip((page - 1) * page_size).to_list(page_size)
+    return {"errors": [{"termen": item["term"], "error": item["error"]} for item in items], "page": page}
+
+@dosare_router.delete("/jobs/{job_id}")
+async def cancel_search_job(job_id: str):
+    await get_search_job_or_404(job_id)
+    now = datetime.now(timezone.utc)
+    await db.search_jobs.update_one(
+        {"_id": job_id, "status": {"$in": ["pending", "running"]}},
+        {"$set": {"status": "cancelled", "finished_at": now, "updated_at": now}}
+    )
+    return search_job_response(await get_search_job_or_404(job_id))
+
+# ============== CASE MIRROR ==============
+
+class CaseMirror:
     """
-    Universal search with diacritic-insensitive matching.
-    Auto-detects search type (case number vs party name).
-    Returns ONE row per case (not per party).
+    Read-through mirror of the cases returned by CautareDosare, one `dosare`
+    document per (numar, institutie) holding the raw dosar and when it was fetched.
+    Written in the background from every upstream response, so cases just seen in
+    a search or refreshed by monitoring open without another upstream call.
     """
-    all_rows = []
-    seen_cases = set()  # Avoid duplicates
-    
-    for term in request.termeni[:50]:  # Limit to 50 terms
-        term = term.strip()
-        if not term:
-            continue
-        
-        search_type = detect_search_type(term)
-        
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._written: "OrderedDict[str, float]" = OrderedDict()  # case key -> last write (monotonic)
+        self._revalidating: set = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.cases_written = 0
+        self.write_errors = 0
+
+    @staticmethod
+    def case_key(numar: str, institutie: str) -> str:
+        return f"{numar}|{institutie}"
+
+    def add(self, results: list):
+        """Mirror a CautareDosare response in the background"""
+        if DOSAR_MIRROR and results:
+            spawn_background(self._write(results))
+
+    async def _write(self, results: list):
+        now = time.monotonic()
+        fetched_at = datetime.now(timezone.utc)
+        operations = []
+        for dosar in results:
+            if not isinstance(dosar, dict) or not dosar.get("numar") or not dosar.get("institutie"):
+                continue
+            key = self.case_key(dosar["numar"], dosar["institutie"])
+            last = self._written.get(key)
+            if last is not None and now - last < DOSAR_MIRROR_REWRITE:
+                continue
+            self._written[key] = now
+            self._written.move_to_end(key)
+            operations.append(UpdateOne(
+                {"_id": key},
+                {"$set": {
+                    "numar": dosar["numar"],
+                    "institutie": dosar["institutie"],
+                    "dosar": dosar,
+                    "fetched_at": fetched_at,
+                    "expires_at": fetched_at + timedelta(days=DOSAR_MIRROR_RETENTION_DAYS)
+                }},
+                upsert=True
+            ))
+        while len(self._written) > DOSAR_MIRROR_TRACKED_CASES:
+            self._written.popitem(last=False)
+        for start in range(0, len(operations), MIRROR_WRITE_BATCH):
+            batch = operations[start:start + MIRROR_WRITE_BATCH]
+            try:
+                await self.collection.bulk_write(batch, ordered=False)
+                self.cases_written += len(batch)
+            except Exception as e:
+                # Unencodable cases stay upstream-only
+                self.write_errors += 1
+                logging.warning(f"Case mirror write failed: {e}")
+
+    async def get(self, numar: str, institutie: str) -> Optional[tuple]:
+        """(raw dosar, fetched_at) of the mirrored case, or None"""
+        if not DOSAR_MIRROR:
+            return None
         try:
-            if search_type == "Număr dosar":
-                results = await async_cautare_dosare(numar_dosar=term)
-            else:
-                results = await async_cautare_dosare(nume_parte=term)
-            
-            if results:
-                for dosar in results:
-                    if dosar and isinstance(dosar, dict):
-                        case_key = f"{term}|{dosar.get('numar', '')}"
-                        if case_key not in seen_cases:
-                            seen_cases.add(case_key)
-                            row = process_dosar_to_row(dosar, term, search_type)
-                            if row:
-                                all_rows.append(row)
-            else:
-                # No results - add row with Observații message
-                all_rows.append({
-                    "termen_cautare": term,
-                    "tip_detectat": search_type,
-                    "numar_dosar": "",
-                    "instanta": "",
-                    "obiect": "",
-                    "stadiu_procesual": "",
-                    "data": "",
-                    "ultima_modificare": "",
-                    "categorie_caz": "",
-                    "nume_parte": "",
-                    "calitate_parte": "",
-                    "observatii": "Niciun rezultat găsit"
-                })
+            doc = await self.collection.find_one({"_id": self.case_key(numar, institutie)})
         except Exception as e:
-            logging.error(f"Search error for term '{term}': {e}")
-            all_rows.append({
-                "termen_cautare": term,
-                "tip_detectat": search_type,
-                "numar_dosar": "",
-                "instanta": "",
-                "obiect": "",
-                "stadiu_procesual": "",
-                "data": "",
-                "ultima_modificare": "",
-                "categorie_caz": "",
-                "nume_parte": "",
-                "calitate_parte": "",
-                "observatii": f"Eroare: {str(e)[:50]}"
-            })
-    
-    # Pagination
-    total_count = len(all_rows)
-    page = max(1, request.page)
-    page_size = min(max(1, request.page_size), 100)
-    total_pages = max(1, (total_count + page_size - 1) // page_size)
-    
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    paginated_rows = all_rows[start_idx:end_idx]
-    
-    return {
-        "rows": paginated_rows,
-        "total_count": total_count,
-        "page": page,
-        "page_size": page_size,
-        "total_pages": total_pages,
-        "headers": [
-            "Termen Căutare", "Tip Detectat", "Număr Dosar", "Instanță",
-            "Obiect", "Stadiu Procesual", "Data", "Ultima Modificare",
-            "Categorie Caz", "Nume Parte", "Calitate parte", "Observații"
-        ]
-    }
+            logging.warning(f"Case mirror lookup failed: {e}")
+            doc = None
+        if not doc:
+            self.misses += 1
+            return None
+        return doc["dosar"], doc["fetched_at"].replace(tzinfo=timezone.utc)
+
+    def revalidate(self, numar: str, institutie: str):
+        """Refetch the case in the background (which rewrites the mirror), once at a time per case"""
+        key = self.case_key(numar, institutie)
+        if key in self._revalidating:
+            return
+        self._revalidating.add(key)
+        self.revalidations += 1
+        spawn_background(self._revalidate(numar, institutie, key))
+
+    async def _revalidate(self, numar: str, institutie: str, key: str):
+        try:
+            await upstream_limiter.wait_for_headroom(SEARCH_JOB_UPSTREAM_SHARE)
+            await async_cautare_dosare(numar_dosar=numar, institutie=institutie, cache_ttl=0)
+        except Exception as e:
+            logging.warning(f"Case mirror revalidation failed for {numar}: {e}")
+        finally:
+            self._revalidating.discard(key)
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        return {"enabled": DOSAR_MIRROR, "hits": self.hits, "stale_hits": self.stale_hits,
+                "misses": self.misses, "revalidations": self.revalidations,
+                "revalidating": len(self._revalidating), "cases_written": self.cases_written,
+                "write_errors": self.write_errors}
+
+case_mirror = CaseMirror(db.dosare)
 
 # ============== CASE DETAILS ENDPOINT ==============
 
@@ -988,35 +4020,52 @@ class CaseDetailsRequest(BaseModel):
     numar_dosar: str
     institutie: Optional[str] = None
 
-def format_date(date_val) -> str:
-    """Format date value, return '-' if empty"""
-    if not date_val:
-        return "-"
-    try:
-        d = str(date_val)
-        if 'T' in d:
-            return d.split('T')[0]
-        return d[:10] if len(d) >= 10 else d
-    except:
-        return "-"
-
 def safe_str(val, default="-") -> str:
     """Safe string conversion with default for None/empty"""
     if val is None or val == "":
         return default
     return str(val)
 
-@api_router.post("/dosare/detalii")
-async def get_case_details(request: CaseDetailsRequest):
+@dosare_router.post("/detalii", response_model=CaseDetailsResponse)
+async def get_case_details(request: CaseDetailsRequest, http_request: Request):
     """
     Get full case details for the case details page.
     Returns all information: detalii, parti, sedinte, cai_atac.
     """
+    return await cancel_on_disconnect(http_request, run_case_details(request))
+
+def mirrored_details(dosar: dict, fetched_at: datetime, revalidating: bool, degraded: bool = False) -> dict:
+    age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+    return {
+        **normalize_dosar(dosar).to_details(),
+        "sursa": "local",
+        "actualizat_la": fetched_at,
+        "vechime_secunde": max(0, round(age)),
+        "reimprospatare": revalidating,
+        "degraded": degraded
+    }
+
+async def run_case_details(request: CaseDetailsRequest):
+    """
+    Served from the case mirror when the court is known: copies younger than
+    DOSAR_MIRROR_FRESH as they are, older ones while revalidating in the background,
+    ones past DOSAR_MIRROR_MAX_STALE only if just.ro can't answer.
+    """
+    institutie = resolve_institutie(request.institutie) if request.institutie else None
+    numar = request.numar_dosar.strip()
+    mirrored = await case_mirror.get(numar, institutie) if institutie else None
+    if mirrored is not None:
+        dosar, fetched_at = mirrored
+        age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+        if age <= DOSAR_MIRROR_FRESH:
+            case_mirror.hits += 1
+            return mirrored_details(dosar, fetched_at, False)
+        if age <= DOSAR_MIRROR_MAX_STALE:
+            case_mirror.stale_hits += 1
+            case_mirror.revalidate(numar, institutie)
+            return mirrored_details(dosar, fetched_at, True)
     try:
-        results = await async_cautare_dosare(
-            numar_dosar=request.numar_dosar,
-            institutie=request.institutie if request.institutie else None
-        )
+        results = await async_cautare_dosare(numar_dosar=numar, institutie=institutie)
         
         if not results:
             return {"error": "Dosarul nu a fost găsit", "found": False}
@@ -1025,104 +4074,13 @@ async def get_case_details(request: CaseDetailsRequest):
         if not dosar or not isinstance(dosar, dict):
             return {"error": "Dosarul nu a fost găsit", "found": False}
         
-        # Get institution name
-        instanta_key = dosar.get("institutie", "")
-        instanta_name = INSTITUTII_MAP.get(str(instanta_key), safe_str(instanta_key))
-        
-        # Calculate ultima modificare from sedinte
-        ultima_modificare = "-"
-        sedinte_raw = dosar.get("sedinte")
-        sedinte_list = []
-        if sedinte_raw:
-            if isinstance(sedinte_raw, dict) and "DosarSedinta" in sedinte_raw:
-                sedinte_list = sedinte_raw.get("DosarSedinta", [])
-            elif isinstance(sedinte_raw, list):
-                sedinte_list = sedinte_raw
-        
-        if sedinte_list:
-            dates = []
-            for s in sedinte_list:
-                if isinstance(s, dict) and s.get("data"):
-                    dates.append(format_date(s.get("data")))
-            if dates:
-                dates.sort(reverse=True)
-                ultima_modificare = dates[0]
-        
-        # Section A: Detalii Dosar
-        detalii = {
-            "numar_dosar": safe_str(dosar.get("numar")),
-            "numar_dosar_vechi": safe_str(dosar.get("numarVechi")),
-            "data": format_date(dosar.get("data")),
-            "instanta": instanta_name,
-            "departament": safe_str(dosar.get("departament")),
-            "obiect": safe_str(dosar.get("obiect")),
-            "stadiu_procesual": safe_str(dosar.get("stadiuProcesual")),
-            "categorie_caz": safe_str(dosar.get("categorieCaz")),
-            "ultima_modificare": ultima_modificare
-        }
-        
-        # Section B: Părți implicate
-        parti_raw = dosar.get("parti")
-        parti_list_raw = []
-        if parti_raw:
-            if isinstance(parti_raw, dict) and "DosarParte" in parti_raw:
-                parti_list_raw = parti_raw.get("DosarParte", [])
-            elif isinstance(parti_raw, list):
-                parti_list_raw = parti_raw
-        
-        parti = []
-        for p in parti_list_raw:
-            if isinstance(p, dict):
-                parti.append({
-                    "nume": safe_str(p.get("nume")),
-                    "calitate": safe_str(p.get("calitateParte")),
-                    "info": "-"  # API doesn't provide extra info
-                })
-        
-        # Section C: Ședințe de judecată
-        sedinte = []
-        for s in sedinte_list:
-            if isinstance(s, dict):
-                sedinte.append({
-                    "data_sedinta": format_date(s.get("data")),
-                    "ora": safe_str(s.get("ora")),
-                    "solutie": safe_str(s.get("solutie")),
-                    "solutie_sumar": safe_str(s.get("solutieSumar")),
-                    "data_pronuntare": format_date(s.get("dataPronuntare")) if s.get("dataPronuntare") else "-",
-                    "complet": safe_str(s.get("complet")),
-                    "document": "-"  # API structure
-                })
-        
-        # Sort sedinte by date descending
-        sedinte.sort(key=lambda x: x.get("data_sedinta", ""), reverse=True)
-        
-        # Section D: Căi de atac
-        cai_raw = dosar.get("caiAtac")
-        cai_list_raw = []
-        if cai_raw:
-            if isinstance(cai_raw, dict) and "DosarCaleAtac" in cai_raw:
-                cai_list_raw = cai_raw.get("DosarCaleAtac", [])
-            elif isinstance(cai_raw, list):
-                cai_list_raw = cai_raw
-        
-        cai_atac = []
-        for c in cai_list_raw:
-            if isinstance(c, dict):
-                cai_atac.append({
-                    "data_declaratie": format_date(c.get("dataDeclarare")),
-                    "parte_declaratoare": safe_str(c.get("parteDeclaratoare")),
-                    "cale_atac": safe_str(c.get("tipCaleAtac")),
-                    "dosar_instanta_superioara": safe_str(c.get("dosarInstantaSuperioara"))
-                })
-        
-        return {
-            "found": True,
-            "detalii": detalii,
-            "parti": parti,
-            "sedinte": sedinte,
-            "cai_atac": cai_atac
-        }
+        return {**normalize_dosar(dosar).to_details(), "sursa": "upstream",
+                "actualizat_la": datetime.now(timezone.utc), "vechime_secunde": 0}
         
+    except UpstreamUnavailableError as e:
+        if mirrored is not None:
+            return mirrored_details(*mirrored, False, degraded=True)
+        return {"error": str(e), "found": False, "degraded": True}
     except Exception as e:
         logging.error(f"Case details error: {e}")
         return {"error": f"Eroare la încărcarea dosarului: {str(e)}", "found": False}
@@ -1141,104 +4099,377 @@ EXPORT_FIELDS = [
     "categorie_caz", "nume_parte", "calitate_parte", "observatii"
 ]
 
-@api_router.post("/dosare/export/xlsx")
-async def export_xlsx(request: UniversalSearchRequest):
-    """Export search results as Excel (.xlsx) - UTF-8"""
-    # Get all results (no pagination for export)
-    search_result = await universal_search(UniversalSearchRequest(
-        termeni=request.termeni, page=1, page_size=10000
-    ))
-    rows = search_result["rows"]
-    
-    # Create Excel file in memory
-    output = io.BytesIO()
-    workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-    worksheet = workbook.add_worksheet('Rezultate')
-    
-    # Header format
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#4472C4',
-        'font_color': 'white',
-        'border': 1
-    })
+async def export_session(request: UniversalSearchRequest) -> Optional[SearchSession]:
+    """
+    Search session being exported: the one named by search_id while it lives,
+    otherwise the search is run again (from the export cache tier) and stored,
+    so exporting the same terms in another format reuses it.
+    """
+    state = search_session_state(request)
+    if state is not None:
+        session = await search_sessions.get(state.get("s") or "", "universal")
+        if session is not None:
+            return session
+    if not any(t.strip() for t in request.termeni):
+        return None
+    rows, extra = await compute_universal_rows(request, SEARCH_CACHE_TTL_EXPORT)
+    return search_sessions.create("universal", "rows", rows, extra, max_page_size=100) or \
+        SearchSession("universal", "rows", rows, extra, max_page_size=100)
+
+def export_rows(session: SearchSession, request: UniversalSearchRequest) -> list:
+    """All rows of the session, filtered and sorted as on screen"""
+    state = search_session_state(request) or {}
+    return session.view(state.get("b"), bool(state.get("d")), state.get("f"))
+
+def export_headers(session: SearchSession, extension: str) -> dict:
+    filename = f"dosare_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return {"Content-Disposition": f"attachment; filename={filename}", "X-Search-Id": session.id}
+
+async def export_stream(request: UniversalSearchRequest) -> tuple:
+    """
+    (session, row batches) for a streamed export. Without a live session and
+    with no sort or filter to apply, rows are produced term by term while
+    later terms are still being searched; the finished set is then stored
+    as a session like any other search.
+    """
+    state = search_session_state(request) or {}
+    session = await search_sessions.get(state.get("s") or "", "universal") if state else None
+    if session is None and not (request.sort_by or request.filtru or state.get("b") or state.get("f")):
+        if not any(t.strip() for t in request.termeni):
+            return None, None
+        session = SearchSession("universal", "rows", [], {}, max_page_size=100)
+        
+        async def live_batches():
+            async for term_rows in iter_universal_rows(request, SEARCH_CACHE_TTL_EXPORT, session.extra):
+                session.rows.extend(term_rows)
+                yield term_rows
+            search_sessions.add(session)
+        
+        return session, live_batches()
     
-    # Write headers
-    for col, header in enumerate(EXPORT_HEADERS):
-        worksheet.write(0, col, header, header_format)
-        worksheet.set_column(col, col, 20)
+    if session is None:
+        session = await export_session(request)
+        if session is None:
+            return None, None
+    rows = export_rows(session, request)
+    
+    async def stored_batches():
+        for start in range(0, len(rows), 1000):
+            yield rows[start:start + 1000]
+    
+    return session, stored_batches()
+
+async def stream_text_export(batches: AsyncIterator[list], start_writer) -> AsyncIterator[bytes]:
+    """
+    Encode rows into chunks of about EXPORT_STREAM_CHUNK_SIZE bytes as they
+    arrive (and after every batch); start_writer(buffer) writes the preamble
+    and returns the row writer.
+    """
+    buffer = io.StringIO()
+    write_row = start_writer(buffer)
+    async for rows in batches:
+        for row in rows:
+            write_row(row)
+            if buffer.tell() >= EXPORT_STREAM_CHUNK_SIZE:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        # Flush after every batch so finished terms go out while later ones are searched
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+def start_csv_export(buffer: io.StringIO):
+    # Add UTF-8 BOM for Excel compatibility
+    buffer.write('\ufeff')
+    writer = csv.writer(buffer, delimiter=',', quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(EXPORT_HEADERS)
+    return lambda row: writer.writerow([row.get(field, "") for field in EXPORT_FIELDS])
+
+def start_txt_export(buffer: io.StringIO):
+    # Add UTF-8 BOM
+    buffer.write('\ufeff')
+    buffer.write('\t'.join(EXPORT_HEADERS) + '\n')
+    
+    def write_row(row: dict):
+        values = [str(row.get(field, "")).replace('\t', ' ').replace('\n', ' ') for field in EXPORT_FIELDS]
+        buffer.write('\t'.join(values) + '\n')
+    
+    return write_row
+
+EXPORT_SESSION_EXPIRED = {"error": "Căutarea a expirat. Reluați căutarea înainte de export"}
+
+EXPORT_PARTI_HEADERS = ["Număr Dosar", "Instanță", "Nume Parte", "Calitate parte"]
+EXPORT_SEDINTE_HEADERS = [
+    "Număr Dosar", "Instanță", "Data", "Ora", "Complet", "Soluție",
+    "Soluție sumar", "Data pronunțare", "Document", "Număr document"
+]
+
+class XlsxExportWriter:
+    """
+    XLSX export written with constant_memory: every row is flushed as soon as
+    it is written, so memory stays flat regardless of the number of rows.
+    Rows must be appended in order; the methods block and belong in the executor.
+    """
+
+    def __init__(self, target, detaliat: bool = False):
+        self.workbook = xlsxwriter.Workbook(target, {'constant_memory': True, 'tmpdir': tempfile.gettempdir()})
+        self.header_format = self.workbook.add_format({
+            'bold': True,
+            'bg_color': '#4472C4',
+            'font_color': 'white',
+            'border': 1
+        })
+        self.cell_format = self.workbook.add_format({'border': 1})
+        self.rows = self._add_sheet('Rezultate', EXPORT_HEADERS)
+        self.parti = self._add_sheet('Părți', EXPORT_PARTI_HEADERS) if detaliat else None
+        self.sedinte = self._add_sheet('Ședințe', EXPORT_SEDINTE_HEADERS) if detaliat else None
+        self._next_row = {}
+        self._seen_cases = set()
+
+    def _add_sheet(self, name: str, headers: List[str]):
+        worksheet = self.workbook.add_worksheet(name)
+        worksheet.set_column(0, len(headers) - 1, 20)
+        worksheet.write_row(0, 0, headers, self.header_format)
+        return worksheet
+
+    def _append(self, worksheet, values: list):
+        row_idx = self._next_row.get(worksheet.name, 1)
+        worksheet.write_row(row_idx, 0, values, self.cell_format)
+        self._next_row[worksheet.name] = row_idx + 1
+
+    def add_rows(self, rows: List[dict]):
+        for row in rows:
+            self._append(self.rows, [row.get(field, "") for field in EXPORT_FIELDS])
+
+    def add_dosare(self, dosare: List[dict]):
+        """Parties and hearings of each case, once per case"""
+        for dosar in dosare:
+            record = normalize_dosar(dosar)
+            if record is None:
+                continue
+            case_key = (record.numar, record.institutie)
+            if case_key in self._seen_cases:
+                continue
+            self._seen_cases.add(case_key)
+            numar = safe_str(record.numar)
+            instanta = INSTITUTII_MAP.get(record.institutie, safe_str(record.institutie))
+            for parte in record.parti:
+                self._append(self.parti, [numar, instanta, safe_str(parte.nume), safe_str(parte.calitate)])
+            for sedinta in record.sedinte:
+                self._append(self.sedinte, [
+                    numar, instanta, sedinta.data_zi or "-", safe_str(sedinta.ora),
+                    safe_str(sedinta.complet), safe_str(sedinta.solutie),
+                    safe_str(sedinta.solutie_sumar), sedinta.data_pronuntare or "-",
+                    safe_str(sedinta.document), safe_str(sedinta.numar_document)
+                ])
+
+    def close(self):
+        self.workbook.close()
+
+async def write_xlsx_export(target, session: SearchSession, request: ExportRequest):
+    """Write the session rows (and, if detaliat, the searched cases' parties and hearings) to target"""
+    loop = asyncio.get_event_loop()
+    writer = await loop.run_in_executor(executor, XlsxExportWriter, target, request.detaliat)
+    try:
+        rows = export_rows(session, request)
+        for start in range(0, len(rows), 1000):
+            await loop.run_in_executor(executor, writer.add_rows, rows[start:start + 1000])
+        if request.detaliat:
+            # Raw cases come from the export cache tier the search has just filled
+            for term in dict.fromkeys(row.get("termen_cautare") for row in rows if row.get("numar_dosar")):
+                try:
+                    dosare = await search_universal_term(term, SEARCH_CACHE_TTL_EXPORT)
+                except UpstreamUnavailableError as e:
+                    logging.error(f"Export details unavailable for term '{term}': {e}")
+                    continue
+                await loop.run_in_executor(executor, writer.add_dosare, dosare)
+    finally:
+        await loop.run_in_executor(executor, writer.close)
+
+class ExportJobStore:
+    """
+    Background XLSX exports. Job state lives in the shared `export_jobs` collection
+    and the files in EXPORT_JOB_DIR, so status and download work from any worker
+    as long as that directory is shared by all of them. Both are removed
+    EXPORT_JOB_TTL seconds after the job finishes.
+    """
+
+    def __init__(self, collection, directory: Path, ttl: int):
+        self.collection = collection
+        self.directory = directory
+        self.ttl = ttl
+        self.running = 0
+        self.done = 0
+        self.failed = 0
+
+    async def start(self, session: SearchSession, request: ExportRequest) -> dict:
+        self._purge_files()
+        job = {
+            "_id": uuid.uuid4().hex,
+            "status": "pending",
+            "rows": len(export_rows(session, request)),
+            "detaliat": request.detaliat,
+            "created_at": datetime.now(timezone.utc),
+            "finished_at": None,
+            "error": None,
+            "filename": f"dosare_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+            "expires_at": datetime.now(timezone.utc) + timedelta(seconds=self.ttl)
+        }
+        await self.collection.insert_one(job)
+        spawn_background(self._run(job, session, request))
+        return job
+
+    async def _run(self, job: dict, session: SearchSession, request: ExportRequest):
+        self.running += 1
+        await self._update(job, status="running")
+        path = self.path(job)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            await write_xlsx_export(str(path), session, request)
+            self.done += 1
+            fields = {"status": "done"}
+        except Exception as e:
+            logging.error(f"Export job {job['_id']} failed: {e}")
+            self.failed += 1
+            fields = {"status": "failed", "error": str(e)}
+            path.unlink(missing_ok=True)
+        finally:
+            self.running -= 1
+        finished_at = datetime.now(timezone.utc)
+        await self._update(job, finished_at=finished_at, expires_at=finished_at + timedelta(seconds=self.ttl), **fields)
+
+    async def _update(self, job: dict, **fields):
+        job.update(fields)
+        try:
+            await self.collection.update_one({"_id": job["_id"]}, {"$set": fields})
+        except Exception as e:
+            logging.warning(f"Export job {job['_id']} update failed: {e}")
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        job = await self.collection.find_one({"_id": job_id})
+        # The TTL monitor runs about once a minute; don't serve what it hasn't removed yet
+        if not job or job["expires_at"].replace(tzinfo=timezone.utc) <= datetime.now(timezone.utc):
+            return None
+        return job
+
+    def path(self, job: dict) -> Path:
+        return self.directory / f"{job['_id']}.xlsx"
+
+    def _purge_files(self):
+        """Files whose job has expired; any worker may remove those of the others"""
+        cutoff = time.time() - self.ttl
+        try:
+            for path in self.directory.glob("*.xlsx"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+        except OSError as e:
+            logging.warning(f"Export job cleanup failed: {e}")
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def stats(self) -> dict:
+        """Jobs run by this worker"""
+        return {"running": self.running, "done": self.done, "failed": self.failed}
+
+export_jobs = ExportJobStore(db.export_jobs, EXPORT_JOB_DIR, EXPORT_JOB_TTL)
+
+def export_job_response(job: dict) -> dict:
+    response = {"id": job["_id"], **{key: job[key] for key in ("status", "rows", "detaliat", "error")}}
+    response["status_url"] = f"/api/dosare/export/jobs/{job['_id']}"
+    response["download_url"] = f"/api/dosare/export/jobs/{job['_id']}/download" if job["status"] == "done" else None
+    return response
+
+@dosare_router.post("/export/xlsx")
+async def export_xlsx(request: ExportRequest):
+    """
+    Export search results as Excel (.xlsx) - UTF-8.
+    With fundal=true the export is started as a background job and answered
+    with its status / download link instead of the file.
+    """
+    # All rows of the search (no pagination for export)
+    session = await export_session(request)
+    if session is None:
+        return EXPORT_SESSION_EXPIRED
     
-    # Write data
-    cell_format = workbook.add_format({'border': 1})
-    for row_idx, row in enumerate(rows, start=1):
-        for col_idx, field in enumerate(EXPORT_FIELDS):
-            worksheet.write(row_idx, col_idx, row.get(field, ""), cell_format)
+    if request.fundal:
+        return export_job_response(await export_jobs.start(session, request))
     
-    workbook.close()
+    # Kept in memory while small, spilled to disk beyond EXPORT_XLSX_SPOOL_SIZE
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_XLSX_SPOOL_SIZE)
+    try:
+        await write_xlsx_export(output, session, request)
+    except Exception:
+        output.close()
+        raise
     output.seek(0)
     
-    filename = f"dosare_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    def read_chunks():
+        try:
+            while chunk := output.read(EXPORT_STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            output.close()
     
     return StreamingResponse(
-        output,
+        read_chunks(),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers=export_headers(session, "xlsx")
+    )
+
+@dosare_router.get("/export/jobs/{job_id}")
+async def get_export_job(job_id: str):
+    """Status of a background export - PUBLIC (the job id is the capability)"""
+    job = await export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Exportul nu există sau a expirat")
+    return export_job_response(job)
+
+@dosare_router.get("/export/jobs/{job_id}/download")
+async def download_export_job(job_id: str):
+    job = await export_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Exportul nu există sau a expirat")
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail="Exportul nu este încă gata")
+    path = export_jobs.path(job)
+    if not path.exists():
+        logging.error(f"Export job {job_id} is done but {path} is missing: is EXPORT_JOB_DIR shared by all workers?")
+        raise HTTPException(status_code=404, detail="Fișierul exportului nu mai este disponibil")
+    return FileResponse(
+        path,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        filename=job["filename"]
     )
 
-@api_router.post("/dosare/export/csv")
+@dosare_router.post("/export/csv")
 async def export_csv(request: UniversalSearchRequest):
-    """Export search results as CSV - UTF-8 with BOM"""
-    search_result = await universal_search(UniversalSearchRequest(
-        termeni=request.termeni, page=1, page_size=10000
-    ))
-    rows = search_result["rows"]
-    
-    output = io.StringIO()
-    # Add UTF-8 BOM for Excel compatibility
-    output.write('\ufeff')
-    
-    writer = csv.writer(output, delimiter=',', quoting=csv.QUOTE_MINIMAL)
-    writer.writerow(EXPORT_HEADERS)
-    
-    for row in rows:
-        writer.writerow([row.get(field, "") for field in EXPORT_FIELDS])
-    
-    content = output.getvalue()
-    filename = f"dosare_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    """Export search results as CSV - UTF-8 with BOM, streamed as rows are produced"""
+    session, batches = await export_stream(request)
+    if session is None:
+        return EXPORT_SESSION_EXPIRED
     
     return StreamingResponse(
-        io.BytesIO(content.encode('utf-8')),
+        stream_text_export(batches, start_csv_export),
         media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers=export_headers(session, "csv")
     )
 
-@api_router.post("/dosare/export/txt")
+@dosare_router.post("/export/txt")
 async def export_txt(request: UniversalSearchRequest):
-    """Export search results as TXT - Tab-separated, UTF-8"""
-    search_result = await universal_search(UniversalSearchRequest(
-        termeni=request.termeni, page=1, page_size=10000
-    ))
-    rows = search_result["rows"]
-    
-    output = io.StringIO()
-    # Add UTF-8 BOM
-    output.write('\ufeff')
-    
-    # Header
-    output.write('\t'.join(EXPORT_HEADERS) + '\n')
-    
-    # Data
-    for row in rows:
-        values = [str(row.get(field, "")).replace('\t', ' ').replace('\n', ' ') for field in EXPORT_FIELDS]
-        output.write('\t'.join(values) + '\n')
-    
-    content = output.getvalue()
-    filename = f"dosare_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    """Export search results as TXT - Tab-separated, UTF-8, streamed as rows are produced"""
+    session, batches = await export_stream(request)
+    if session is None:
+        return EXPORT_SESSION_EXPIRED
     
     return StreamingResponse(
-        io.BytesIO(content.encode('utf-8')),
+        stream_text_export(batches, start_txt_export),
         media_type="text/plain; charset=utf-8",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers=export_headers(session, "txt")
     )
 
 # ============== PROCESS DOSAR ==============
@@ -1252,83 +4483,52 @@ def process_dosar(dosar) -> dict:
     if not isinstance(dosar, dict):
         return {"numar": str(dosar), "parti": [], "sedinte": [], "caiAtac": []}
     
-    processed = {
-        "numar": dosar.get("numar", ""),
-        "numarVechi": dosar.get("numarVechi", ""),
-        "data": str(dosar.get("data", "")) if dosar.get("data") else "",
-        "institutie": str(dosar.get("institutie", "")),
-        "departament": dosar.get("departament", ""),
-        "categorieCaz": str(dosar.get("categorieCaz", "")),
-        "stadiuProcesual": str(dosar.get("stadiuProcesual", "")),
-        "obiect": dosar.get("obiect", ""),
-    }
-    
-    # Process parties - handle nested DosarParte structure
-    parti_raw = dosar.get("parti")
-    if parti_raw:
-        # Check if it's the nested structure with DosarParte
-        if isinstance(parti_raw, dict) and "DosarParte" in parti_raw:
-            parti_list = parti_raw.get("DosarParte", [])
-        elif isinstance(parti_raw, list):
-            parti_list = parti_raw
-        else:
-            parti_list = []
-        
-        processed["parti"] = [
-            {"nume": p.get("nume", ""), "calitateParte": p.get("calitateParte", "")}
-            for p in parti_list if p and isinstance(p, dict)
-        ]
-    else:
-        processed["parti"] = []
-    
-    # Process hearings - handle nested DosarSedinta structure
-    sedinte_raw = dosar.get("sedinte")
-    if sedinte_raw:
-        if isinstance(sedinte_raw, dict) and "DosarSedinta" in sedinte_raw:
-            sedinte_list = sedinte_raw.get("DosarSedinta", [])
-        elif isinstance(sedinte_raw, list):
-            sedinte_list = sedinte_raw
-        else:
-            sedinte_list = []
-        
-        processed["sedinte"] = [
-            {
-                "complet": s.get("complet", ""),
-                "data": str(s.get("data", "")) if s.get("data") else "",
-                "ora": s.get("ora", ""),
-                "solutie": s.get("solutie", ""),
-                "solutieSumar": s.get("solutieSumar", "")
-            }
-            for s in sedinte_list if s and isinstance(s, dict)
-        ]
-    else:
-        processed["sedinte"] = []
-    
-    # Process appeals - handle nested DosarCaleAtac structure
-    cai_raw = dosar.get("caiAtac")
-    if cai_raw:
-        if isinstance(cai_raw, dict) and "DosarCaleAtac" in cai_raw:
-            cai_list = cai_raw.get("DosarCaleAtac", [])
-        elif isinstance(cai_raw, list):
-            cai_list = cai_raw
-        else:
-            cai_list = []
-        
-        processed["caiAtac"] = [
-            {
-                "dataDeclarare": str(c.get("dataDeclarare", "")) if c.get("dataDeclarare") else "",
-                "parteDeclaratoare": c.get("parteDeclaratoare", ""),
-                "tipCaleAtac": c.get("tipCaleAtac", "")
-            }
-            for c in cai_list if c and isinstance(c, dict)
-        ]
-    else:
-        processed["caiAtac"] = []
-    
-    return processed
+    return normalize_dosar(dosar).to_result()
 
 # ============== MONITORIZARE ROUTES ==============
 
+def monitor_next_check(delay: float) -> datetime:
+    """Now + delay, jittered by MONITOR_JITTER so cases added together don't stay in lockstep"""
+    delay *= 1 + random.uniform(-MONITOR_JITTER, MONITOR_JITTER)
+    return datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+class EmptySnapshotError(Exception):
+    """just.ro answered a monitored case's lookup normally, but with no case at all"""
+
+async def refresh_monitored_snapshot(case: dict, cache_ttl: int = 0) -> tuple:
+    """
+    Fetch the latest snapshot of a monitored case, store it, schedule the next
+    check and notify the owner on changes. Returns (has_changes, new snapshot);
+    raises UpstreamUnavailableError, or EmptySnapshotError for an empty answer
+    (which would otherwise erase the snapshot the next change is detected
+    against), leaving the case untouched.
+    """
+    new_data = await async_cautare_dosare(
+        numar_dosar=case["numar_dosar"], institutie=case.get("institutie"), cache_ttl=cache_ttl
+    )
+    if not new_data:
+        raise EmptySnapshotError("Portalul nu a returnat dosarul; ultima versiune salvată a fost păstrată")
+    new_snapshot = new_data[0]
+    
+    # Check for changes
+    has_changes = check_case_changes(case.get("last_snapshot"), new_snapshot)
+    
+    await db.monitored_cases.update_one(
+        {"id": case["id"]},
+        {"$set": {"last_snapshot": new_snapshot, "last_check": datetime.now(timezone.utc).isoformat(),
+                  "next_check_at": monitor_next_check(MONITOR_INTERVAL), "failures": 0},
+         "$unset": {"last_error": ""}}
+    )
+    
+    if has_changes:
+        await create_notification(
+            case["user_id"],
+            case["numar_dosar"],
+            "Dosarul a fost actualizat cu informații noi.",
+            "case_update"
+        )
+    return has_changes, new_snapshot
+
 @api_router.post("/monitorizare")
 async def add_monitored_case(case_data: MonitoredCaseCreate, user: dict = Depends(get_current_user)):
     """Add a case to monitoring list"""
@@ -1341,7 +4541,10 @@ async def add_monitored_case(case_data: MonitoredCaseCreate, user: dict = Depend
         raise HTTPException(status_code=400, detail="Case already monitored")
     
     # Fetch initial case data
-    case_snapshot = await async_cautare_dosare(numar_dosar=case_data.numar_dosar, institutie=case_data.institutie)
+    try:
+        case_snapshot = await async_cautare_dosare(numar_dosar=case_data.numar_dosar, institutie=case_data.institutie, cache_ttl=0)
+    except UpstreamUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     
     case_id = str(uuid.uuid4())
     now = datetime.now(timezone.utc).isoformat()
@@ -1355,7 +4558,10 @@ async def add_monitored_case(case_data: MonitoredCaseCreate, user: dict = Depend
         "last_snapshot": case_snapshot[0] if case_snapshot else None,
         "last_check": now,
         "created_at": now,
-        "is_active": True
+        "is_active": True,
+        "next_check_at": monitor_next_check(MONITOR_INTERVAL),
+        "lease_until": datetime.fromtimestamp(0, timezone.utc),
+        "failures": 0
     }
     
     await db.monitored_cases.insert_one(doc)
@@ -1367,7 +4573,7 @@ async def get_monitored_cases(user: dict = Depends(get_current_user)):
     """Get user's monitored cases"""
     cases = await db.monitored_cases.find(
         {"user_id": user["id"], "is_active": True},
-        {"_id": 0}
+        {"_id": 0, "lease_until": 0, "owner": 0}
     ).to_list(100)
     
     return {"cases": cases, "count": len(cases)}
@@ -1391,34 +4597,23 @@ async def refresh_monitored_case(case_id: str, user: dict = Depends(get_current_
     if not case:
         raise HTTPException(status_code=404, detail="Monitored case not found")
     
-    # Fetch latest data
-    new_data = await async_cautare_dosare(numar_dosar=case["numar_dosar"], institutie=case.get("institutie"))
-    new_snapshot = new_data[0] if new_data else None
-    
-    now = datetime.now(timezone.utc).isoformat()
-    
-    # Check for changes
-    old_snapshot = case.get("last_snapshot")
-    has_changes = check_case_changes(old_snapshot, new_snapshot)
-    
-    # Update
-    await db.monitored_cases.update_one(
-        {"id": case_id},
-        {"$set": {"last_snapshot": new_snapshot, "last_check": now}}
-    )
-    
-    if has_changes and new_snapshot:
-        await create_notification(
-            user["id"],
-            case["numar_dosar"],
-            "Dosarul a fost actualizat cu informații noi.",
-            "case_update"
-        )
+    try:
+        has_changes, new_snapshot = await refresh_monitored_snapshot(case)
+    except UpstreamUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except EmptySnapshotError as e:
+        # The portal is up but has no such case right now: nothing changed, the saved data stays
+        last_snapshot = case.get("last_snapshot")
+        return {
+            "message": str(e),
+            "has_changes": False,
+            "data": process_dosar(last_snapshot) if last_snapshot else None
+        }
     
     return {
         "message": "Case refreshed",
         "has_changes": has_changes,
-        "data": process_dosar(new_snapshot) if new_snapshot else None
+        "data": process_dosar(new_snapshot)
     }
 
 def check_case_changes(old: dict, new: dict) -> bool:
@@ -1429,19 +4624,162 @@ def check_case_changes(old: dict, new: dict) -> bool:
         return False
     
     # Check number of hearings
-    old_sedinte = len(old.get("sedinte", []) or [])
-    new_sedinte = len(new.get("sedinte", []) or [])
+    old_sedinte = len(soap_items(old.get("sedinte"), "DosarSedinta"))
+    new_sedinte = len(soap_items(new.get("sedinte"), "DosarSedinta"))
     if new_sedinte > old_sedinte:
         return True
     
     # Check appeals
-    old_cai = len(old.get("caiAtac", []) or [])
-    new_cai = len(new.get("caiAtac", []) or [])
+    old_cai = len(soap_items(old.get("caiAtac"), "DosarCaleAtac"))
+    new_cai = len(soap_items(new.get("caiAtac"), "DosarCaleAtac"))
     if new_cai > old_cai:
         return True
     
     return False
 
+# ============== MONITORING SCHEDULER ==============
+
+class MonitoringScheduler:
+    """
+    Refreshes every active monitored case when its `next_check_at` comes due.
+    Due cases are claimed under a lease, so several processes share the queue
+    without checking a case twice; checks run MONITOR_CONCURRENCY at a time and
+    only go upstream while interactive searches leave headroom in the adaptive
+    limiter. Failed checks back off exponentially up to MONITOR_BACKOFF_MAX.
+    """
+
+    def __init__(self, collection, concurrency: int, lease: int):
+        self.collection = collection
+        self.owner = uuid.uuid4().hex
+        self.concurrency = concurrency
+        self.lease = lease
+        self._wakeup: Optional[asyncio.Event] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._active: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+        self._lags: deque = deque(maxlen=1000)  # seconds between due time and claim
+        self._refreshed_at: deque = deque()  # monotonic times of the last 10 minutes' checks
+        self.refreshed = 0
+        self.changes = 0
+        self.failures = 0
+
+    def start(self):
+        if not MONITOR_POLLING:
+            return
+        self._wakeup = asyncio.Event()
+        self._poller = spawn_background(self._poll())
+
+    async def stop(self):
+        self._stopping = True
+        tasks = [task for task in [self._poller, *self._active.values()] if task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _schedule_unscheduled(self):
+        """Cases created before polling existed are due now"""
+        await self.collection.update_many(
+            {"is_active": True, "next_check_at": {"$exists": False}},
+            {"$set": {"next_check_at": datetime.now(timezone.utc),
+                      "lease_until": datetime.fromtimestamp(0, timezone.utc), "failures": 0}}
+        )
+
+    async def _poll(self):
+        # wait_for can swallow a cancellation that races with the wakeup, hence the flag
+        scheduled = False
+        while not self._stopping:
+            try:
+                if not scheduled:
+                    await self._schedule_unscheduled()
+                    scheduled = True
+                await self._claim_due()
+            except Exception as e:
+                logging.error(f"Monitoring poll failed: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=MONITOR_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _claim_due(self):
+        while len(self._active) < self.concurrency:
+            # Wait before claiming, so the lease only has to cover the check itself
+            await upstream_limiter.wait_for_headroom(MONITOR_UPSTREAM_SHARE)
+            now = datetime.now(timezone.utc)
+            case = await self.collection.find_one_and_update(
+                {"is_active": True, "next_check_at": {"$lte": now}, "lease_until": {"$lt": now},
+                 "id": {"$nin": list(self._active)}},
+                {"$set": {"owner": self.owner, "lease_until": now + timedelta(seconds=self.lease)}},
+                sort=[("next_check_at", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if not case:
+                return
+            self._lags.append((now - case["next_check_at"].replace(tzinfo=timezone.utc)).total_seconds())
+            task = spawn_background(self._check(case))
+            self._active[case["id"]] = task
+            task.add_done_callback(lambda _, case_id=case["id"]: self._finished(case_id))
+
+    def _finished(self, case_id: str):
+        self._active.pop(case_id, None)
+        if self._wakeup is not None:
+            self._wakeup.set()  # a slot is free: claim the next due case now
+
+    async def _check(self, case: dict):
+        try:
+            # Users monitoring the same case share one upstream call per cache window
+            has_changes, _ = await refresh_monitored_snapshot(case, cache_ttl=SEARCH_CACHE_TTL_SEARCH)
+            release = {"lease_until": datetime.fromtimestamp(0, timezone.utc)}
+            self.refreshed += 1
+            self.changes += 1 if has_changes else 0
+            now = time.monotonic()
+            self._refreshed_at.append(now)
+            while self._refreshed_at and now - self._refreshed_at[0] > 600:
+                self._refreshed_at.popleft()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            failures = case.get("failures", 0) + 1
+            delay = min(MONITOR_BACKOFF_MAX, MONITOR_BACKOFF_BASE * 2 ** (failures - 1))
+            release = {"lease_until": datetime.fromtimestamp(0, timezone.utc), "failures": failures,
+                       "last_error": str(e), "next_check_at": monitor_next_check(delay)}
+            self.failures += 1
+            logging.warning(f"Monitoring check of {case['numar_dosar']} failed ({failures}x), retry in {delay}s: {e}")
+        await self.collection.update_one({"id": case["id"], "owner": self.owner}, {"$set": release})
+
+    async def due_count(self) -> int:
+        return await self.collection.count_documents(
+            {"is_active": True, "next_check_at": {"$lte": datetime.now(timezone.utc)}}
+        )
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("is_active", 1), ("next_check_at", 1)])
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        per_minute = [0] * 10  # index 0 = the last minute
+        for refreshed_at in self._refreshed_at:
+            minute = int((now - refreshed_at) // 60)
+            if minute < 10:
+                per_minute[minute] += 1
+        lags = sorted(self._lags)
+        return {
+            "enabled": MONITOR_POLLING,
+            "owner": self.owner,
+            "active": len(self._active),
+            "refreshed": self.refreshed,
+            "changes": self.changes,
+            "failures": self.failures,
+            "refreshed_per_minute": per_minute,
+            "lag_seconds": {
+                "p50": round(lags[len(lags) // 2], 1),
+                "p95": round(lags[min(len(lags) - 1, int(len(lags) * 0.95))], 1),
+                "max": round(lags[-1], 1)
+            } if lags else None
+        }
+
+monitoring_scheduler = MonitoringScheduler(db.monitored_cases, MONITOR_CONCURRENCY, MONITOR_LEASE)
+
 # ============== NOTIFICATIONS ROUTES ==============
 
 async def create_notification(user_id: str, case_number: str, message: str, notif_type: str):
@@ -1535,7 +4873,19 @@ async def admin_get_stats(admin: dict = Depends(get_admin_user)):
         "total_users": total_users,
         "active_users": active_users,
         "total_monitored_cases": total_monitored,
-        "total_notifications": total_notifications
+        "total_notifications": total_notifications,
+        "soap_clients": soap_client_pool.stats(),
+        "search_cache": search_cache.stats(),
+        "single_flight": upstream_flights.stats(),
+        "upstream": {"limiter": upstream_limiter.stats(), "breaker": upstream_breaker.stats()},
+        "court_latency_ms": court_latency.stats(),
+        "court_routing": court_router.stats(),
+        "search_sessions": search_sessions.stats(),
+        "export_jobs": export_jobs.stats(),
+        "search_jobs": search_job_runner.stats(),
+        "party_index": party_index.stats(),
+        "case_mirror": case_mirror.stats(),
+        "monitoring": {**monitoring_scheduler.stats(), "due": await monitoring_scheduler.due_count()}
     }
 
 # ============== HEALTH CHECK ==============
@@ -1546,10 +4896,15 @@ async def root():
 
 @api_router.get("/health")
 async def health():
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+    return {
+        "status": "healthy",
+        "upstream": upstream_breaker.state,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
 
 # Include the router in the main app
 app.include_router(api_router)
+app.include_router(dosare_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1566,6 +4921,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    try:
+        await search_cache.ensure_indexes()
+        await search_sessions.ensure_indexes()
+        await export_jobs.ensure_indexes()
+        await court_router.load()
+        await search_job_runner.ensure_indexes()
+        await party_index.ensure_indexes()
+        await case_mirror.ensure_indexes()
+        await monitoring_scheduler.ensure_indexes()
+    except Exception as e:
+        logging.warning(f"Could not create indexes: {e}")
+
+@app.on_event("startup")
+async def build_soap_client():
+    if SOAP_TRANSPORT != "thread" and not SOAP_FAST_PATH:
+        try:
+            await get_async_soap_client()
+        except Exception as e:
+            # Retried on the first upstream call
+            logging.warning(f"Could not build the SOAP client: {e}")
+
+@app.on_event("startup")
+async def start_search_jobs():
+    # Also resumes the jobs of a previous process once their lease has expired
+    search_job_runner.start()
+
+@app.on_event("startup")
+async def start_monitoring_scheduler():
+    monitoring_scheduler.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await search_job_runner.stop()
+    await monitoring_scheduler.stop()
     client.close()
+    await close_async_soap_client()
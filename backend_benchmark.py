@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Backend Benchmarks for Portal Dosare
+Measures per-call overhead of the hot paths in backend/server.py:
+1. SOAP client setup (new zeep Client per call vs pooled client)
+2. CautareDosare response parsing (zeep + serialize_object vs lxml fast path)
+3. Case-number searches: national lookup vs court-code routed lookup (live upstream)
+4. JSON rendering of a large universal-search response (jsonable_encoder + json vs orjson)
+5. Dosar views: each view re-unwrapping the raw dosar vs one DosarRecord rendered three ways
+6. Diacritic normalization: NFD + category loop vs translation table, memo and batch API
+7. Institution lookup: linear scans over INSTITUTII_MAP vs the prefix / trigram index
+8. Party matching: per-term substring scans vs one Aho-Corasick pass for every name term
+9. Party index: upstream party-name search vs the local parti_index (live portal + MongoDB)
+"""
+
+import asyncio
+import os
+import sys
+import time
+import statistics
+import tracemalloc
+from typing import Callable, Dict, Any, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "portal_dosare_benchmark")
+
+import server  # noqa: E402
+import requests  # noqa: E402
+from zeep import Client  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+
+def synthetic_dosare_reply(count: int) -> bytes:
+    """CautareDosare reply with `count` cases, shaped like a broad party-name search"""
+    dosar = (
+        "<Dosar><parti>"
+        + "".join(f"<DosarParte><nume>POPESCU ION {i}</nume><calitateParte>Pârât</calitateParte></DosarParte>"
+                  for i in range(6))
+        + "</parti><sedinte>"
+        + "".join(f"<DosarSedinta><complet>C{i}</complet><data>2024-0{i + 1}-10T00:00:00</data><ora>09:00</ora>"
+                  f"<solutie>Amână</solutie><solutieSumar>amânare pentru lipsă de procedură</solutieSumar>"
+                  f"<dataPronuntare xsi:nil=\"true\"/><documentSedinta xsi:nil=\"true\"/>"
+                  f"<dataDocument xsi:nil=\"true\"/></DosarSedinta>" for i in range(4))
+        + "</sedinte><numar>{n}/3/2024</numar><data>2024-01-15T00:00:00</data>"
+        "<institutie>TribunalulBUCURESTI</institutie><departament>Secţia a VI-a civilă</departament>"
+        "<categorieCaz>Civil</categorieCaz><stadiuProcesual>Fond</stadiuProcesual><obiect>pretenţii</obiect></Dosar>"
+    )
+    body = "".join(dosar.replace("{n}", str(n)) for n in range(count))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><soap:Envelope '
+        'xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"><soap:Body>'
+        '<CautareDosareResponse xmlns="portalquery.just.ro"><CautareDosareResult>'
+        f"{body}</CautareDosareResult></CautareDosareResponse></soap:Body></soap:Envelope>"
+    ).encode("utf-8")
+
+
+class PortalDosareBenchmark:
+    def __init__(self, iterations: int = 50):
+        self.iterations = iterations
+        self.results: List[Dict[str, Any]] = []
+
+    def measure(self, name: str, fn: Callable[[], Any], iterations: int = None) -> Dict[str, Any]:
+        """Run fn repeatedly and report median / p95 time per call in ms"""
+        iterations = iterations or self.iterations
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        result = {
+            "name": name,
+            "iterations": iterations,
+            "median_ms": statistics.median(timings),
+            "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        }
+        self.results.append(result)
+        print(f"⏱  {name}: median {result['median_ms']:.3f} ms, p95 {result['p95_ms']:.3f} ms ({iterations} runs)")
+        return result
+
+    def bench_soap_client_setup(self):
+        """Per-call SOAP client overhead: old Client(WSDL) per call vs pooled client"""
+        print("== SOAP client setup ==")
+        try:
+            self.measure("remote WSDL, new Client per call (before)",
+                         lambda: Client(server.SOAP_WSDL), iterations=5)
+        except Exception as e:
+            print(f"    remote WSDL not reachable, skipped: {e}")
+        before = self.measure("vendored WSDL, new Client per call",
+                              lambda: Client(str(server.SOAP_WSDL_LOCAL)))
+        server.get_soap_client()  # warm up the calling thread's client
+        after = self.measure("pooled client (after)", server.get_soap_client, iterations=self.iterations * 100)
+        if after["median_ms"] > 0:
+            print(f"    speedup vs vendored per-call Client: {before['median_ms'] / after['median_ms']:.0f}x")
+        print()
+
+    def peak_memory_mb(self, fn: Callable[[], Any]) -> float:
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak / (1024 * 1024)
+
+    def bench_response_parsing(self, cases: int = 2000):
+        """CPU and peak memory to turn a large CautareDosare reply into dicts"""
+        print(f"== CautareDosare parsing ({cases} cases) ==")
+        reply = synthetic_dosare_reply(cases)
+        soap_client = Client(str(server.SOAP_WSDL_LOCAL))
+        binding = soap_client.service._binding
+        operation = binding._operations["CautareDosare"]
+
+        def zeep_path():
+            response = requests.Response()
+            response.status_code = 200
+            response._content = reply
+            response.headers["Content-Type"] = "text/xml; charset=utf-8"
+            return server.dosare_result_to_list(binding.process_reply(soap_client, operation, response))
+
+        def fast_path():
+            parser = server.SoapRecordParser("Dosar", server.DOSAR_FIELDS)
+            records = []
+            for start in range(0, len(reply), 65536):
+                records.extend(parser.feed(reply[start:start + 65536]))
+            records.extend(parser.close())
+            return records
+
+        before = self.measure("zeep + serialize_object (before)", zeep_path, iterations=5)
+        after = self.measure("lxml streaming parser (after)", fast_path, iterations=5)
+        print(f"    per case: {before['median_ms'] * 1000 / cases:.1f} µs -> {after['median_ms'] * 1000 / cases:.1f} µs")
+        print(f"    peak memory: {self.peak_memory_mb(zeep_path):.1f} MB -> {self.peak_memory_mb(fast_path):.1f} MB")
+        print()
+
+    def bench_court_routing(self, numere: List[str] = None, iterations: int = 3):
+        """Upstream time for case-number searches: national lookup vs targeted court"""
+        numere = numere or ["1/3/2024", "100/299/2024", "250/300/2023", "75/2/2024"]
+        print("== Case-number search: national vs court-code routing ==")
+        plan = lambda: [server.court_router.route(numar) for numar in numere]
+        self.measure("routing table lookup", plan, iterations=self.iterations * 100)
+        
+        national_ms = routed_ms = 0.0
+        for numar in numere:
+            institutie = server.court_router.route(numar)
+            if not institutie:
+                print(f"    {numar}: no court code known, skipped")
+                continue
+            try:
+                before = self.measure(f"{numar} national (before)",
+                                      lambda: server.soap_cautare_dosare(numar_dosar=numar), iterations)
+                after = self.measure(f"{numar} -> {institutie} (after)",
+                                     lambda: server.soap_cautare_dosare(numar_dosar=numar, institutie=institutie),
+                                     iterations)
+            except Exception as e:
+                print(f"    portal not reachable, skipped: {e}")
+                break
+            national_ms += before["median_ms"]
+            routed_ms += after["median_ms"]
+        if national_ms:
+            print(f"    upstream time: {national_ms:.0f} ms -> {routed_ms:.0f} ms "
+                  f"({(1 - routed_ms / national_ms) * 100:.0f}% saved)")
+        print()
+
+    def bench_json_serialization(self, rows: int = 10000):
+        """CPU and peak memory to render a large universal-search response body"""
+        print(f"== JSON response rendering ({rows} rows) ==")
+        parser = server.SoapRecordParser("Dosar", server.DOSAR_FIELDS)
+        records = parser.feed(synthetic_dosare_reply(100)) + parser.close()
+        payload = {
+            "rows": [server.process_dosar_to_row(records[i % len(records)], "popescu", "Nume parte")
+                     for i in range(rows)],
+            "total_count": rows,
+            "search_id": "benchmark",
+            "next_cursor": None,
+            "prev_cursor": None,
+        }
+        before = self.measure("jsonable_encoder + JSONResponse (before)",
+                              lambda: JSONResponse(jsonable_encoder(payload)), iterations=5)
+        after = self.measure("FastJSONResponse / orjson (after)",
+                             lambda: server.FastJSONResponse(payload), iterations=5)
+        if after["median_ms"] > 0:
+            print(f"    speedup: {before['median_ms'] / after['median_ms']:.1f}x")
+        print(f"    peak memory: {self.peak_memory_mb(lambda: JSONResponse(jsonable_encoder(payload))):.1f} MB "
+              f"-> {self.peak_memory_mb(lambda: server.FastJSONResponse(payload)):.1f} MB")
+        print()
+
+    def bench_dosar_views(self, cases: int = 2000):
+        """Per-case cost of the result, table-row and details views of the same cases"""
+        print(f"== Dosar views ({cases} cases) ==")
+        parser = server.SoapRecordParser("Dosar", server.DOSAR_FIELDS)
+        dosare = parser.feed(synthetic_dosare_reply(cases)) + parser.close()
+        normalize = server.DosarRecord.from_soap
+
+        def per_view():
+            for dosar in dosare:
+                normalize(dosar).to_result()
+                normalize(dosar).to_row("popescu", "Nume parte")
+                normalize(dosar).to_details()
+
+        def one_record():
+            for dosar in dosare:
+                record = normalize(dosar)
+                record.to_result()
+                record.to_row("popescu", "Nume parte")
+                record.to_details()
+
+        self.measure("normalize", lambda: [normalize(dosar) for dosar in dosare], iterations=5)
+        before = self.measure("three views, re-normalized per view (before)", per_view, iterations=5)
+        after = self.measure("three views from one record (after)", one_record, iterations=5)
+        print(f"    per case: {before['median_ms'] * 1000 / cases:.1f} µs -> {after['median_ms'] * 1000 / cases:.1f} µs")
+        rows = lambda: [server.process_dosar_to_row(dosar, "popescu", "Nume parte") for dosar in dosare]
+        rows()  # records are now memoized, as for a search-cache hit
+        cached = self.measure("table rows of cached cases (memoized records)", rows, iterations=5)
+        print(f"    per case on a cache hit: {cached['median_ms'] * 1000 / cases:.1f} µs")
+        print()
+
+    def bench_diacritics(self, names: int = 20000):
+        """Per-name cost of normalize_diacritics over party names with realistic repetition"""
+        print(f"== Diacritic normalization ({names} party names) ==")
+        base = ["POPESCU ION", "SC ȘTEFĂNESCU & FIII SRL", "Ţăranu Mărioara", "IONESCU VASILE",
+                "Direcţia Generală Regională a Finanţelor Publice Iaşi", "MUNICIPIUL BUCUREȘTI PRIN PRIMAR GENERAL",
+                "Brânză Ştefan-Cătălin", "ANAF", "Ministerul Public - Parchetul de pe lângă Tribunalul Bacău"]
+        parti = [f"{base[i % len(base)]} {i % 500}" for i in range(names)]
+        unicode_path = lambda: [server._strip_marks(name).upper() for name in parti]
+
+        def cold():
+            server._normalize_non_ascii.cache_clear()
+            return [server.normalize_diacritics(name) for name in parti]
+
+        before = self.measure("NFD + unicodedata.category loop (before)", unicode_path, iterations=5)
+        table = self.measure("translation table, cold memo", cold, iterations=5)
+        warm = self.measure("translation table, warm memo (after)",
+                            lambda: [server.normalize_diacritics(name) for name in parti], iterations=5)
+        batch = self.measure("normalize_diacritics_batch", lambda: server.normalize_diacritics_batch(parti), iterations=5)
+        per_name = lambda result: result["median_ms"] * 1e6 / names
+        print(f"    per name: {per_name(before):.0f} ns -> cold {per_name(table):.0f} ns, "
+              f"warm {per_name(warm):.0f} ns, batch {per_name(batch):.0f} ns")
+        print()
+
+    def bench_institution_lookup(self):
+        """Resolving / suggesting institutions: two linear scans per lookup vs InstitutionIndex"""
+        print("== Institution lookup ==")
+        queries = ["Tribunalul Iaşi", "sector 3", "Judecatoria Bufta", "ca cluj", "jud"]
+
+        def linear_scan(term: str):
+            normalized_search = server.normalize_diacritics(term)
+            for key, name in server.INSTITUTII_MAP.items():
+                if (server.normalize_diacritics(name) == normalized_search
+                        or server.normalize_diacritics(key) == normalized_search):
+                    return key
+            for key, name in server.INSTITUTII_MAP.items():
+                if normalized_search in server.normalize_diacritics(name):
+                    return key
+            return None
+
+        n = self.iterations * 10
+        self.measure("build InstitutionIndex", lambda: server.InstitutionIndex(server.INSTITUTII_MAP), iterations=5)
+        before = self.measure("linear scans (before)", lambda: [linear_scan(q) for q in queries], iterations=n)
+        after = self.measure("index resolve (after)",
+                             lambda: [server.institution_index.resolve(q) for q in queries], iterations=n)
+        suggest = self.measure("index suggest, 10 results",
+                               lambda: [server.institution_index.suggest(q) for q in queries], iterations=n)
+        per_query = lambda result: result["median_ms"] * 1000 / len(queries)
+        print(f"    per query: {per_query(before):.0f} µs -> resolve {per_query(after):.1f} µs, "
+              f"suggest {per_query(suggest):.1f} µs")
+        print()
+
+    def bench_party_matching(self, cases: int = 500, term_counts: tuple = (10, 50, 150)):
+        """Matching the parties of each case against every name term of a large universal search"""
+        print(f"== Party matching ({cases} cases, 8 parties each) ==")
+        surnames = ["POPESCU", "IONESCU", "POPA", "Ştefănescu", "DUMITRU", "STAN", "Stoica", "GHEORGHE",
+                    "Rusu", "MUNTEANU", "Matei", "CONSTANTIN", "Șerban", "MOLDOVAN", "Lazăr", "NEAGU"]
+        given = ["ION", "Maria", "VASILE", "Elena", "GHEORGHE", "Ana", "Ştefan", "MIHAI", "Ioana", "ANDREI"]
+        name = lambda i: f"{surnames[i * 7 % len(surnames)]} {given[i * 3 % len(given)]} {given[i % len(given)]}"
+        records = [
+            server.DosarRecord(str(c), "", "", "", "", "", "", "", "", "",
+                               [server.ParteRecord(name(c * 8 + k), "Pârât") for k in range(8)], [], [])
+            for c in range(cases)
+        ]
+
+        def per_term(termeni):
+            # Previous row code: normalize the term, substring-test each party, stop at the first hit
+            for record in records:
+                for term in termeni:
+                    search_normalized = server.normalize_diacritics(term)
+                    next((p for p in record.parti if search_normalized in server.normalize_diacritics(p.nume)), None)
+
+        def one_pass(termeni):
+            matcher = server.PartyMatcher(termeni)
+            for record in records:
+                matcher.match(record.parti)
+
+        for count in term_counts:
+            termeni = [f"{surnames[i % len(surnames)]} {given[i // len(surnames)]}" for i in range(count)]
+            before = self.measure(f"{count} terms, substring scan per term (before)",
+                                  lambda: per_term(termeni), iterations=5)
+            after = self.measure(f"{count} terms, PartyMatcher one pass (after)",
+                                 lambda: one_pass(termeni), iterations=5)
+            print(f"    per case: {before['median_ms'] * 1000 / cases:.0f} µs -> "
+                  f"{after['median_ms'] * 1000 / cases:.0f} µs (after also ranks every matching party)")
+        print()
+
+    def bench_party_index(self, nume: str = "POPESCU ION", cases: int = 1000, iterations: int = 3):
+        """Index write preparation per response, then upstream vs local party-name search"""
+        print("== Party index: upstream vs local party-name search ==")
+
+        class DiscardingCollection:
+            async def bulk_write(self, operations, ordered=True):
+                pass
+
+        parser = server.SoapRecordParser("Dosar", server.DOSAR_FIELDS)
+        reply = parser.feed(synthetic_dosare_reply(cases)) + parser.close()
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)  # the Motor client binds to the current loop
+
+        def index_reply():
+            index = server.PartyIndex(DiscardingCollection())
+            loop.run_until_complete(index._index(reply))
+
+        self.measure(f"index {cases} cases x 6 parties (background, per response)", index_reply, iterations=10)
+        try:
+            loop.run_until_complete(asyncio.wait_for(server.db.command("ping"), 3))
+            results = server.soap_cautare_dosare(nume_parte=nume)
+        except Exception as e:
+            print(f"    MongoDB or portal not reachable, skipped: {e}\n")
+            loop.close()
+            return
+        loop.run_until_complete(server.party_index.ensure_indexes())
+        loop.run_until_complete(server.party_index._index(results))
+        before = self.measure(f"'{nume}' upstream CautareDosare (before)",
+                              lambda: server.soap_cautare_dosare(nume_parte=nume), iterations)
+        after = self.measure(f"'{nume}' local parti_index (after)",
+                             lambda: loop.run_until_complete(server.party_index.search(nume, 500)), iterations * 10)
+        loop.close()
+        print(f"    {len(results)} cases: {before['median_ms']:.0f} ms -> {after['median_ms']:.1f} ms "
+              f"(refresh from upstream runs in the background)\n")
+
+    def run_all(self) -> List[Dict[str, Any]]:
+        self.bench_soap_client_setup()
+        self.bench_response_parsing()
+        self.bench_court_routing()
+        self.bench_json_serialization()
+        self.bench_dosar_views()
+        self.bench_diacritics()
+        self.bench_institution_lookup()
+        self.bench_party_matching()
+        self.bench_party_index()
+        return self.results
+
+
+def main():
+    benchmark = PortalDosareBenchmark()
+    benchmark.run_all()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
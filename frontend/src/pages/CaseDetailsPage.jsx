@@ -144,6 +144,13 @@ const CaseDetailsPage = () => {
                             <div>
                                 <h1 className="text-2xl font-bold font-mono">{data.detalii.numar_dosar}</h1>
                                 <p className="text-muted-foreground">{data.detalii.instanta}</p>
+                                {data.sursa === 'local' && data.vechime_secunde >= 60 && (
+                                    <p className="text-xs text-muted-foreground" data-testid="case-freshness">
+                                        Date actualizate acum {Math.round(data.vechime_secunde / 60)} min
+                                        {data.reimprospatare && ' · se verifică portalul'}
+                                        {data.degraded && ' · portalul nu răspunde'}
+                                    </p>
+                                )}
                             </div>
                             <Button onClick={addToMonitoring} data-testid="monitor-btn">
                                 <Plus className="mr-2 h-4 w-4" />
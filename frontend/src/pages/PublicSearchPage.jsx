@@ -13,7 +13,26 @@ import {
 import { toast } from 'sonner';
 import axios from 'axios';
 
-const API_URL = `${process.env.REACT_APP_BACKEND_URL}/api`;
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API_URL = `${BACKEND_URL}/api`;
+
+// XLSX exports above this many rows run as a background job on the server
+const XLSX_JOB_ROWS = 5000;
+const EXPORT_POLL_MS = 2000;
+
+const downloadExportJob = async (job) => {
+    if (job.error) {
+        throw new Error(job.error);
+    }
+    while (job.status !== 'done') {
+        if (job.status === 'failed') {
+            throw new Error(job.error || 'Export eșuat');
+        }
+        await new Promise(resolve => setTimeout(resolve, EXPORT_POLL_MS));
+        job = (await axios.get(`${BACKEND_URL}${job.status_url}`)).data;
+    }
+    return axios.get(`${BACKEND_URL}${job.download_url}`, { responseType: 'blob' });
+};
 
 const TABLE_HEADERS = [
     { key: "termen_cautare", label: "Termen", width: "w-24" },
@@ -44,23 +63,23 @@ const PublicSearchPage = () => {
         total_pages: 1,
         page_size: 20
     });
+    // Stored search on the server: later pages and exports reuse its results
+    const [session, setSession] = useState({
+        terms: [],
+        search_id: null,
+        next_cursor: null,
+        prev_cursor: null
+    });
 
-    const handleSearch = async (page = 1) => {
-        const terms = searchText.split('\n').map(t => t.trim()).filter(t => t);
-        
-        if (terms.length === 0) {
-            toast.error('Introduceți cel puțin un termen de căutare');
-            return;
-        }
-
+    const runSearch = async (payload, terms, isNewSearch) => {
         setLoading(true);
         setRows([]);
 
         try {
             const response = await axios.post(`${API_URL}/dosare/search/universal`, {
                 termeni: terms,
-                page,
-                page_size: 20
+                page_size: 20,
+                ...payload
             });
             
             if (response.data.error) {
@@ -75,7 +94,16 @@ const PublicSearchPage = () => {
                 total_pages: response.data.total_pages,
                 page_size: response.data.page_size
             });
+            setSession({
+                terms,
+                search_id: response.data.search_id,
+                next_cursor: response.data.next_cursor,
+                prev_cursor: response.data.prev_cursor
+            });
             
+            if (!isNewSearch) {
+                return;
+            }
             if (response.data.total_count === 0) {
                 toast.info('Nu s-au găsit rezultate');
             } else {
@@ -88,6 +116,17 @@ const PublicSearchPage = () => {
         }
     };
 
+    const handleSearch = async () => {
+        const terms = searchText.split('\n').map(t => t.trim()).filter(t => t);
+        
+        if (terms.length === 0) {
+            toast.error('Introduceți cel puțin un termen de căutare');
+            return;
+        }
+
+        await runSearch({ page: 1 }, terms, true);
+    };
+
     const handleExport = async (format) => {
         const terms = searchText.split('\n').map(t => t.trim()).filter(t => t);
         
@@ -98,12 +137,23 @@ const PublicSearchPage = () => {
 
         setExporting(format);
 
+        // Export the displayed search from its stored results; other terms are searched anew
+        const sameSearch = session.search_id && session.terms.join('\n') === terms.join('\n');
+        const payload = sameSearch ? { search_id: session.search_id, termeni: terms } : { termeni: terms };
+
         try {
-            const response = await axios.post(
-                `${API_URL}/dosare/export/${format}`,
-                { termeni: terms, page: 1, page_size: 10000 },
-                { responseType: 'blob' }
-            );
+            let response;
+            if (format === 'xlsx' && sameSearch && pagination.total_count > XLSX_JOB_ROWS) {
+                // Large workbooks are built in the background: poll the job, then download the file
+                const job = await axios.post(`${API_URL}/dosare/export/xlsx`, { ...payload, fundal: true });
+                response = await downloadExportJob(job.data);
+            } else {
+                response = await axios.post(
+                    `${API_URL}/dosare/export/${format}`,
+                    payload,
+                    { responseType: 'blob' }
+                );
+            }
             
             const url = window.URL.createObjectURL(new Blob([response.data]));
             const link = document.createElement('a');
@@ -112,7 +162,7 @@ const PublicSearchPage = () => {
             const contentDisposition = response.headers['content-disposition'];
             let filename = `dosare_export.${format}`;
             if (contentDisposition) {
-                const match = contentDisposition.match(/filename=(.+)/);
+                const match = contentDisposition.match(/filename="?([^";]+)"?/);
                 if (match) filename = match[1];
             }
             
@@ -131,9 +181,17 @@ const PublicSearchPage = () => {
     };
 
     const goToPage = (newPage) => {
-        if (newPage >= 1 && newPage <= pagination.total_pages) {
-            handleSearch(newPage);
+        if (newPage < 1 || newPage > pagination.total_pages) {
+            return;
+        }
+        // The terms go along so an expired search is simply run again
+        let payload = { search_id: session.search_id, page: newPage };
+        if (newPage === pagination.page + 1 && session.next_cursor) {
+            payload = { cursor: session.next_cursor };
+        } else if (newPage === pagination.page - 1 && session.prev_cursor) {
+            payload = { cursor: session.prev_cursor };
         }
+        runSearch(payload, session.terms, false);
     };
 
     const addToMonitoring = async (numarDosar, instanta) => {
@@ -217,7 +275,7 @@ const PublicSearchPage = () => {
                         
                         <div className="flex flex-wrap gap-2 items-center">
                             <Button 
-                                onClick={() => handleSearch(1)}
+                                onClick={() => handleSearch()}
                                 disabled={loading}
                                 data-testid="search-btn"
                             >
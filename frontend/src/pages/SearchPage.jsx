@@ -109,8 +109,8 @@ const SearchPage = () => {
         const file = e.target.files[0];
         if (!file) return;
 
-        if (!file.name.endsWith('.csv')) {
-            toast.error('Fișierul trebuie să fie CSV');
+        if (!/\.(csv|txt|xlsx)$/i.test(file.name)) {
+            toast.error('Fișierul trebuie să fie CSV sau XLSX');
             return;
         }
 
@@ -339,11 +339,11 @@ const SearchPage = () => {
                             <div className="border-2 border-dashed border-border p-12 text-center">
                                 <Upload className="h-12 w-12 mx-auto text-muted-foreground mb-4" />
                                 <p className="text-muted-foreground mb-4">
-                                    Încarcă un fișier CSV cu numerele dosarelor (un număr pe linie)
+                                    Încarcă un fișier CSV sau XLSX cu numerele dosarelor (un număr pe linie)
                                 </p>
                                 <Input
                                     type="file"
-                                    accept=".csv"
+                                    accept=".csv,.txt,.xlsx"
                                     onChange={handleCSVUpload}
                                     className="max-w-xs mx-auto"
                                     disabled={loading}
@@ -0,0 +1,11 @@
+"""
+Shared setup for the backend tests: backend/server.py is importable as `server`
+and its module-level MongoDB client gets harmless settings (it connects lazily).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "portal_dosare_test")
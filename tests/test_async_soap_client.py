@@ -0,0 +1,30 @@
+"""
+The shared zeep AsyncClient is built once, off the event loop thread,
+even when many upstream calls ask for it at the same time.
+"""
+
+import asyncio
+import threading
+
+import server
+
+
+def test_client_built_once_in_executor(monkeypatch):
+    built = []
+
+    class FakeAsyncClient:
+        def __init__(self, wsdl, transport=None):
+            built.append(threading.current_thread())
+
+    monkeypatch.setattr(server, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(server, "_async_soap_client", None)
+    monkeypatch.setattr(server, "_soap_http_client", None)
+
+    async def build_concurrently():
+        clients = await asyncio.gather(*(server.get_async_soap_client() for _ in range(10)))
+        await server.close_async_soap_client()
+        return clients, threading.current_thread()
+
+    clients, loop_thread = asyncio.run(build_concurrently())
+    assert len(built) == 1 and built[0] is not loop_thread
+    assert all(client is clients[0] for client in clients)
@@ -0,0 +1,51 @@
+"""
+Case-number routing: a number without an institutie goes to the court coded
+in it; the national lookup still runs when that court has nothing or when the
+case was appealed, so the higher courts' records are not lost.
+"""
+
+import asyncio
+
+import server
+
+FIRST_INSTANCE = {"numar": "1234/3/2024", "institutie": "TribunalulBUCURESTI", "stadiuProcesual": "Fond"}
+APPEALED = {**FIRST_INSTANCE, "caiAtac": {"DosarCaleAtac": [{"tipCaleAtac": "Apel"}]}}
+APPEAL = {"numar": "1234/3/2024", "institutie": "CurteadeApelBUCURESTI", "stadiuProcesual": "Apel"}
+
+
+def routed_search(monkeypatch, registering_court_results):
+    calls = []
+
+    async def upstream(numar_dosar=None, institutie=None, cache_ttl=None):
+        calls.append(institutie)
+        return registering_court_results if institutie else [registering_court_results[0], APPEAL]
+
+    monkeypatch.setattr(server, "async_cautare_dosare", upstream)
+    monkeypatch.setattr(server, "court_router", server.CourtCodeRouter(None, server.COURT_CODES_SEED))
+    return asyncio.run(server.search_case_number(" 1234/3/2024 ")), calls
+
+
+def test_first_instance_case_stays_targeted(monkeypatch):
+    results, calls = routed_search(monkeypatch, [FIRST_INSTANCE])
+    assert results == [FIRST_INSTANCE]
+    assert calls == ["TribunalulBUCURESTI"]
+
+
+def test_appealed_case_also_searched_nationally(monkeypatch):
+    results, calls = routed_search(monkeypatch, [APPEALED])
+    assert calls == ["TribunalulBUCURESTI", None]
+    assert [dosar["institutie"] for dosar in results] == ["TribunalulBUCURESTI", "CurteadeApelBUCURESTI"]
+    assert server.court_router.stats()["appealed"] == 1
+
+
+def test_empty_targeted_result_falls_back(monkeypatch):
+    calls = []
+
+    async def upstream(numar_dosar=None, institutie=None, cache_ttl=None):
+        calls.append(institutie)
+        return [] if institutie else [APPEAL]
+
+    monkeypatch.setattr(server, "async_cautare_dosare", upstream)
+    monkeypatch.setattr(server, "court_router", server.CourtCodeRouter(None, server.COURT_CODES_SEED))
+    assert asyncio.run(server.search_case_number("1234/3/2024")) == [APPEAL]
+    assert calls == ["TribunalulBUCURESTI", None]
@@ -0,0 +1,61 @@
+"""
+Date-window sharding: truncated windows are bisected only within the
+per-search upstream call budget, and the first upstream failure cancels
+the windows still running.
+"""
+
+import asyncio
+
+import pytest
+
+import server
+
+
+def test_saturated_search_stays_within_budget(monkeypatch):
+    calls = []
+
+    async def saturated(numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop):
+        calls.append((data_start, data_stop))
+        return [{"numar": f"{len(calls)}-{i}", "institutie": "X"} for i in range(server.PORTAL_MAX_RESULTS)]
+
+    monkeypatch.setattr(server, "async_cautare_dosare", saturated)
+    monkeypatch.setattr(server, "DATE_SHARD_MAX_CALLS", 80)
+    results, stats = asyncio.run(server.search_date_sharded(
+        obiect_dosar="pretentii", data_start="2020-01-01", data_stop="2024-01-01"
+    ))
+    assert len(calls) == stats["windows"] <= 80
+    assert stats["budget_exhausted"] and not stats["complete"]
+    # a split window is replaced by its two halves
+    assert len(results) == (len(calls) - stats["splits"]) * server.PORTAL_MAX_RESULTS
+
+
+def test_small_windows_need_no_budget(monkeypatch):
+    async def few(*args):
+        return [{"numar": "1/3/2024", "institutie": "X"}]
+
+    monkeypatch.setattr(server, "async_cautare_dosare", few)
+    results, stats = asyncio.run(server.search_date_sharded(
+        obiect_dosar="pretentii", data_start="2024-01-01", data_stop="2024-06-01"
+    ))
+    assert len(results) == 1 and stats["complete"] and not stats["budget_exhausted"]
+
+
+def test_first_failure_cancels_other_windows(monkeypatch):
+    finished = []
+
+    async def one_fails(numar_dosar, obiect_dosar, nume_parte, institutie, data_start, data_stop):
+        if data_start == "2024-01-01":
+            raise server.UpstreamUnavailableError("jos")
+        await asyncio.sleep(0.2)
+        finished.append(data_start)
+        return []
+
+    monkeypatch.setattr(server, "async_cautare_dosare", one_fails)
+
+    async def scenario():
+        with pytest.raises(server.UpstreamUnavailableError):
+            await server.search_date_sharded(obiect_dosar="x", data_start="2024-01-01", data_stop="2024-12-31")
+        await asyncio.sleep(0.3)
+
+    asyncio.run(scenario())
+    assert finished == []
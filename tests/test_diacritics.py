@@ -0,0 +1,38 @@
+"""
+normalize_diacritics / normalize_diacritics_batch (translation table + memo) must
+agree with the reference NFD + combining-mark removal on every input.
+"""
+
+import pytest
+
+import server
+
+SAMPLES = [
+    "Iaşi", "IAȘI", "ştefan ţepeş", "Ștefan Țepeș", "ăâîșțĂÂÎȘȚ", "SC ȘTEFĂNESCU & FIII SRL",
+    "Zürich straße", "naïve café", "Ελληνικά ά", "Москва й", "ǅemal", "ﬁrma", "POPESCU ION", "",
+]
+
+
+def reference(text):
+    return server._strip_marks(text).upper() if text else ""
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_matches_reference(text):
+    assert server.normalize_diacritics(text) == reference(text)
+
+
+def test_romanian_spellings_collapse():
+    variants = ["ș ț Ș Ț", "ş ţ Ş Ţ", "s t S T"]
+    assert {server.normalize_diacritics(text) for text in variants} == {"S T S T"}
+
+
+def test_every_table_code_point():
+    text = "".join(chr(code) for code in server.DIACRITICS_TABLE)
+    assert server.normalize_diacritics(text) == reference(text)
+
+
+def test_batch_matches_single():
+    texts = SAMPLES + [None, "Iaşi", "a\x1fă"]
+    assert server.normalize_diacritics_batch(texts) == [server.normalize_diacritics(text) for text in texts]
+    assert server.normalize_diacritics_batch([]) == []
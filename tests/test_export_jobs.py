@@ -0,0 +1,47 @@
+"""
+ExportJobStore: a background XLSX export started on one worker is visible, with
+its download, from any other worker sharing the collection and EXPORT_JOB_DIR.
+"""
+
+import asyncio
+
+import server
+
+
+class MemoryCollection:
+    def __init__(self):
+        self.docs = {}
+
+    async def insert_one(self, doc):
+        self.docs[doc["_id"]] = dict(doc)
+
+    async def update_one(self, query, update):
+        self.docs[query["_id"]].update(update["$set"])
+
+    async def find_one(self, query):
+        return self.docs.get(query["_id"])
+
+
+def test_job_finished_on_one_worker_is_served_by_another(tmp_path, monkeypatch):
+    async def fake_write(target, session, request):
+        with open(target, "wb") as f:
+            f.write(b"xlsx")
+
+    monkeypatch.setattr(server, "write_xlsx_export", fake_write)
+    collection = MemoryCollection()
+    worker_a = server.ExportJobStore(collection, tmp_path, ttl=600)
+    worker_b = server.ExportJobStore(collection, tmp_path, ttl=600)
+    session = server.SearchSession("universal", "rows", [{"numar_dosar": "1/3/2024"}], {}, max_page_size=100)
+
+    async def scenario():
+        job = await worker_a.start(session, server.ExportRequest(fundal=True))
+        pending = server.export_job_response(await worker_b.get(job["_id"]))
+        await asyncio.gather(*server._background_tasks)
+        return pending, await worker_b.get(job["_id"])
+
+    pending, done = asyncio.run(scenario())
+    assert pending["status"] == "pending" and pending["download_url"] is None
+    assert server.export_job_response(done)["download_url"].endswith(f"/{done['_id']}/download")
+    assert worker_b.path(done).read_bytes() == b"xlsx"
+    assert worker_a.stats() == {"running": 0, "done": 1, "failed": 0}
+    assert asyncio.run(worker_b.get("unknown")) is None
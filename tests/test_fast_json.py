@@ -0,0 +1,80 @@
+"""
+The /api/dosare routes render with FastJSONResponse (orjson) instead of
+jsonable_encoder + json: the JSON they produce must not change, and the rows
+must match the documented response models.
+"""
+
+import json
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import server
+
+DOSAR = {
+    "numar": "1234/3/2024",
+    "numarVechi": None,
+    "data": datetime(2024, 1, 15),
+    "institutie": "TribunalulBUCURESTI",
+    "departament": "Secţia a VI-a civilă",
+    "categorieCaz": "Civil",
+    "stadiuProcesual": "Fond",
+    "obiect": "pretenţii",
+    "parti": [
+        {"nume": "POPESCU ION", "calitateParte": "Reclamant"},
+        {"nume": "SC ȘTEFĂNESCU & FIII SRL", "calitateParte": "Pârât"},
+    ],
+    "sedinte": [
+        {"complet": "C1", "data": datetime(2024, 3, 1), "ora": "09:00", "solutie": "Amână", "solutieSumar": None},
+        {"complet": "C1", "data": datetime(2024, 5, 10), "ora": "10:00", "solutie": "Admite", "solutieSumar": "admite"},
+    ],
+    "caiAtac": [
+        {"dataDeclarare": datetime(2024, 6, 1, 12, 15, 30, tzinfo=timezone.utc),
+         "parteDeclaratoare": "POPESCU ION", "tipCaleAtac": "Apel"},
+    ],
+}
+
+
+def default_json(payload):
+    return json.loads(JSONResponse(jsonable_encoder(payload)).body)
+
+
+def test_fast_json_matches_default_rendering():
+    payload = {
+        "results": [server.process_dosar(DOSAR)],
+        "rows": [server.process_dosar_to_row(DOSAR, "popescu", "Nume parte")],
+        "raw": [DOSAR],
+        "total_count": 1,
+        "search_id": None,
+        "degraded": False,
+        "timings": [{"termen": "popescu", "latency_ms": 12.5}],
+    }
+    assert json.loads(server.FastJSONResponse(payload).body) == default_json(payload)
+
+
+def test_rows_match_response_models():
+    row = server.process_dosar_to_row(DOSAR, "popescu", "Nume parte")
+    assert server.SearchResultRow(**row).model_dump() == row
+    processed = server.process_dosar(DOSAR)
+    assert server.DosarResult(**processed).model_dump(exclude={"searched_number"}) == processed
+
+
+def test_dosare_routes_use_fast_json():
+    routes = [route for route in server.app.routes if getattr(route, "path", "").startswith("/api/dosare/")]
+    assert routes
+    assert all(isinstance(route, server.DosareRoute) for route in routes)
+
+
+def test_ndjson_lines_encode_like_responses():
+    payload = {"type": "term", "rows": [server.process_dosar_to_row(DOSAR, "popescu", "Nume parte")], "raw": DOSAR}
+    line = server.ndjson_line(payload)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == json.loads(server.FastJSONResponse(payload).body)
+
+
+def test_sse_events_encode_like_responses():
+    payload = {"type": "court", "institutie": "TribunalulBUCURESTI", "results": [server.process_dosar(DOSAR)]}
+    event, data, blank = server.sse_event(payload).split(b"\n", 2)
+    assert event == b"event: court" and blank == b"\n"
+    assert json.loads(data[len(b"data: "):]) == json.loads(server.FastJSONResponse(payload).body)
@@ -0,0 +1,57 @@
+"""
+InstitutionIndex: exact, word-prefix and typo-tolerant institution lookups.
+"""
+
+import pytest
+
+import server
+
+
+@pytest.mark.parametrize("query, key", [
+    ("TribunalulBUCURESTI", "TribunalulBUCURESTI"),
+    ("tribunalul bucureşti", "TribunalulBUCURESTI"),
+    ("Judecătoria Sectorul 3 București", "JudecatoriaSECTORUL3BUCURESTI"),
+    ("sector 3", "JudecatoriaSECTORUL3BUCURESTI"),
+    ("Sect. 3", "JudecatoriaSECTORUL3BUCURESTI"),
+    ("SECTOR3", "JudecatoriaSECTORUL3BUCURESTI"),
+    ("jud sectorul 6", "JudecatoriaSECTORUL6BUCURESTI"),
+    ("buftea", "JudecatoriaBUFTEA"),
+    ("Judecatoria Bufta", "JudecatoriaBUFTEA"),
+    ("ca cluj", "CurteadeApelCLUJ"),
+    ("Curtea de Apel Constanta", "CurteadeApelCONSTANTA"),
+])
+def test_resolve(query, key):
+    assert server.institution_index.resolve(query) == key
+
+
+@pytest.mark.parametrize("query", ["J", "Tribunalul", "Iasi", "CA", "Curtea de Apel", "sector"])
+def test_ambiguous_names_are_passed_through(query):
+    assert server.institution_index.resolve(query) is None
+    assert server.resolve_institutie(query) == query
+    assert len(server.institution_index.suggest(query)) > 1
+
+
+def test_misspelling_resolved_only_when_clearly_closest():
+    assert server.institution_index.resolve("Judecatoria Iasy") == "JudecatoriaIASI"
+    assert server.institution_index.resolve("Tribunalul Bucurestii") == "TribunalulBUCURESTI"
+
+
+def test_unknown_names_are_not_resolved():
+    assert server.institution_index.resolve("xyzzy") is None
+    assert server.institution_index.suggest("") == []
+    assert server.resolve_institutie("xyzzy") == "xyzzy"
+    assert server.resolve_institutie(None) is None
+
+
+def test_suggest_prefix_order_and_limit():
+    suggestions = server.institution_index.suggest("jud", limit=5)
+    assert len(suggestions) == 5
+    assert all(item["key"].startswith("Judecatoria") and item["scor"] == 1.0 for item in suggestions)
+    keys = [item["key"] for item in server.institution_index.suggest("iasi")]
+    assert {"TribunalulIASI", "JudecatoriaIASI", "CurteadeApelIASI"} <= set(keys)
+
+
+def test_every_institution_resolves_to_itself():
+    for key, name in server.INSTITUTII_MAP.items():
+        assert server.institution_index.resolve(name) == key
+        assert server.institution_index.resolve(key) == key
@@ -0,0 +1,111 @@
+"""
+Monitoring: change detection on SOAP snapshots, the jittered schedule of the
+background polling of monitored cases, and empty answers kept from erasing the
+stored snapshot.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import server
+
+
+def snapshot(sedinte: int, cai_atac: int = 0) -> dict:
+    return {
+        "numar": "1/3/2024",
+        "sedinte": {"DosarSedinta": [{"data": f"2024-0{i + 1}-01T00:00:00"} for i in range(sedinte)]},
+        "caiAtac": {"DosarCaleAtac": [{"tipCaleAtac": "Apel"} for _ in range(cai_atac)]},
+    }
+
+
+def test_new_hearing_or_appeal_is_a_change():
+    assert server.check_case_changes(snapshot(1), snapshot(2))
+    assert server.check_case_changes(snapshot(2), snapshot(2, cai_atac=1))
+    assert not server.check_case_changes(snapshot(2, 1), snapshot(2, 1))
+
+
+def test_plain_list_snapshots():
+    old, new = snapshot(1), snapshot(3)
+    old["sedinte"], new["sedinte"] = old["sedinte"]["DosarSedinta"], new["sedinte"]["DosarSedinta"]
+    assert server.check_case_changes(old, new)
+
+
+def test_next_check_is_jittered_within_bounds():
+    delay = 1000
+    offsets = []
+    for _ in range(200):
+        before = datetime.now(timezone.utc)
+        offsets.append((server.monitor_next_check(delay) - before).total_seconds())
+    low, high = delay * (1 - server.MONITOR_JITTER), delay * (1 + server.MONITOR_JITTER)
+    assert all(low - 1 <= offset <= high + 1 for offset in offsets)
+    assert len({round(offset) for offset in offsets}) > 1
+
+
+class RecordingCollection:
+    def __init__(self, *docs):
+        self.docs = list(docs)
+        self.updates = []
+        self.queries = []
+
+    async def find_one(self, query, projection=None):
+        return next((dict(doc) for doc in self.docs if all(doc.get(k) == v for k, v in query.items())), None)
+
+    async def update_one(self, query, update):
+        self.updates.append(update)
+
+    async def update_many(self, query, update):
+        self.queries.append(query)
+
+
+CASE = {"id": "c1", "user_id": "u1", "numar_dosar": "1/3/2024", "institutie": "TribunalulBUCURESTI",
+        "last_snapshot": snapshot(2), "failures": 1}
+
+
+@pytest.fixture
+def empty_answer(monkeypatch):
+    async def no_cases(**params):
+        return []
+
+    monitored_cases = RecordingCollection(CASE)
+    monkeypatch.setattr(server, "async_cautare_dosare", no_cases)
+    monkeypatch.setattr(server, "db", SimpleNamespace(monitored_cases=monitored_cases))
+    return monitored_cases
+
+
+def test_empty_answer_keeps_the_snapshot(empty_answer):
+    with pytest.raises(server.EmptySnapshotError):
+        asyncio.run(server.refresh_monitored_snapshot(dict(CASE)))
+    assert empty_answer.updates == []
+    # The portal answered: not an upstream failure that would mark results as degraded
+    assert not issubclass(server.EmptySnapshotError, server.UpstreamUnavailableError)
+
+
+def test_manual_refresh_of_an_empty_answer_reports_no_changes(empty_answer):
+    response = asyncio.run(server.refresh_monitored_case("c1", {"id": "u1"}))
+    assert response["has_changes"] is False
+    assert response["data"]["numar"] == "1/3/2024"
+    assert empty_answer.updates == []
+
+
+def test_empty_answer_is_a_failed_check_with_backoff(empty_answer):
+    scheduler_collection = RecordingCollection()
+    scheduler = server.MonitoringScheduler(scheduler_collection, concurrency=1, lease=60)
+    before = datetime.now(timezone.utc)
+    asyncio.run(scheduler._check(dict(CASE)))
+    (update,) = scheduler_collection.updates
+    release = update["$set"]
+    assert release["failures"] == 2
+    assert "last_snapshot" not in release and "ultima versiune" in release["last_error"]
+    backoff = server.MONITOR_BACKOFF_BASE * 2
+    assert (release["next_check_at"] - before).total_seconds() >= backoff * (1 - server.MONITOR_JITTER) - 1
+    assert scheduler.stats()["failures"] == 1
+
+
+def test_only_active_cases_are_scheduled():
+    collection = RecordingCollection()
+    asyncio.run(server.MonitoringScheduler(collection, concurrency=1, lease=60)._schedule_unscheduled())
+    (query,) = collection.queries
+    assert query["is_active"] is True
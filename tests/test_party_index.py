@@ -0,0 +1,48 @@
+"""
+PartyIndex: every case of a CautareDosare response becomes one upsert per party,
+keyed by case + normalized name, and a case is rewritten at most once per
+PARTY_INDEX_REINDEX seconds.
+"""
+
+import asyncio
+
+import server
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.batches = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.batches.append(operations)
+
+
+def dosar(numar, *parti):
+    return {
+        "numar": numar, "institutie": "TribunalulCLUJ", "data": "2024-03-01T00:00:00", "obiect": "pretenţii",
+        "parti": {"DosarParte": [{"nume": nume, "calitateParte": "Pârât"} for nume in parti]},
+    }
+
+
+def test_one_upsert_per_party():
+    collection = RecordingCollection()
+    index = server.PartyIndex(collection)
+    asyncio.run(index._index([dosar("1/117/2024", "Ştefănescu Maria", "SC BANCA SA"), dosar("2/117/2024")]))
+    (batch,) = collection.batches
+    assert len(batch) == 2
+    update = batch[0]._doc["$set"]
+    assert update["dosar"] == "1/117/2024|TribunalulCLUJ"
+    assert update["cuvinte"] == "STEFANESCU MARIA"
+    assert update["tokens"] == ["MARIA", "STEFANESCU"]
+    assert update["data"] == "2024-03-01"
+    assert batch[0]._upsert and batch[0]._filter != batch[1]._filter
+
+
+def test_case_rewritten_at_most_once_per_interval():
+    collection = RecordingCollection()
+    index = server.PartyIndex(collection)
+    asyncio.run(index._index([dosar("3/117/2024", "POPESCU ION")]))
+    asyncio.run(index._index([dosar("3/117/2024", "POPESCU ION"), dosar("4/117/2024", "POPESCU ION")]))
+    assert [len(batch) for batch in collection.batches] == [1, 1]
+    assert collection.batches[1][0]._doc["$set"]["numar"] == "4/117/2024"
+    assert index.stats()["cases_indexed"] == 2
@@ -0,0 +1,41 @@
+"""
+PartyMatcher: every searched name is matched against a case's parties in one pass,
+with match quality (exact / token_subset / substring) and the best match first.
+"""
+
+import server
+
+PARTI = [
+    server.ParteRecord("POPESCU ION VASILE", "Pârât"),
+    server.ParteRecord("ION POPESCU", "Reclamant"),
+    server.ParteRecord("SC POPESCUL-ION SRL", "Intimat"),
+    server.ParteRecord("Ştefănescu Maria", "Intervenient"),
+]
+
+
+def ranked(matches, term):
+    return [(server.MATCH_QUALITY_NAMES[quality], parte.nume) for quality, parte in matches.get(term, [])]
+
+
+def test_qualities_and_ranking():
+    matches = server.PartyMatcher(["popescu ion", "Maria Stefanescu", "popescul", "necunoscut"]).match(PARTI)
+    assert ranked(matches, "popescu ion") == [("exact", "ION POPESCU"), ("token_subset", "POPESCU ION VASILE")]
+    assert ranked(matches, "Maria Stefanescu") == [("exact", "Ştefănescu Maria")]
+    assert ranked(matches, "popescul") == [("token_subset", "SC POPESCUL-ION SRL")]
+    assert "necunoscut" not in matches
+
+
+def test_substring_matches_rank_last():
+    matches = server.PartyMatcher(["popesc"]).match(PARTI)
+    assert [quality for quality, _ in matches["popesc"]] == [server.MATCH_SUBSTRING] * 3
+
+
+def test_row_shows_best_match():
+    dosar = {
+        "numar": "1/3/2024",
+        "parti": {"DosarParte": [{"nume": parte.nume, "calitateParte": parte.calitate} for parte in PARTI]},
+    }
+    row = server.process_dosar_to_row(dosar, "Popescu Ion", "Nume parte")
+    assert (row["nume_parte"], row["calitate_parte"], row["potrivire"]) == ("ION POPESCU", "Reclamant", "exact")
+    assert [p["nume"] for p in row["parti_potrivite"]] == ["ION POPESCU", "POPESCU ION VASILE"]
+    assert server.SearchResultRow(**row).model_dump() == row
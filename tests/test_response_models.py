@@ -0,0 +1,93 @@
+"""
+DosareRoute skips response_model validation, so the declared models are checked
+here against real /api/dosare responses: every response must validate, and rows,
+cases and details must carry exactly the fields their models declare.
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+DOSAR = {
+    "numar": "1234/3/2024",
+    "numarVechi": None,
+    "data": datetime(2024, 1, 15),
+    "institutie": "TribunalulBUCURESTI",
+    "departament": "Secţia a VI-a civilă",
+    "categorieCaz": "Civil",
+    "stadiuProcesual": "Fond",
+    "obiect": "pretenţii",
+    "parti": {"DosarParte": [{"nume": "POPESCU ION", "calitateParte": "Reclamant"}]},
+    "sedinte": {"DosarSedinta": [{"complet": "C1", "data": datetime(2024, 3, 1), "ora": "09:00",
+                                  "solutie": "Amână", "solutieSumar": None}]},
+    "caiAtac": {"DosarCaleAtac": [{"dataDeclarare": datetime(2024, 6, 1), "parteDeclaratoare": "POPESCU ION",
+                                   "tipCaleAtac": "Apel"}]},
+}
+
+
+class NullCollection:
+    async def insert_one(self, doc):
+        pass
+
+    async def insert_many(self, docs):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def cautare_dosare(**params):
+        return [DOSAR]
+
+    monkeypatch.setattr(server, "async_cautare_dosare", cautare_dosare)
+    monkeypatch.setattr(server, "DOSAR_MIRROR", False)
+    monkeypatch.setattr(server, "PARTY_INDEX", False)
+    monkeypatch.setattr(server, "search_sessions", server.SearchSessionStore(
+        NullCollection(), NullCollection(), ttl=600, max_sessions=10, max_rows=1000
+    ))
+    monkeypatch.setattr(server.court_router, "learn", lambda numar, results: None)
+    return TestClient(server.app)
+
+
+def response_model(path: str):
+    return next(route.response_model for route in server.app.routes if getattr(route, "path", "") == path)
+
+
+def post(client, path: str, payload: dict) -> dict:
+    response = client.post(path, json=payload)
+    assert response.status_code == 200
+    body = response.json()
+    assert "error" not in body
+    response_model(path).model_validate(body)
+    return body
+
+
+def assert_fields(model, item: dict, allowed_extra=()):
+    assert set(model.model_fields) - set(allowed_extra) <= set(item) <= set(model.model_fields) | set(allowed_extra)
+
+
+def test_universal_search_rows(client):
+    body = post(client, "/api/dosare/search/universal", {"termeni": ["1234/3/2024", "POPESCU ION"]})
+    assert body["rows"]
+    for row in body["rows"]:
+        assert_fields(server.SearchResultRow, row)
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/api/dosare/search", {"numar_dosar": "1234/3/2024"}),
+    ("/api/dosare/search/bulk", {"numere_dosare": ["1234/3/2024"]}),
+])
+def test_case_search_results(client, path, payload):
+    body = post(client, path, payload)
+    assert body["results"]
+    for result in body["results"]:
+        # searched_number is only set by the bulk and CSV searches
+        assert_fields(server.DosarResult, result, allowed_extra={"searched_number"})
+
+
+def test_case_details(client):
+    body = post(client, "/api/dosare/detalii", {"numar_dosar": "1234/3/2024", "institutie": "TribunalulBUCURESTI"})
+    assert body["found"]
+    assert set(body) <= set(server.CaseDetailsResponse.model_fields)
@@ -0,0 +1,93 @@
+"""
+SearchJobRunner: the lease is kept alive while a slow term is searched, and terms
+failing while the circuit is open are requeued without spending their attempts.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import server
+
+
+class Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction):
+        return self
+
+    async def to_list(self, length):
+        return self.docs
+
+
+class MemoryCollection:
+    def __init__(self, *docs):
+        self.docs = [dict(doc) for doc in docs]
+        self.updates = []
+
+    def find(self, query):
+        return Cursor([doc for doc in self.docs if all(doc.get(k) == v for k, v in query.items())])
+
+    async def update_one(self, query, update):
+        self.updates.append(update)
+        matched = [doc for doc in self.docs if all(doc.get(k) == v for k, v in query.items())]
+        for doc in matched:
+            doc.update(update.get("$set", {}))
+            for key, amount in update.get("$inc", {}).items():
+                doc[key] = doc.get(key, 0) + amount
+        return SimpleNamespace(matched_count=len(matched), modified_count=len(matched))
+
+
+def runner_for(job, item, lease=60):
+    jobs = MemoryCollection(job)
+    items = MemoryCollection(item)
+    runner = server.SearchJobRunner(jobs, items, concurrency=1, max_active=1, lease=lease)
+    runner.owner = "worker"
+    return runner, jobs, items
+
+
+JOB = {"_id": "job", "tip": "universal", "status": "running", "owner": "worker", "institutie": None}
+ITEM = {"_id": "item", "job_id": "job", "index": 0, "term": "1/3/2024", "status": "pending"}
+
+
+def test_lease_renewed_while_a_term_is_slow(monkeypatch):
+    runner, jobs, items = runner_for(JOB, ITEM, lease=0.15)
+
+    async def slow_search(job, term):
+        await asyncio.sleep(0.2)
+        return []
+
+    monkeypatch.setattr(runner, "_search", slow_search)
+
+    async def scenario():
+        runner._semaphore = asyncio.Semaphore(1)
+        await runner._run(dict(JOB))
+
+    asyncio.run(scenario())
+    renewals = [update for update in jobs.updates if "lease_until" in update.get("$set", {})]
+    assert len(renewals) >= 2
+    assert items.docs[0]["status"] == "done"
+    assert jobs.docs[0]["status"] == "done"
+
+
+def test_terms_requeued_while_the_circuit_is_open(monkeypatch):
+    runner, jobs, items = runner_for(JOB, ITEM)
+    breaker = server.CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+    breaker.record(False)
+    monkeypatch.setattr(server, "upstream_breaker", breaker)
+    monkeypatch.setattr(server, "SEARCH_JOB_RETRY_DELAY", 0)
+
+    async def unavailable(job, term):
+        raise server.UpstreamUnavailableError("circuit open")
+
+    monkeypatch.setattr(runner, "_search", unavailable)
+
+    async def scenario():
+        runner._semaphore = asyncio.Semaphore(1)
+        for _ in range(server.SEARCH_JOB_MAX_ATTEMPTS + 1):
+            await runner._run_item(dict(JOB), items.docs[0])
+
+    asyncio.run(scenario())
+    assert items.docs[0]["status"] == "pending"
+    assert "attempts" not in items.docs[0]
+    assert runner.stats()["requeued"] == server.SEARCH_JOB_MAX_ATTEMPTS + 1
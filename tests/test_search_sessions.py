@@ -0,0 +1,148 @@
+"""
+SearchSessionStore: a session stored by one worker is served by another from
+the shared collections, rows and extra fields intact, until it expires; cursors
+that encode_cursor couldn't have produced are ignored.
+"""
+
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+
+
+class Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction):
+        self.docs.sort(key=lambda doc: doc[key], reverse=direction < 0)
+        return self
+
+    async def to_list(self, length):
+        return self.docs
+
+
+class MemoryCollection:
+    def __init__(self):
+        self.docs = []
+
+    @staticmethod
+    def matches(doc, query):
+        return all(doc.get(key) == value for key, value in query.items())
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def insert_many(self, docs):
+        self.docs.extend(dict(doc) for doc in docs)
+
+    async def find_one(self, query):
+        return next((doc for doc in self.docs if self.matches(doc, query)), None)
+
+    def find(self, query):
+        return Cursor([doc for doc in self.docs if self.matches(doc, query)])
+
+    async def update_one(self, query, update):
+        await self.update_many(query, update)
+
+    async def update_many(self, query, update):
+        for doc in self.docs:
+            if self.matches(doc, query):
+                doc.update(update["$set"])
+
+
+def two_workers():
+    sessions, rows = MemoryCollection(), MemoryCollection()
+
+    def store():
+        return server.SearchSessionStore(sessions, rows, ttl=600, max_sessions=10, max_rows=10_000)
+
+    return store(), store(), sessions
+
+
+def test_session_served_by_another_worker(monkeypatch):
+    monkeypatch.setattr(server, "SEARCH_SESSION_CHUNK_ROWS", 3)
+    worker_a, worker_b, _ = two_workers()
+    rows = [{"numar_dosar": f"{i}/3/2024", "termen_cautare": "ION.POPESCU"} for i in range(8)]
+    extra = {"timings": {"ION.POPESCU": 12.5}, "degraded": False}
+
+    async def scenario():
+        stored = worker_a.create("universal", "rows", rows, extra, max_page_size=100)
+        await asyncio.gather(*server._background_tasks)
+        assert await worker_b.get(stored.id, "dosare") is None
+        loaded = await worker_b.get(stored.id, "universal")
+        return stored, loaded
+
+    stored, loaded = asyncio.run(scenario())
+    assert loaded.id == stored.id
+    assert loaded.rows == rows and loaded.extra == extra and loaded.max_page_size == 100
+    assert worker_b.stats()["shared_hits"] == 1 and worker_b.stats()["sessions"] == 1
+
+
+def test_expired_shared_session_is_not_served():
+    worker_a, worker_b, sessions = two_workers()
+
+    async def scenario():
+        stored = worker_a.create("universal", "rows", [{"numar_dosar": "1/3/2024"}], {}, max_page_size=100)
+        await asyncio.gather(*server._background_tasks)
+        sessions.docs[0]["expires_at"] = datetime.now(timezone.utc) - timedelta(seconds=1)
+        return await worker_b.get(stored.id, "universal")
+
+    assert asyncio.run(scenario()) is None
+
+
+def tampered(**fields) -> str:
+    state = {"s": "abc", "o": 20, "n": 20, "b": None, "d": False, "f": None, **fields}
+    return base64.urlsafe_b64encode(json.dumps(state).encode("utf-8")).decode("ascii")
+
+
+def test_valid_cursor_round_trips():
+    assert server.decode_cursor("not base64!") is None
+    assert server.decode_cursor(tampered(s=1)) is None
+    cursor = server.encode_cursor("abc", 20, 20, "data", True, "popescu")
+    assert server.decode_cursor(cursor) == {"s": "abc", "o": 20, "n": 20, "b": "data", "d": True, "f": "popescu"}
+
+
+@pytest.mark.parametrize("fields", [
+    {"n": "5"}, {"n": -1}, {"o": True}, {"o": None}, {"b": ["a"]}, {"f": 5}, {"d": "yes"},
+])
+def test_tampered_cursor_runs_the_search_again(fields, monkeypatch):
+    store, _, _ = two_workers()
+    session = server.SearchSession("universal", "rows", [{"numar_dosar": "1/3/2024"}], {}, max_page_size=100)
+    store._store(session)
+    monkeypatch.setattr(server, "search_sessions", store)
+    request = server.UniversalSearchRequest(termeni=["1/3/2024"], cursor=tampered(s=session.id, **fields))
+    assert server.decode_cursor(request.cursor) is None
+    assert asyncio.run(server.resume_search_session(request, "universal")) is None
+    untampered = server.UniversalSearchRequest(cursor=tampered(s=session.id, o=0))
+    assert asyncio.run(server.resume_search_session(untampered, "universal"))["total_count"] == 1
+
+
+def test_streamed_search_is_stored_in_input_order(monkeypatch):
+    store, _, _ = two_workers()
+    monkeypatch.setattr(server, "search_sessions", store)
+    delays = {"2/3/2024": 0.05, "1/3/2024": 0.0}
+
+    async def search_universal_term(term, cache_ttl):
+        await asyncio.sleep(delays[term])
+        return [{"numar": term, "institutie": "TribunalulBUCURESTI"}]
+
+    monkeypatch.setattr(server, "search_universal_term", search_universal_term)
+    # The repeated term finishes last, its rows still belong to its first position
+    request = server.UniversalSearchRequest(termeni=[" 2/3/2024", "1/3/2024", "2/3/2024 "])
+
+    async def scenario():
+        response = await server.universal_search_stream(request)
+        lines = [json.loads(line) async for line in response.body_iterator]
+        await asyncio.gather(*server._background_tasks)
+        regular, _ = await server.compute_universal_rows(request, 0)
+        return lines[-1], regular
+
+    summary, regular = asyncio.run(scenario())
+    stored = asyncio.run(store.get(summary["search_id"], "universal"))
+    assert [row["numar_dosar"] for row in stored.rows] == ["2/3/2024", "1/3/2024"]
+    assert stored.rows == regular
@@ -0,0 +1,109 @@
+"""
+SingleFlight: identical concurrent upstream calls share one task. A cancelled
+waiter only stops waiting, the leader's error reaches every waiter, and the key
+is freed once the call ends so the next caller retries. async_cautare_dosare
+fills the result cache once for all of them.
+"""
+
+import asyncio
+
+import pytest
+
+import server
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    async def scenario():
+        flights = server.SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def upstream():
+            calls.append(1)
+            await release.wait()
+            return ["dosar"]
+
+        first = asyncio.ensure_future(flights.do("k", upstream))
+        second = asyncio.ensure_future(flights.do("k", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == ["dosar"]
+        assert first.cancelled() and len(calls) == 1
+        assert flights.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 1}
+
+    asyncio.run(scenario())
+
+
+def test_error_reaches_every_waiter_and_frees_the_key():
+    async def scenario():
+        flights = server.SingleFlight()
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise server.UpstreamUnavailableError("jos")
+
+        results = await asyncio.gather(*(flights.do("k", failing) for _ in range(3)), return_exceptions=True)
+        assert len(calls) == 1
+        assert all(isinstance(result, server.UpstreamUnavailableError) for result in results)
+        assert flights.stats()["in_flight"] == 0
+
+        async def working():
+            calls.append(1)
+            return ["dosar"]
+
+        assert await flights.do("k", working) == ["dosar"]
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+class EmptyCollection:
+    async def find_one(self, query):
+        return None
+
+    async def replace_one(self, query, document, upsert=False):
+        pass
+
+
+def test_concurrent_searches_fill_the_cache_once(monkeypatch):
+    calls = []
+
+    async def fetch(*args):
+        calls.append(args)
+        await asyncio.sleep(0.01)
+        return [{"numar": "1/3/2024", "institutie": "TribunalulBUCURESTI"}]
+
+    monkeypatch.setattr(server, "fetch_cautare_dosare", fetch)
+    monkeypatch.setattr(server, "search_cache", server.SearchResultCache(EmptyCollection(), 10, 60))
+    monkeypatch.setattr(server, "upstream_flights", server.SingleFlight())
+    monkeypatch.setattr(server, "PARTY_INDEX", False)
+    monkeypatch.setattr(server, "DOSAR_MIRROR", False)
+
+    async def scenario():
+        results = await asyncio.gather(*(server.async_cautare_dosare(numar_dosar="1/3/2024") for _ in range(5)))
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+        assert results[0] is not results[1]  # every caller gets its own list
+        assert await server.async_cautare_dosare(numar_dosar=" 1/3/2024 ") == results[0]
+        assert len(calls) == 1 and server.search_cache.stats()["hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_search_is_not_cached(monkeypatch):
+    async def fetch(*args):
+        raise server.UpstreamUnavailableError("jos")
+
+    monkeypatch.setattr(server, "fetch_cautare_dosare", fetch)
+    monkeypatch.setattr(server, "search_cache", server.SearchResultCache(EmptyCollection(), 10, 60))
+
+    async def scenario():
+        with pytest.raises(server.UpstreamUnavailableError):
+            await server.async_cautare_dosare(numar_dosar="2/3/2024")
+        assert server.search_cache.stats()["entries"] == 0
+
+    asyncio.run(scenario())
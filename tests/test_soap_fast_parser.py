@@ -0,0 +1,187 @@
+"""
+Parity tests for the SOAP fast path (SOAP_FAST_PATH=1):
+envelopes built by hand must match zeep's, and the streaming lxml parser
+must return exactly what zeep + serialize_object returns for the same reply.
+"""
+
+from datetime import datetime
+
+import pytest
+import requests
+from lxml import etree
+from zeep import Client
+from zeep.exceptions import Fault
+
+import server
+
+ENVELOPE = """<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+               xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+               xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+<soap:Body>{body}</soap:Body>
+</soap:Envelope>"""
+
+DOSARE_REPLY = ENVELOPE.format(body="""
+<CautareDosareResponse xmlns="portalquery.just.ro"><CautareDosareResult>
+  <Dosar>
+    <parti>
+      <DosarParte><nume>POPESCU ION</nume><calitateParte>Reclamant</calitateParte></DosarParte>
+      <DosarParte><nume>SC ȘTEFĂNESCU &amp; FIII SRL</nume><calitateParte>Pârât</calitateParte></DosarParte>
+      <DosarParte xsi:nil="true"/>
+    </parti>
+    <sedinte>
+      <DosarSedinta>
+        <complet>C1</complet><data>2024-03-01T00:00:00</data><ora>09:00</ora>
+        <solutie>Amână pronunţarea</solutie><solutieSumar>amână</solutieSumar>
+        <dataPronuntare xsi:nil="true"/><documentSedinta xsi:nil="true"/><dataDocument xsi:nil="true"/>
+      </DosarSedinta>
+      <DosarSedinta>
+        <complet>C1</complet><data>2024-05-10T00:00:00</data><ora>10:00</ora>
+        <solutie>Admite</solutie><solutieSumar>admite cererea</solutieSumar>
+        <dataPronuntare>2024-05-10T00:00:00</dataPronuntare><documentSedinta>Hotarare</documentSedinta>
+        <numarDocument>123</numarDocument><dataDocument>2024-05-10T00:00:00</dataDocument>
+      </DosarSedinta>
+    </sedinte>
+    <caiAtac>
+      <DosarCaleAtac>
+        <dataDeclarare>2024-06-01T12:15:30.1234567+03:00</dataDeclarare>
+        <parteDeclaratoare>POPESCU ION</parteDeclaratoare><tipCaleAtac>Apel</tipCaleAtac>
+      </DosarCaleAtac>
+    </caiAtac>
+    <numar>1234/3/2024</numar><numarVechi></numarVechi><data>2024-01-15T00:00:00</data>
+    <institutie>TribunalulBUCURESTI</institutie><departament>Secţia a VI-a civilă</departament>
+    <categorieCaz>Civil</categorieCaz><stadiuProcesual>Fond</stadiuProcesual><obiect>pretenţii</obiect>
+  </Dosar>
+  <Dosar xsi:nil="true"/>
+  <Dosar>
+    <parti/>
+    <numar>99/299/2023</numar><data>2023-02-01T08:30:00</data>
+    <institutie>JudecatoriaSECTORUL1BUCURESTI</institutie>
+    <categorieCaz>Penal</categorieCaz><stadiuProcesual>Fond</stadiuProcesual><obiect>furt</obiect>
+  </Dosar>
+</CautareDosareResult></CautareDosareResponse>""")
+
+SEDINTE_REPLY = ENVELOPE.format(body="""
+<CautareSedinteResponse xmlns="portalquery.just.ro"><CautareSedinteResult>
+  <Sedinta>
+    <departament>Secţia civilă</departament><complet>C3</complet>
+    <data>2024-02-05T00:00:00</data><ora>09:30</ora>
+    <dosare>
+      <SedintaDosar>
+        <numar>10/3/2024</numar><numar_vechi></numar_vechi><data>2024-02-05T00:00:00</data>
+        <ora>09:30</ora><categorieCaz>Civil</categorieCaz><stadiuProcesual>Fond</stadiuProcesual>
+      </SedintaDosar>
+    </dosare>
+  </Sedinta>
+</CautareSedinteResult></CautareSedinteResponse>""")
+
+FAULT_REPLY = ENVELOPE.format(body="""
+<soap:Fault><faultcode>soap:Server</faultcode>
+<faultstring>Server was unable to process request.</faultstring></soap:Fault>""")
+
+
+@pytest.fixture(scope="module")
+def zeep_client():
+    return Client(str(server.SOAP_WSDL_LOCAL))
+
+
+def zeep_reply(zeep_client, operation, body, status_code=200):
+    """Run a raw reply through zeep's own response handling"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body.encode("utf-8")
+    response.headers["Content-Type"] = "text/xml; charset=utf-8"
+    response.encoding = "utf-8"
+    binding = zeep_client.service._binding
+    return binding.process_reply(zeep_client, binding._operations[operation], response)
+
+
+def fast_parse(body, record_tag, fields, chunk_size=None):
+    data = body.encode("utf-8")
+    chunk_size = chunk_size or len(data)
+    parser = server.SoapRecordParser(record_tag, fields)
+    records = []
+    for start in range(0, len(data), chunk_size):
+        records.extend(parser.feed(data[start:start + chunk_size]))
+    records.extend(parser.close())
+    return records, parser
+
+
+def plain(value):
+    """OrderedDict -> dict recursively, for comparisons"""
+    if isinstance(value, dict):
+        return {k: plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [plain(v) for v in value]
+    return value
+
+
+def envelope_items(envelope):
+    """(local name, text, nil) for every element in the operation body"""
+    root = etree.fromstring(envelope)
+    operation = root.find(f"{{{server.SOAP_ENV_NS}}}Body")[0]
+    return [
+        (etree.QName(el).localname, el.text or "", el.get(server.XSI_NIL))
+        for el in operation.iter()
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 7, 4096])
+def test_cautare_dosare_parity(zeep_client, chunk_size):
+    expected = server.dosare_result_to_list(zeep_reply(zeep_client, "CautareDosare", DOSARE_REPLY))
+    records, parser = fast_parse(DOSARE_REPLY, "Dosar", server.DOSAR_FIELDS, chunk_size)
+    assert parser.fault is None
+    assert records == plain(expected)
+    assert len(records) == 3
+
+
+def test_cautare_dosare_parity_after_processing(zeep_client):
+    expected = server.dosare_result_to_list(zeep_reply(zeep_client, "CautareDosare", DOSARE_REPLY))
+    records, _ = fast_parse(DOSARE_REPLY, "Dosar", server.DOSAR_FIELDS)
+    for zeep_dosar, fast_dosar in zip(expected, records):
+        assert server.process_dosar(fast_dosar) == server.process_dosar(zeep_dosar)
+        assert (server.process_dosar_to_row(fast_dosar, "popescu", "Nume parte")
+                == server.process_dosar_to_row(zeep_dosar, "popescu", "Nume parte"))
+
+
+def test_cautare_sedinte_parity(zeep_client):
+    expected = server.serialize_object(zeep_reply(zeep_client, "CautareSedinte", SEDINTE_REPLY))
+    records, _ = fast_parse(SEDINTE_REPLY, "Sedinta", server.SEDINTA_FIELDS, chunk_size=13)
+    assert records == plain(expected)
+
+
+def test_fault_is_reported(zeep_client):
+    with pytest.raises(Fault) as zeep_fault:
+        zeep_reply(zeep_client, "CautareDosare", FAULT_REPLY, status_code=500)
+    records, parser = fast_parse(FAULT_REPLY, "Dosar", server.DOSAR_FIELDS)
+    assert records == []
+    assert parser.fault == zeep_fault.value.message
+
+
+def test_truncated_reply_is_an_error():
+    parser = server.SoapRecordParser("Dosar", server.DOSAR_FIELDS)
+    parser.feed(DOSARE_REPLY.encode("utf-8")[:500])
+    with pytest.raises(etree.XMLSyntaxError):
+        parser.close()
+
+
+@pytest.mark.parametrize("params", [
+    {"numar_dosar": "1234/3/2024"},
+    {"nume_parte": "Ștefănescu & <Fiii>", "institutie": "TribunalulBUCURESTI"},
+    {"obiect_dosar": "pretenţii", "data_start": "2024-01-01", "data_stop": "2024-06-30"},
+])
+def test_cautare_dosare_envelope_parity(zeep_client, params):
+    expected = zeep_client.create_message(
+        zeep_client.service, "CautareDosare", **server.cautare_dosare_params(**params)
+    )
+    envelope = server.build_cautare_dosare_envelope(**params)
+    assert envelope_items(envelope) == envelope_items(etree.tostring(expected))
+
+
+def test_cautare_sedinte_envelope_parity(zeep_client):
+    expected = zeep_client.create_message(
+        zeep_client.service, "CautareSedinte",
+        dataSedinta=datetime(2024, 2, 5), institutie="TribunalulBUCURESTI"
+    )
+    envelope = server.build_cautare_sedinte_envelope("2024-02-05", "TribunalulBUCURESTI")
+    assert envelope_items(envelope) == envelope_items(etree.tostring(expected))
@@ -0,0 +1,122 @@
+"""
+Uploaded term lists: first column of CSV / TXT files decoded and parsed chunk by
+chunk (UTF-8, CRLF, quoted multi-line cells, cp1250 detected late), XLSX date
+cells rejected instead of guessed back into case numbers, and a parse error
+stopping the searches of an upload.
+"""
+
+import asyncio
+import io
+from datetime import datetime
+
+import openpyxl
+import pytest
+from starlette.datastructures import UploadFile
+
+import server
+
+
+def upload(content: bytes, filename: str = "numere.csv") -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename=filename)
+
+
+def first_column(content: bytes) -> list:
+    async def collect():
+        return [value async for value in server.iter_csv_first_column(upload(content))]
+
+    return asyncio.run(collect())
+
+
+def upload_numere(file: UploadFile) -> list:
+    async def collect():
+        return [numar async for numar in server.iter_upload_numere(file)]
+
+    return asyncio.run(collect())
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(server, "UPLOAD_READ_CHUNK_SIZE", 7)
+
+
+def test_utf8_with_bom_and_diacritics():
+    content = "﻿Număr;Parte\n1/3/2024;Ştefan\n2/3/2024;Țurcanu\n".encode("utf-8")
+    assert first_column(content) == ["Număr", "1/3/2024", "2/3/2024"]
+
+
+def test_crlf_line_endings_split_across_chunks(small_chunks):
+    content = b"".join(f"{i}/117/2024,x\r\n".encode("ascii") for i in range(1, 30))
+    assert first_column(content) == [f"{i}/117/2024" for i in range(1, 30)]
+
+
+def test_quoted_cell_spanning_lines(small_chunks):
+    # Past the 4096 characters used to sniff the delimiter, so the cell is parsed incrementally
+    head = b"".join(f"{i}/3/2024,x\n".encode("ascii") for i in range(1, 600))
+    content = head + b'600/3/2024,"pretentii\nsi daune"\n"601/3/2024",x\n'
+    assert first_column(content)[-3:] == ["599/3/2024", "600/3/2024", "601/3/2024"]
+
+
+def test_cp1250_detected_after_the_first_chunk(small_chunks):
+    content = b"1/3/2024\n" * 50 + "3/3/2024,Ştefănescu\n".encode("cp1250")
+    values = first_column(content)
+    assert values[:50] == ["1/3/2024"] * 50
+    assert values[-1] == "3/3/2024"
+
+
+def xlsx(*values) -> bytes:
+    workbook = openpyxl.Workbook()
+    for value in values:
+        workbook.active.append([value])
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def test_xlsx_text_cells_with_header_skipped():
+    content = xlsx("Număr dosar", "1/3/2024", "  2/3/2024 ")
+    assert upload_numere(upload(content, "numere.xlsx")) == ["1/3/2024", "2/3/2024"]
+
+
+def test_xlsx_date_cell_is_rejected():
+    content = xlsx("Număr dosar", "1/3/2024", datetime(2024, 3, 1))
+    with pytest.raises(ValueError, match="Rândul 3"):
+        upload_numere(upload(content, "numere.xlsx"))
+
+
+def test_stray_quote_does_not_hold_back_the_rest_of_the_file(small_chunks):
+    lines = ["1/3/2024,SC \"ALFA SRL"] + [f"{i}/3/2024,x" for i in range(2, 1000)]
+    assert first_column("\n".join(lines).encode("ascii")) == [f"{i}/3/2024" for i in range(1, 1000)]
+
+
+def test_parse_error_stops_the_searches(monkeypatch):
+    calls = []
+
+    async def search_case_number(numar, institutie=None):
+        calls.append(numar)
+        await asyncio.sleep(0.01)
+        return []
+
+    monkeypatch.setattr(server, "search_case_number", search_case_number)
+    # The date cell is in the second batch read from the sheet, after the first one was queued
+    content = xlsx(*[f"{i}/3/2024" for i in range(1, 700)], datetime(2024, 3, 1))
+
+    async def scenario():
+        response = await server.run_search_dosare_csv(upload(content, "numere.xlsx"))
+        calls_at_error = len(calls)
+        await asyncio.sleep(0.1)
+        return response, calls_at_error
+
+    response, calls_at_error = asyncio.run(scenario())
+    assert "Rândul 700" in response["error"]
+    assert len(calls) == calls_at_error < 100
+
+
+@pytest.mark.parametrize("tail, expected", [
+    ("Popaă,x\n3/3/2024", ["Popaă", "3/3/2024"]),  # held at the end of the chunk ending at offset 455
+    ("3/3/2024\nTudoră", ["3/3/2024", "Tudoră"]),  # held at the end of the file
+])
+def test_cp1250_bytes_held_by_the_utf8_decoder_are_kept(small_chunks, tail, expected):
+    # 0xE3 is "ă" in cp1250 and a UTF-8 lead byte, so the UTF-8 decoder holds it back
+    # waiting for the rest of the character before it finds out the file isn't UTF-8
+    content = b"1/3/2024\n" * 50 + tail.encode("cp1250")
+    assert first_column(content)[-2:] == expected
@@ -0,0 +1,126 @@
+"""
+AdaptiveConcurrencyLimiter (AIMD limit, shedding, headroom for background work)
+and CircuitBreaker (closed -> open -> half-open -> closed), driven by a fake clock.
+"""
+
+import asyncio
+
+import pytest
+
+import server
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def limiter(clock, initial=4, min_limit=1, max_limit=8, queue_timeout=0.05):
+    return server.AdaptiveConcurrencyLimiter(initial, min_limit, max_limit, latency_target=2.0,
+                                             queue_timeout=queue_timeout, clock=clock)
+
+
+def test_additive_increase_about_one_per_window():
+    async def scenario():
+        upstream = limiter(FakeClock())
+        for _ in range(4):
+            await upstream.acquire()
+            await upstream.release(0.1, True)
+        assert upstream.stats()["limit"] == 4 and upstream.limit > 4.9
+        await upstream.acquire()
+        await upstream.release(0.1, True)
+        assert upstream.stats()["limit"] == 5
+
+    asyncio.run(scenario())
+
+
+def test_multiplicative_decrease_once_per_interval():
+    async def scenario():
+        clock = FakeClock()
+        upstream = limiter(clock, initial=8)
+        await upstream.acquire()
+        await upstream.release(0.1, False)
+        assert upstream.limit == 4
+        await upstream.acquire()
+        await upstream.release(5.0, True)  # slow, but within the same interval
+        assert upstream.limit == 4
+        clock.now += 2.0
+        await upstream.acquire()
+        await upstream.release(5.0, True)
+        assert upstream.limit == 2
+        for _ in range(3):
+            clock.now += 2.0
+            await upstream.acquire()
+            await upstream.release(0.1, False)
+        assert upstream.limit == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_call_leaves_limit_alone():
+    async def scenario():
+        upstream = limiter(FakeClock())
+        await upstream.acquire()
+        await upstream.release(30.0, None)
+        assert upstream.limit == 4 and upstream.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_callers_over_the_limit_are_shed():
+    async def scenario():
+        upstream = limiter(FakeClock(), initial=1, max_limit=1)
+        await upstream.acquire()
+        with pytest.raises(server.UpstreamUnavailableError):
+            await upstream.acquire()
+        assert upstream.stats()["shed"] == 1 and upstream.waiting == 0
+
+    asyncio.run(scenario())
+
+
+def test_headroom_waits_for_interactive_calls():
+    async def scenario():
+        upstream = limiter(FakeClock(), initial=4)
+        for _ in range(3):
+            await upstream.acquire()
+        background = asyncio.ensure_future(upstream.wait_for_headroom(0.5))
+        await asyncio.sleep(0.01)
+        assert not background.done()  # 3 in flight, the share allows fewer than 2
+        await upstream.release(0.1, None)
+        await asyncio.sleep(0.01)
+        assert not background.done()
+        await upstream.release(0.1, None)
+        await asyncio.wait_for(background, 1)
+
+    asyncio.run(scenario())
+
+
+def test_breaker_transitions():
+    clock = FakeClock()
+    breaker = server.CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(False)
+    assert breaker.state == "closed"
+    breaker.record(True)
+    assert breaker.failures == 0
+    for _ in range(3):
+        breaker.record(False)
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow() and breaker.state == "half_open"
+    assert not breaker.allow()  # one probe at a time
+    breaker.record(False)
+    assert breaker.state == "open" and not breaker.allow()
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record(None)  # probe cancelled: another one may go
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "closed" and breaker.allow()
+    assert breaker.stats()["rejected"] == 3